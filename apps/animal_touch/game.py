@@ -7,7 +7,6 @@ AnimalTouchGame - 動物をタップすると鳴き声が聞こえるゲーム
 - カラフルで親しみやすいデザイン
 """
 
-import array
 import math
 import random
 from dataclasses import dataclass
@@ -16,10 +15,17 @@ from typing import Callable
 
 import pygame
 
+from shared import synth
+from shared.audio import init_audio
 from shared.base_game import BaseGame
 from shared.components import BackButton
 from shared.constants import BACKGROUND_CREAM, BABY_COLORS
 from shared.fonts import get_font
+from shared.scaled_surfaces import scaled_surface
+from shared.sfx import SfxRule, play_sfx
+from shared.sound_cache import disk_cached_sound
+from shared.sprite_baker import get_sprite_baker
+from shared.text_cache import render_text
 
 # アセットディレクトリのパス
 ASSETS_DIR = Path(__file__).parent / "assets"
@@ -29,6 +35,22 @@ SOUNDS_DIR = ASSETS_DIR / "sounds"
 # 対応する画像フォーマット
 SUPPORTED_IMAGE_FORMATS = [".png", ".jpg", ".jpeg", ".gif", ".bmp"]
 
+# 鳴き声（連打しても重なりすぎないようにする）
+ANIMAL_SFX = SfxRule(max_concurrent=2, min_interval=0.1)
+
+
+# フォールバック鳴き声の周波数（画像/音声キー → Hz）
+ANIMAL_SOUND_FREQS: dict[str, float] = {
+    "dog": 300,
+    "cat": 500,
+    "cow": 150,
+    "pig": 200,
+    "sheep": 400,
+    "chicken": 600,
+    "frog": 350,
+    "lion": 120,
+}
+
 
 @dataclass
 class Animal:
@@ -39,8 +61,9 @@ class Animal:
     image_key: str  # 画像/音声ファイルのキー（dog, cat, etc.）
     color: tuple[int, int, int]  # メインカラー（フォールバック描画用）
     secondary_color: tuple[int, int, int]  # サブカラー
-    draw_func: Callable[[pygame.Surface, int, int, int, float], None]  # フォールバック描画関数
+    draw_func: Callable[[pygame.Surface, int, int, int], None]  # フォールバック描画関数
     sound_freq: float  # フォールバック鳴き声の周波数
+    bounce_height: int  # 鳴いたときに跳ねる高さ（px。フォールバック描画用）
 
 
 class AnimalTouchGame(BaseGame):
@@ -50,6 +73,9 @@ class AnimalTouchGame(BaseGame):
     description = "動物をタップして鳴き声を聞こう！"
     icon_path = "assets/icon.png"
 
+    # アニメーション中以外は画面が変わらないため、変化があったときだけ描画する
+    use_dirty_rects = True
+
     def __init__(self, screen: pygame.Surface) -> None:
         super().__init__(screen)
 
@@ -106,7 +132,8 @@ class AnimalTouchGame(BaseGame):
                 color=(139, 90, 43),
                 secondary_color=(101, 67, 33),
                 draw_func=self._draw_dog,
-                sound_freq=300,
+                bounce_height=20,
+                sound_freq=ANIMAL_SOUND_FREQS["dog"],
             ),
             Animal(
                 name="ねこ",
@@ -115,7 +142,8 @@ class AnimalTouchGame(BaseGame):
                 color=(255, 165, 0),
                 secondary_color=(255, 200, 100),
                 draw_func=self._draw_cat,
-                sound_freq=500,
+                bounce_height=15,
+                sound_freq=ANIMAL_SOUND_FREQS["cat"],
             ),
             Animal(
                 name="うし",
@@ -124,7 +152,8 @@ class AnimalTouchGame(BaseGame):
                 color=(40, 40, 40),
                 secondary_color=(255, 255, 255),
                 draw_func=self._draw_cow,
-                sound_freq=150,
+                bounce_height=10,
+                sound_freq=ANIMAL_SOUND_FREQS["cow"],
             ),
             Animal(
                 name="ぶた",
@@ -133,7 +162,8 @@ class AnimalTouchGame(BaseGame):
                 color=(255, 182, 193),
                 secondary_color=(255, 150, 170),
                 draw_func=self._draw_pig,
-                sound_freq=200,
+                bounce_height=12,
+                sound_freq=ANIMAL_SOUND_FREQS["pig"],
             ),
             Animal(
                 name="ひつじ",
@@ -142,7 +172,8 @@ class AnimalTouchGame(BaseGame):
                 color=(245, 245, 245),
                 secondary_color=(200, 200, 200),
                 draw_func=self._draw_sheep,
-                sound_freq=400,
+                bounce_height=12,
+                sound_freq=ANIMAL_SOUND_FREQS["sheep"],
             ),
             Animal(
                 name="にわとり",
@@ -151,7 +182,8 @@ class AnimalTouchGame(BaseGame):
                 color=(255, 100, 50),
                 secondary_color=(255, 220, 100),
                 draw_func=self._draw_chicken,
-                sound_freq=600,
+                bounce_height=18,
+                sound_freq=ANIMAL_SOUND_FREQS["chicken"],
             ),
             Animal(
                 name="カエル",
@@ -160,7 +192,8 @@ class AnimalTouchGame(BaseGame):
                 color=(50, 205, 50),
                 secondary_color=(144, 238, 144),
                 draw_func=self._draw_frog,
-                sound_freq=350,
+                bounce_height=25,
+                sound_freq=ANIMAL_SOUND_FREQS["frog"],
             ),
             Animal(
                 name="ライオン",
@@ -169,7 +202,8 @@ class AnimalTouchGame(BaseGame):
                 color=(255, 180, 50),
                 secondary_color=(200, 120, 20),
                 draw_func=self._draw_lion,
-                sound_freq=120,
+                bounce_height=15,
+                sound_freq=ANIMAL_SOUND_FREQS["lion"],
             ),
         ]
 
@@ -207,16 +241,28 @@ class AnimalTouchGame(BaseGame):
             return
 
         for animal in self.animals:
-            sound_path = self._find_sound_file(animal.image_key)
-            if sound_path:
-                try:
-                    sound = pygame.mixer.Sound(str(sound_path))
-                    sound.set_volume(0.5)
-                    self.animal_sounds[animal.image_key] = sound
-                except pygame.error:
-                    pass
-
-    def _find_sound_file(self, sound_key: str) -> Path | None:
+            sound = self.cached_resource(
+                ("sound_file", animal.image_key),
+                lambda key=animal.image_key: self._load_sound_file(key),
+            )
+            if sound is not None:
+                self.animal_sounds[animal.image_key] = sound
+
+    @classmethod
+    def _load_sound_file(cls, sound_key: str) -> pygame.mixer.Sound | None:
+        """鳴き声の音声ファイルを読み込む（ファイルがなければ None）"""
+        sound_path = cls._find_sound_file(sound_key)
+        if sound_path is None:
+            return None
+        try:
+            sound = pygame.mixer.Sound(str(sound_path))
+            sound.set_volume(0.5)
+            return sound
+        except pygame.error:
+            return None
+
+    @staticmethod
+    def _find_sound_file(sound_key: str) -> Path | None:
         """音声ファイルを探す"""
         for ext in [".ogg", ".wav", ".mp3"]:
             path = SOUNDS_DIR / f"{sound_key}{ext}"
@@ -224,22 +270,27 @@ class AnimalTouchGame(BaseGame):
                 return path
         return None
 
-    def _create_animal_sound(self, freq: float) -> pygame.mixer.Sound:
+    @classmethod
+    def prewarm(cls) -> None:
+        """鳴き声（音声ファイルまたはフォールバック）を事前に用意する"""
+        for image_key, freq in ANIMAL_SOUND_FREQS.items():
+            if SOUNDS_DIR.exists():
+                cls.cached_resource(("sound_file", image_key), lambda: cls._load_sound_file(image_key))
+            cls._create_animal_sound(freq)
+
+    @classmethod
+    def _create_animal_sound(cls, freq: float) -> pygame.mixer.Sound:
+        """動物の鳴き声を取得する（フォールバック、生成済みなら共有キャッシュから）"""
+        return cls.cached_resource(("animal_sound", freq), lambda: cls._synthesize_animal_sound(freq))
+
+    @staticmethod
+    @disk_cached_sound
+    def _synthesize_animal_sound(freq: float) -> pygame.mixer.Sound:
         """動物の鳴き声を生成（フォールバック）"""
-        sample_rate = 22050
-        duration = 0.3
-        samples = int(sample_rate * duration)
-
-        sound_array = array.array("h")
-        for i in range(samples):
-            t = i / sample_rate
-            freq_mod = freq * (1 + 0.1 * math.sin(2 * math.pi * 5 * t))
-            amplitude = int(20000 * math.exp(-t * 3) * math.sin(2 * math.pi * freq_mod * t))
-            sound_array.append(amplitude)
-
-        sound = pygame.mixer.Sound(buffer=sound_array)
-        sound.set_volume(0.4)
-        return sound
+        t = synth.timeline(0.3)
+        # 周波数を揺らして鳴き声らしくする
+        wave = synth.tone(synth.vibrato(freq, 5, 0.1, t), t) * synth.exp_decay(3, t)
+        return synth.to_sound(wave, amplitude=20000, volume=0.4)
 
     def _draw_animal_image(
         self, screen: pygame.Surface, image: pygame.Surface, cx: int, cy: int, size: int, bounce: float
@@ -261,7 +312,7 @@ class AnimalTouchGame(BaseGame):
             new_height = size
             new_width = int(size * aspect)
 
-        scaled_image = pygame.transform.smoothscale(image, (new_width, new_height))
+        scaled_image = scaled_surface(image, (new_width, new_height), smooth=True)
 
         # 中央に配置
         x = cx - new_width // 2
@@ -269,15 +320,23 @@ class AnimalTouchGame(BaseGame):
 
         screen.blit(scaled_image, (x, y))
 
+    def _draw_animal_primitive(self, animal: Animal, cx: int, cy: int, size: int, bounce: float) -> None:
+        """フォールバック描画の動物を貼る（大きさごとに1回だけ焼き付ける）"""
+        y_offset = int(bounce * animal.bounce_height)
+        get_sprite_baker().draw(
+            self.screen,
+            ("animal_touch", animal.image_key, size),
+            (cx, cy - y_offset),
+            lambda surface, x, y: animal.draw_func(surface, x, y, size),
+            (size * 2, size * 2),
+        )
+
     # ========== 動物の描画関数（フォールバック） ==========
 
     def _draw_dog(
-        self, screen: pygame.Surface, cx: int, cy: int, size: int, bounce: float
+        self, screen: pygame.Surface, cx: int, cy: int, size: int
     ) -> None:
         """犬を描画"""
-        y_offset = int(bounce * 20)
-        cy -= y_offset
-
         body_rect = pygame.Rect(cx - size // 2, cy - size // 4, size, size // 2)
         pygame.draw.ellipse(screen, (139, 90, 43), body_rect)
 
@@ -305,12 +364,9 @@ class AnimalTouchGame(BaseGame):
         pygame.draw.lines(screen, (101, 67, 33), False, tail_points, 8)
 
     def _draw_cat(
-        self, screen: pygame.Surface, cx: int, cy: int, size: int, bounce: float
+        self, screen: pygame.Surface, cx: int, cy: int, size: int
     ) -> None:
         """猫を描画"""
-        y_offset = int(bounce * 15)
-        cy -= y_offset
-
         color = (255, 165, 0)
 
         body_rect = pygame.Rect(cx - size // 3, cy - size // 6, size * 2 // 3, size // 3)
@@ -364,12 +420,9 @@ class AnimalTouchGame(BaseGame):
         pygame.draw.line(screen, (100, 100, 100), (head_pos[0] + head_size // 6, whisker_y), (head_pos[0] + head_size // 2, whisker_y + 5), 2)
 
     def _draw_cow(
-        self, screen: pygame.Surface, cx: int, cy: int, size: int, bounce: float
+        self, screen: pygame.Surface, cx: int, cy: int, size: int
     ) -> None:
         """牛を描画"""
-        y_offset = int(bounce * 10)
-        cy -= y_offset
-
         body_rect = pygame.Rect(cx - size // 2, cy - size // 4, size, size // 2)
         pygame.draw.ellipse(screen, (255, 255, 255), body_rect)
 
@@ -389,12 +442,9 @@ class AnimalTouchGame(BaseGame):
         pygame.draw.ellipse(screen, (255, 200, 200), (head_pos[0] - size // 8, head_pos[1] + size // 12, size // 4, size // 6))
 
     def _draw_pig(
-        self, screen: pygame.Surface, cx: int, cy: int, size: int, bounce: float
+        self, screen: pygame.Surface, cx: int, cy: int, size: int
     ) -> None:
         """豚を描画"""
-        y_offset = int(bounce * 12)
-        cy -= y_offset
-
         color = (255, 182, 193)
 
         pygame.draw.circle(screen, color, (cx, cy), size // 3)
@@ -414,12 +464,9 @@ class AnimalTouchGame(BaseGame):
         pygame.draw.circle(screen, (0, 0, 0), (head_pos[0] + size // 10, head_pos[1] - size // 16), size // 20)
 
     def _draw_sheep(
-        self, screen: pygame.Surface, cx: int, cy: int, size: int, bounce: float
+        self, screen: pygame.Surface, cx: int, cy: int, size: int
     ) -> None:
         """羊を描画"""
-        y_offset = int(bounce * 12)
-        cy -= y_offset
-
         wool_color = (245, 245, 245)
         for dx, dy in [(-size // 4, 0), (size // 4, 0), (0, -size // 6), (0, size // 6), (-size // 6, -size // 8), (size // 6, -size // 8)]:
             pygame.draw.circle(screen, wool_color, (cx + dx, cy + dy), size // 4)
@@ -434,12 +481,9 @@ class AnimalTouchGame(BaseGame):
         pygame.draw.ellipse(screen, (60, 60, 60), (head_pos[0] + size // 6, head_pos[1] - size // 12, size // 8, size // 10))
 
     def _draw_chicken(
-        self, screen: pygame.Surface, cx: int, cy: int, size: int, bounce: float
+        self, screen: pygame.Surface, cx: int, cy: int, size: int
     ) -> None:
         """鶏を描画"""
-        y_offset = int(bounce * 18)
-        cy -= y_offset
-
         body_color = (255, 220, 100)
         pygame.draw.ellipse(screen, body_color, (cx - size // 3, cy - size // 6, size * 2 // 3, size // 2))
 
@@ -467,12 +511,9 @@ class AnimalTouchGame(BaseGame):
         pygame.draw.ellipse(screen, (255, 200, 80), (cx - size // 6, cy - size // 8, size // 3, size // 4))
 
     def _draw_frog(
-        self, screen: pygame.Surface, cx: int, cy: int, size: int, bounce: float
+        self, screen: pygame.Surface, cx: int, cy: int, size: int
     ) -> None:
         """カエルを描画"""
-        y_offset = int(bounce * 25)
-        cy -= y_offset
-
         color = (50, 205, 50)
         light_color = (144, 238, 144)
 
@@ -491,12 +532,9 @@ class AnimalTouchGame(BaseGame):
         pygame.draw.ellipse(screen, light_color, (cx - size // 5, cy, size * 2 // 5, size // 4))
 
     def _draw_lion(
-        self, screen: pygame.Surface, cx: int, cy: int, size: int, bounce: float
+        self, screen: pygame.Surface, cx: int, cy: int, size: int
     ) -> None:
         """ライオンを描画"""
-        y_offset = int(bounce * 15)
-        cy -= y_offset
-
         mane_color = (200, 120, 20)
         body_color = (255, 180, 50)
 
@@ -529,8 +567,7 @@ class AnimalTouchGame(BaseGame):
 
     def on_enter(self) -> None:
         """ゲーム開始時の初期化"""
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
+        init_audio()
         # 音声ファイルを読み込み
         self._load_animal_sounds()
         self.current_animal_index = random.randint(0, len(self.animals) - 1)
@@ -552,21 +589,27 @@ class AnimalTouchGame(BaseGame):
         else:
             self.current_sound = self._create_animal_sound(animal.sound_freq)
 
-        self.current_sound.play()
+        play_sfx(self.current_sound, ANIMAL_SFX)
 
     def _next_animal(self) -> None:
         """次の動物に切り替え"""
         self.current_animal_index = (self.current_animal_index + 1) % len(self.animals)
         self.auto_switch_timer = 0.0
+        self.mark_all_dirty()
 
     def _prev_animal(self) -> None:
         """前の動物に切り替え"""
         self.current_animal_index = (self.current_animal_index - 1) % len(self.animals)
         self.auto_switch_timer = 0.0
+        self.mark_all_dirty()
 
     def handle_events(self, events: list[pygame.event.Event]) -> None:
         """イベント処理"""
         for event in events:
+            # 戻るボタンはホバーで色が変わる
+            if event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                self.mark_dirty(self.back_button.rect)
+
             if self.back_button.handle_event(event):
                 continue
 
@@ -599,6 +642,10 @@ class AnimalTouchGame(BaseGame):
 
     def update(self, dt: float) -> None:
         """更新処理"""
+        # アニメーション中と、終了直後の1フレーム（吹き出しを消す）は描き直す
+        if self.is_animating or self.show_sound_text:
+            self.mark_all_dirty()
+
         if self.is_animating:
             self.animation_time += dt
             if self.animation_time >= self.animation_duration:
@@ -613,14 +660,18 @@ class AnimalTouchGame(BaseGame):
         if self.auto_switch_timer >= self.auto_switch_interval:
             self._next_animal()
 
-    def draw(self) -> None:
+    def has_active_animation(self) -> bool:
+        """バウンス中・鳴き声表示中はアニメーション中"""
+        return self.is_animating or self.show_sound_text
+
+    def draw(self, alpha: float = 1.0) -> None:
         """描画処理"""
         self.screen.fill(BACKGROUND_CREAM)
 
         animal = self.animals[self.current_animal_index]
 
         # 動物名を表示
-        name_text = self.name_font.render(animal.name, True, (80, 80, 80))
+        name_text = render_text(self.name_font, animal.name, (80, 80, 80))
         name_rect = name_text.get_rect(centerx=self.width // 2, top=80)
         self.screen.blit(name_text, name_rect)
 
@@ -646,11 +697,11 @@ class AnimalTouchGame(BaseGame):
                 bounce,
             )
         else:
-            animal.draw_func(self.screen, animal_cx, animal_cy, animal_size, bounce)
+            self._draw_animal_primitive(animal, animal_cx, animal_cy, animal_size, bounce)
 
         # 鳴き声テキストを表示（吹き出し風）
         if self.show_sound_text:
-            text_surface = self.sound_font.render(animal.sound_text, True, (50, 50, 50))
+            text_surface = render_text(self.sound_font, animal.sound_text, (50, 50, 50))
             text_rect = text_surface.get_rect(centerx=self.width // 2, top=self.height - 150)
 
             bubble_rect = text_rect.inflate(40, 20)
@@ -664,7 +715,7 @@ class AnimalTouchGame(BaseGame):
         self._draw_arrow_button(self.right_arrow_rect, "right")
 
         # ヒントテキスト
-        hint_text = self.hint_font.render("Touch the animal!", True, (150, 150, 150))
+        hint_text = render_text(self.hint_font, "Touch the animal!", (150, 150, 150))
         hint_rect = hint_text.get_rect(centerx=self.width // 2, bottom=self.height - 20)
         self.screen.blit(hint_text, hint_rect)
 
@@ -8,7 +8,6 @@ BabyPianoGame - カラフルなピアノで音を鳴らすゲーム
 - 音ゲーモード：曲に合わせて鍵盤を弾く
 """
 
-import array
 import math
 from dataclasses import dataclass, field
 from enum import Enum
@@ -16,6 +15,8 @@ from pathlib import Path
 
 import pygame
 
+from shared import synth
+from shared.audio import init_audio
 from shared.base_game import BaseGame
 from shared.components import BackButton, Button
 from shared.constants import (
@@ -30,6 +31,10 @@ from shared.constants import (
     WHITE,
 )
 from shared.fonts import get_font
+from shared.sample_bank import SampleBank
+from shared.sound_cache import disk_cached_sound
+from shared.text_cache import render_text
+from shared.voice_allocator import VOICE_RELEASE_CHANNELS, VoiceAllocator
 
 # アセットディレクトリのパス
 ASSETS_DIR = Path(__file__).parent / "assets"
@@ -48,6 +53,16 @@ NOTES = [
     {"name": "ド", "freq": 523.25, "key": "c5"},
 ]
 
+# 楽器の録音のファイル名（拡張子なし）。ドの高さで録音した1つのファイルから全ての音階を作る
+INSTRUMENT_SAMPLE_NAME: str = "instrument"
+
+# 楽器の録音の音の高さ（ド）
+INSTRUMENT_ROOT_FREQ: float = NOTES[0]["freq"]
+
+# 鍵盤の音に使うチャンネル数（全ての鍵盤を同時に鳴らせる数 + 古い音のフェードアウト用）。
+# 同じ鍵盤はそのチャンネルで鳴らし直すので、全部の鍵盤を連打しても鳴っている音を横取りしない
+PIANO_VOICE_CHANNELS: int = len(NOTES) + VOICE_RELEASE_CHANNELS
+
 # 鍵盤の色（虹色 + ピンク）
 KEY_COLORS = [
     BABY_RED,
@@ -156,9 +171,14 @@ class BabyPianoGame(BaseGame):
         self.keys: list[PianoKey] = []
         self._setup_keys()
 
-        # 音声キャッシュ
+        # 音声ファイル（生成した音はゲーム間で共有するキャッシュに置く）
         self.sounds: dict[str, pygame.mixer.Sound] = {}
-        self.generated_sounds: dict[float, pygame.mixer.Sound] = {}
+
+        # 楽器の録音（あれば、音階ごとのファイルがない鍵盤の音をここから作る）
+        self.sample_bank: SampleBank | None = None
+
+        # 鍵盤の音を鳴らすチャンネルの管理（ミキサーの初期化後に作る）
+        self.voices: VoiceAllocator | None = None
 
         # UI
         self.back_button = BackButton(x=20, y=20, on_click=self._handle_back)
@@ -324,10 +344,14 @@ class BabyPianoGame(BaseGame):
                     self.keys[note_index].is_highlighted = True
 
     def _load_sounds(self) -> None:
-        """音声ファイルを読み込む"""
+        """音声ファイルを読み込む（音階ごとのファイルと楽器の録音）"""
         if not SOUNDS_DIR.exists():
             return
 
+        self.sample_bank = SampleBank.load(
+            SOUNDS_DIR / INSTRUMENT_SAMPLE_NAME, INSTRUMENT_ROOT_FREQ, volume=0.6
+        )
+
         for note in NOTES:
             sound_key = note["key"]
             for ext in [".ogg", ".wav", ".mp3"]:
@@ -341,41 +365,28 @@ class BabyPianoGame(BaseGame):
                     except pygame.error:
                         pass
 
-    def _create_note_sound(self, frequency: float) -> pygame.mixer.Sound:
-        """音階の音を生成"""
-        # キャッシュを確認
-        if frequency in self.generated_sounds:
-            return self.generated_sounds[frequency]
-
-        sample_rate = 22050
-        duration = 0.5
-        samples = int(sample_rate * duration)
-
-        sound_array = array.array("h")
-
-        for i in range(samples):
-            t = i / sample_rate
-            if t < 0.05:
-                envelope = t / 0.05
-            elif t < 0.15:
-                envelope = 1.0 - 0.3 * (t - 0.05) / 0.1
-            elif t < 0.4:
-                envelope = 0.7
-            else:
-                envelope = 0.7 * (1.0 - (t - 0.4) / 0.1)
-                envelope = max(0, envelope)
-
-            value = math.sin(2 * math.pi * frequency * t)
-            value += 0.3 * math.sin(2 * math.pi * frequency * 2 * t)
-            value += 0.1 * math.sin(2 * math.pi * frequency * 3 * t)
+    @classmethod
+    def prewarm(cls) -> None:
+        """全ての音階の音を事前に生成する"""
+        for note in NOTES:
+            cls._create_note_sound(note["freq"])
 
-            amplitude = int(20000 * envelope * value / 1.4)
-            sound_array.append(amplitude)
+    @classmethod
+    def _create_note_sound(cls, frequency: float) -> pygame.mixer.Sound:
+        """音階の音を取得する（生成済みなら共有キャッシュから）"""
+        return cls.cached_resource(("note", frequency), lambda: cls._synthesize_note(frequency))
 
-        sound = pygame.mixer.Sound(buffer=sound_array)
-        sound.set_volume(0.6)
-        self.generated_sounds[frequency] = sound
-        return sound
+    @staticmethod
+    @disk_cached_sound
+    def _synthesize_note(frequency: float) -> pygame.mixer.Sound:
+        """音階の音を生成"""
+        t = synth.timeline(0.5)
+        # 立ち上がり → 減衰 → 持続 → 余韻
+        envelope = synth.linear_envelope(
+            [(0.0, 0.0), (0.05, 1.0), (0.15, 0.7), (0.4, 0.7), (0.5, 0.0)], t
+        )
+        wave = synth.tone(frequency, t, harmonics=[(1, 1.0), (2, 0.3), (3, 0.1)])
+        return synth.to_sound(wave * envelope / 1.4, amplitude=20000, volume=0.6)
 
     def _play_key(self, key: PianoKey) -> None:
         """鍵盤を押したときの処理"""
@@ -385,11 +396,17 @@ class BabyPianoGame(BaseGame):
         self.last_note = key.note_name
         self.last_note_time = 0.0
 
-        # 音声を再生
+        # 音声を再生（同じ鍵盤の連打は同じチャンネルで鳴らし直す）
         if key.sound_key in self.sounds:
-            self.sounds[key.sound_key].play()
+            sound = self.sounds[key.sound_key]
+        elif self.sample_bank is not None:
+            sound = self.sample_bank.get(key.frequency)
         else:
             sound = self._create_note_sound(key.frequency)
+
+        if self.voices is not None:
+            self.voices.play(key.index, sound)
+        else:
             sound.play()
 
         # 音ゲーモードでの判定
@@ -430,9 +447,15 @@ class BabyPianoGame(BaseGame):
 
     def on_enter(self) -> None:
         """ゲーム開始時の初期化"""
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
+        init_audio()
         self._load_sounds()
+        self.voices = VoiceAllocator(PIANO_VOICE_CHANNELS)
+
+    def on_exit(self) -> None:
+        """ゲーム終了時の処理"""
+        if self.voices is not None:
+            self.voices.release()
+            self.voices = None
 
     def handle_events(self, events: list[pygame.event.Event]) -> None:
         """イベント処理"""
@@ -510,7 +533,13 @@ class BabyPianoGame(BaseGame):
         if self.highlight_pulse > math.pi * 2:
             self.highlight_pulse -= math.pi * 2
 
-    def draw(self) -> None:
+    def has_active_animation(self) -> bool:
+        """鍵盤の押下・音名表示・ハイライトのパルス中はアニメーション中"""
+        if any(key.is_pressed for key in self.keys) or self.last_note:
+            return True
+        return self.mode == GameMode.SONG_MODE and not self.song_completed
+
+    def draw(self, alpha: float = 1.0) -> None:
         """描画処理"""
         self.screen.fill(BACKGROUND_CREAM)
 
@@ -525,7 +554,7 @@ class BabyPianoGame(BaseGame):
     def _draw_song_select(self) -> None:
         """曲選択画面の描画"""
         # タイトル
-        title_text = self.title_font.render("きょくをえらんでね！", True, (80, 80, 80))
+        title_text = render_text(self.title_font, "きょくをえらんでね！", (80, 80, 80))
         title_rect = title_text.get_rect(centerx=self.width // 2, top=80)
         self.screen.blit(title_text, title_rect)
 
@@ -534,7 +563,7 @@ class BabyPianoGame(BaseGame):
             button.draw(self.screen)
 
         # ヒント
-        hint_text = self.hint_font.render("Touch a song to start!", True, (150, 150, 150))
+        hint_text = render_text(self.hint_font, "Touch a song to start!", (150, 150, 150))
         hint_rect = hint_text.get_rect(centerx=self.width // 2, bottom=self.height - 20)
         self.screen.blit(hint_text, hint_rect)
 
@@ -545,7 +574,7 @@ class BabyPianoGame(BaseGame):
             title = self.current_song.title
         else:
             title = "Baby Piano"
-        title_text = self.title_font.render(title, True, (80, 80, 80))
+        title_text = render_text(self.title_font, title, (80, 80, 80))
         title_rect = title_text.get_rect(centerx=self.width // 2, top=20)
         self.screen.blit(title_text, title_rect)
 
@@ -553,12 +582,12 @@ class BabyPianoGame(BaseGame):
         if self.mode == GameMode.SONG_MODE and self.current_song:
             if self.song_completed:
                 # 完了メッセージ
-                complete_text = self.note_font.render("できたね！", True, BABY_PINK)
+                complete_text = render_text(self.note_font, "できたね！", BABY_PINK)
                 complete_rect = complete_text.get_rect(centerx=self.width // 2, top=70)
                 self.screen.blit(complete_text, complete_rect)
 
                 # もう一度プレイのヒント
-                retry_text = self.hint_font.render("タップでもういちど", True, (100, 100, 100))
+                retry_text = render_text(self.hint_font, "タップでもういちど", (100, 100, 100))
                 retry_rect = retry_text.get_rect(centerx=self.width // 2, top=130)
                 self.screen.blit(retry_text, retry_rect)
             else:
@@ -588,6 +617,7 @@ class BabyPianoGame(BaseGame):
             alpha = 1.0 - (self.last_note_time / self.note_display_duration)
             alpha = max(0, min(1, alpha))
             note_color = (int(80 * alpha), int(80 * alpha), int(80 * alpha))
+            # 色が毎フレーム変わるためテキストキャッシュは使わない
             note_text = self.note_font.render(self.last_note, True, note_color)
             note_rect = note_text.get_rect(centerx=self.width // 2, top=70)
             self.screen.blit(note_text, note_rect)
@@ -611,7 +641,7 @@ class BabyPianoGame(BaseGame):
         else:
             hint = "ひかっているキーをタップしよう！"
         if hint:
-            hint_text = self.hint_font.render(hint, True, (150, 150, 150))
+            hint_text = render_text(self.hint_font, hint, (150, 150, 150))
             hint_rect = hint_text.get_rect(centerx=self.width // 2, bottom=self.height - 20)
             self.screen.blit(hint_text, hint_rect)
 
@@ -674,7 +704,7 @@ class BabyPianoGame(BaseGame):
 
             # 星マークを表示
             star_y = draw_rect.top + 30
-            star_text = get_font(48).render("★", True, (255, 220, 50))
+            star_text = render_text(get_font(48), "★", (255, 220, 50))
             star_rect = star_text.get_rect(centerx=draw_rect.centerx, centery=star_y)
             self.screen.blit(star_text, star_rect)
 
@@ -689,7 +719,7 @@ class BabyPianoGame(BaseGame):
 
         # 音階名を鍵盤の下部に表示
         font = get_font(36)
-        text_surface = font.render(key.note_name, True, WHITE)
+        text_surface = render_text(font, key.note_name, WHITE)
         text_rect = text_surface.get_rect(
             centerx=draw_rect.centerx,
             bottom=draw_rect.bottom - 20,
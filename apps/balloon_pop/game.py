@@ -4,52 +4,34 @@ BalloonPopGame - 風船をタップして弾けさせる幼児向けゲーム
 BaseGameを継承し、ランチャーから呼び出せる形式で実装。
 """
 
-import array
 import math
 import random
 from dataclasses import dataclass, field
 
 import pygame
 
+from shared import synth
+from shared.async_sound import AsyncSound
+from shared.audio import init_audio
 from shared.base_game import BaseGame
 from shared.components import BackButton
 from shared.constants import BABY_COLORS, BACKGROUND_LIGHT
+from shared.particles import ParticleSystem
+from shared.sfx import SfxRule, play_sfx
+from shared.sound_cache import disk_cached_sound
+from shared.sprite_baker import get_sprite_baker
 
+# パーティクルにかかる重力（px/秒^2）
+PARTICLE_GRAVITY = 1080.0
 
-@dataclass
-class Particle:
-    """弾けたときに飛び散るパーティクル"""
+# 風船の横揺れの速さ（px/秒）
+BALLOON_WOBBLE_SPEED = 30.0
 
-    x: float
-    y: float
-    vx: float
-    vy: float
-    color: tuple[int, int, int]
-    radius: float
-    life: float = 1.0
-    decay: float = 0.02
-
-    def update(self) -> bool:
-        """パーティクルを更新。生存中ならTrue、消滅ならFalse"""
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += 0.3  # 重力
-        self.life -= self.decay
-        return self.life > 0
-
-    def draw(self, screen: pygame.Surface) -> None:
-        """パーティクルを描画"""
-        alpha = int(255 * self.life)
-        radius = int(self.radius * self.life)
-        if radius > 0:
-            surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(
-                surface,
-                (*self.color, alpha),
-                (radius, radius),
-                radius,
-            )
-            screen.blit(surface, (int(self.x - radius), int(self.y - radius)))
+# 風船の半径（px）。焼き付けるスプライトが色 × 半径の数で済むよう 8px 刻みにする
+BALLOON_RADII = tuple(range(60, 101, 8))
+
+# 風船が弾ける音（画面を連打すると一度にたくさん弾けるので間引く）
+POP_SFX = SfxRule(max_concurrent=4, min_interval=0.04)
 
 
 @dataclass
@@ -60,33 +42,55 @@ class Balloon:
     y: float
     radius: float
     color: tuple[int, int, int]
-    speed: float = 1.0
+    speed: float = 60.0  # 上昇速度（px/秒）
     wobble_offset: float = field(default_factory=lambda: random.uniform(0, math.pi * 2))
-    wobble_speed: float = field(default_factory=lambda: random.uniform(0.02, 0.05))
+    wobble_speed: float = field(default_factory=lambda: random.uniform(1.2, 3.0))  # rad/秒
     time: float = 0.0
+    prev_x: float = field(init=False)
+    prev_y: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        """補間用の前回位置を初期化"""
+        self.prev_x = self.x
+        self.prev_y = self.y
 
-    def update(self, screen_height: int) -> bool:
+    def update(self, dt: float, screen_height: int) -> bool:
         """風船を更新。画面内ならTrue、画面外ならFalse"""
-        self.y -= self.speed
-        self.time += self.wobble_speed
-        self.x += math.sin(self.time + self.wobble_offset) * 0.5
+        self.prev_x = self.x
+        self.prev_y = self.y
+        self.y -= self.speed * dt
+        self.time += self.wobble_speed * dt
+        self.x += math.sin(self.time + self.wobble_offset) * BALLOON_WOBBLE_SPEED * dt
         return self.y + self.radius > -50
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> None:
         """風船を描画"""
-        x, y = int(self.x), int(self.y)
+        x = int(self.prev_x + (self.x - self.prev_x) * alpha)
+        y = int(self.prev_y + (self.y - self.prev_y) * alpha)
         r = int(self.radius)
 
-        pygame.draw.circle(screen, self.color, (x, y), r)
-
-        highlight_color = tuple(min(c + 60, 255) for c in self.color)
-        highlight_pos = (x - r // 3, y - r // 3)
-        pygame.draw.circle(screen, highlight_color, highlight_pos, r // 4)  # type: ignore
+        # 本体は色と半径ごとに1回だけ焼き付けて貼る（ひもは揺れるので毎フレーム描く）
+        get_sprite_baker().draw(
+            screen,
+            ("balloon_pop", self.color, r),
+            (x, y),
+            lambda surface, bx, by: self._draw_body(surface, bx, by, r, self.color),
+            (r * 2 + 2, r * 2 + 2),
+        )
 
         string_start = (x, y + r)
         string_end = (x + math.sin(self.time) * 5, y + r + 30)
         pygame.draw.line(screen, (150, 150, 150), string_start, string_end, 2)  # type: ignore
 
+    @staticmethod
+    def _draw_body(screen: pygame.Surface, x: int, y: int, r: int, color: tuple[int, int, int]) -> None:
+        """風船の本体（円とハイライト）を描画"""
+        pygame.draw.circle(screen, color, (x, y), r)
+
+        highlight_color = tuple(min(c + 60, 255) for c in color)
+        highlight_pos = (x - r // 3, y - r // 3)
+        pygame.draw.circle(screen, highlight_color, highlight_pos, r // 4)  # type: ignore
+
     def contains_point(self, px: int, py: int) -> bool:
         """指定した点が風船内にあるか判定"""
         distance = math.sqrt((self.x - px) ** 2 + (self.y - py) ** 2)
@@ -105,12 +109,12 @@ class BalloonPopGame(BaseGame):
         super().__init__(screen)
 
         self.balloons: list[Balloon] = []
-        self.particles: list[Particle] = []
+        self.particles = ParticleSystem(gravity=PARTICLE_GRAVITY, fade=True)
 
         self.spawn_timer = 0.0
         self.spawn_interval = 1.5
 
-        self.pop_sound: pygame.mixer.Sound | None = None
+        self.pop_sound: AsyncSound | None = None
 
         # 戻るボタン
         self.back_button = BackButton(
@@ -122,11 +126,10 @@ class BalloonPopGame(BaseGame):
     def on_enter(self) -> None:
         """ゲーム開始時の初期化"""
         # ミキサーの初期化（まだの場合）
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
+        init_audio()
 
-        # 効果音を生成
-        self.pop_sound = self._create_pop_sound()
+        # 効果音を取得（ランチャーの待機中に作成済みならそれを使う。まだなら完成を待たずに始める）
+        self.pop_sound = AsyncSound(self.cached_resource_async("pop_sound", self._create_pop_sound))
 
         # 初期風船を生成
         self.balloons.clear()
@@ -139,65 +142,59 @@ class BalloonPopGame(BaseGame):
         self.balloons.clear()
         self.particles.clear()
 
-    def _create_pop_sound(self) -> pygame.mixer.Sound:
-        """ポップ音を生成"""
-        sample_rate = 22050
-        duration = 0.1
-        samples = int(sample_rate * duration)
+    @classmethod
+    def prewarm(cls) -> None:
+        """効果音を事前に生成する"""
+        cls.cached_resource("pop_sound", cls._create_pop_sound)
 
-        sound_array = array.array("h")
-        for i in range(samples):
-            t = i / sample_rate
-            amplitude = int(32767 * math.exp(-t * 30) * math.sin(2 * math.pi * 400 * t))
-            sound_array.append(amplitude)
-
-        sound = pygame.mixer.Sound(buffer=sound_array)
-        sound.set_volume(0.3)
-        return sound
+    @staticmethod
+    @disk_cached_sound
+    def _create_pop_sound() -> pygame.mixer.Sound:
+        """ポップ音を生成"""
+        t = synth.timeline(0.1)
+        wave = synth.tone(400, t) * synth.exp_decay(30, t)
+        return synth.to_sound(wave, amplitude=32767, volume=0.3)
 
     def _spawn_balloon(self) -> None:
         """新しい風船を生成"""
-        radius = random.uniform(60, 100)
+        radius = random.choice(BALLOON_RADII)
         x = random.uniform(radius, self.width - radius)
         y = self.height + radius
         color = random.choice(BABY_COLORS)
-        speed = random.uniform(0.8, 1.5)
+        speed = random.uniform(48, 90)  # px/秒
 
         self.balloons.append(Balloon(x=x, y=y, radius=radius, color=color, speed=speed))
 
     def _pop_balloon(self, balloon: Balloon) -> None:
         """風船を弾けさせる"""
         if self.pop_sound:
-            self.pop_sound.play()
+            play_sfx(self.pop_sound.get(), POP_SFX)
 
         num_particles = random.randint(15, 25)
         for _ in range(num_particles):
             angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(3, 8)
-            particle = Particle(
+            speed = random.uniform(180, 480)
+            self.particles.emit(
                 x=balloon.x,
                 y=balloon.y,
                 vx=math.cos(angle) * speed,
-                vy=math.sin(angle) * speed - 2,
+                vy=math.sin(angle) * speed - 120,
+                size=random.uniform(5, 15),
                 color=balloon.color,
-                radius=random.uniform(5, 15),
-                decay=random.uniform(0.015, 0.03),
+                decay=random.uniform(0.9, 1.8),
             )
-            self.particles.append(particle)
 
         for _ in range(5):
             angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(2, 5)
-            self.particles.append(
-                Particle(
-                    x=balloon.x,
-                    y=balloon.y,
-                    vx=math.cos(angle) * speed,
-                    vy=math.sin(angle) * speed - 3,
-                    color=(255, 255, 100),
-                    radius=random.uniform(8, 12),
-                    decay=random.uniform(0.02, 0.04),
-                )
+            speed = random.uniform(120, 300)
+            self.particles.emit(
+                x=balloon.x,
+                y=balloon.y,
+                vx=math.cos(angle) * speed,
+                vy=math.sin(angle) * speed - 180,
+                size=random.uniform(8, 12),
+                color=(255, 255, 100),
+                decay=random.uniform(1.2, 2.4),
             )
 
     def handle_events(self, events: list[pygame.event.Event]) -> None:
@@ -221,8 +218,8 @@ class BalloonPopGame(BaseGame):
 
     def update(self, dt: float) -> None:
         """ゲーム状態の更新"""
-        self.balloons = [b for b in self.balloons if b.update(self.height)]
-        self.particles = [p for p in self.particles if p.update()]
+        self.balloons = [b for b in self.balloons if b.update(dt, self.height)]
+        self.particles.update(dt)
 
         self.spawn_timer += dt
         if self.spawn_timer >= self.spawn_interval:
@@ -232,15 +229,14 @@ class BalloonPopGame(BaseGame):
         if len(self.balloons) < 2:
             self._spawn_balloon()
 
-    def draw(self) -> None:
+    def draw(self, alpha: float = 1.0) -> None:
         """描画処理"""
         self.screen.fill(BACKGROUND_LIGHT)
 
         for balloon in self.balloons:
-            balloon.draw(self.screen)
+            balloon.draw(self.screen, alpha)
 
-        for particle in self.particles:
-            particle.draw(self.screen)
+        self.particles.draw(self.screen, alpha)
 
         # 戻るボタンを描画
         self.back_button.draw(self.screen)
@@ -14,13 +14,15 @@ sys.path.insert(0, str(project_root))
 
 import pygame
 
+from shared.audio import init_audio, pre_init_audio
 from shared.constants import DEFAULT_HEIGHT, DEFAULT_WIDTH
 
 
 def main() -> None:
     """単体実行用エントリーポイント"""
+    pre_init_audio()
     pygame.init()
-    pygame.mixer.init()
+    init_audio()
 
     screen = pygame.display.set_mode((DEFAULT_WIDTH, DEFAULT_HEIGHT))
     pygame.display.set_caption("Balloon Pop - バルーンポップ")
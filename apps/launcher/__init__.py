@@ -3,5 +3,6 @@ Launcher - ゲーム選択画面
 """
 
 from apps.launcher.launcher import Launcher
+from apps.launcher.registry import GameEntry
 
-__all__ = ["Launcher"]
+__all__ = ["Launcher", "GameEntry"]
@@ -3,12 +3,18 @@ Launcher - ゲーム選択画面
 
 登録されたゲームをアイコンで表示し、タップで起動できるランチャー。
 1〜2歳児向けに大きなタッチターゲットを採用。
+ゲームは "モジュール名:クラス名" で登録でき、その場合モジュールは
+最初に起動されるまでインポートしない。
+待機中（アイドル状態）になると、ホバー中か最後に起動したゲームの prewarm() を
+バックグラウンドで実行し、起動直後の効果音の生成などを先に済ませておく。
 """
 
+import time
 from typing import Type
 
 import pygame
 
+from apps.launcher.registry import GameEntry, GameMetadataCache
 from shared.base_game import BaseGame
 from shared.components import IconButton
 from shared.constants import (
@@ -23,7 +29,13 @@ from shared.constants import (
     ICON_SIZE,
     WHITE,
 )
-from shared.fonts import get_font
+from shared.dirty_rects import DirtyRegions
+from shared.fonts import get_font, warm_up_fonts
+from shared.frame_rate import FrameRateGovernor
+from shared.layers import LayerCompositor
+from shared.profiler import get_frame_profiler
+from shared.resource_cache import ResourcePrewarmer
+from shared.text_cache import render_text
 
 
 # ゲームアイコンに使う色のリスト
@@ -48,21 +60,57 @@ class Launcher:
         self.clock = pygame.time.Clock()
         self.running = True
 
-        # 登録されたゲームクラスのリスト
-        self.games: list[Type[BaseGame]] = []
+        # ランチャーはアニメーションしないため、入力がなければすぐアイドルになる
+        self.frame_governor = FrameRateGovernor(self.clock)
+        self.profiler = get_frame_profiler()
+
+        # 変化した領域だけを画面に転送する（ホバーしたボタンなど）
+        self.dirty_regions = DirtyRegions((self.width, self.height))
+
+        # 登録されたゲームのリスト（クラスは起動時に読み込む）
+        self.games: list[GameEntry] = []
+        self.metadata_cache = GameMetadataCache()
         self.game_buttons: list[IconButton] = []
 
         # 現在実行中のゲーム
         self.current_game: BaseGame | None = None
 
+        # 最後に起動したゲーム（待機中のリソースの事前作成に使う）
+        self.last_played: GameEntry | None = None
+
+        # 待機中にゲームのリソースを事前に作る
+        self.prewarmer = ResourcePrewarmer()
+
+        # ゲーム名 → 起動から最初のフレームまでの時間（ms）のリスト
+        self.launch_latencies: dict[str, list[float]] = {}
+
+        # よく使うサイズのフォントを先に読み込んでおく（ゲーム起動時の待ちを減らす）
+        warm_up_fonts()
+
         # フォント（日本語対応）
         self.title_font = get_font(72)
         self.subtitle_font = get_font(36)
 
-    def register_game(self, game_class: Type[BaseGame]) -> None:
-        """ゲームを登録する"""
-        self.games.append(game_class)
+        # 背景とタイトル（最初の描画で1回だけ描いて保存する）
+        self.layers = LayerCompositor((self.width, self.height))
+        self.layers.add("background", self._draw_background)
+
+    def register_game(self, game: Type[BaseGame] | str) -> None:
+        """
+        ゲームを登録する
+
+        Args:
+            game: ゲームクラス、または "モジュール名:クラス名"
+                （文字列の場合、モジュールは最初に起動されるまでインポートしない）
+        """
+        if isinstance(game, str):
+            entry = self.metadata_cache.resolve(game)
+        else:
+            entry = GameEntry.from_class(game)
+
+        self.games.append(entry)
         self._update_buttons()
+        self.dirty_regions.mark_all()
 
     def _update_buttons(self) -> None:
         """ボタンの配置を更新する"""
@@ -89,7 +137,7 @@ class Launcher:
         start_x = (self.width - grid_width) // 2
         start_y = (self.height - grid_height) // 2 + 50
 
-        for i, game_class in enumerate(self.games):
+        for i, entry in enumerate(self.games):
             row = i // cols
             col = i % cols
 
@@ -97,32 +145,75 @@ class Launcher:
             y = start_y + row * (button_size + label_height + spacing)
 
             # ゲームのアイコンを取得（なければ色で代用）
-            icon = game_class.get_icon()
+            icon = entry.get_icon()
             color = ICON_COLORS[i % len(ICON_COLORS)]
 
             # クロージャで正しいインデックスをキャプチャ
-            def make_callback(game_cls: Type[BaseGame]) -> callable:
-                return lambda: self._launch_game(game_cls)
+            def make_callback(game_entry: GameEntry) -> callable:
+                return lambda: self._launch_game(game_entry)
 
             button = IconButton(
                 x=x,
                 y=y,
                 size=button_size,
                 icon=icon,
-                label=game_class.name,
+                label=entry.name,
                 color=color,
                 hover_color=tuple(max(c - 30, 0) for c in color),  # type: ignore
-                on_click=make_callback(game_class),
+                on_click=make_callback(entry),
             )
             self.game_buttons.append(button)
 
-    def _launch_game(self, game_class: Type[BaseGame]) -> None:
-        """ゲームを起動する"""
+    def _launch_game(self, entry: GameEntry) -> None:
+        """ゲームを起動する（初回はゲームモジュールをインポートする）"""
+        launched_at = time.perf_counter()
+        game_class = entry.load()
         self.current_game = game_class(self.screen)
-
-    def handle_events(self) -> None:
+        self.current_game.launched_at = launched_at
+        self.last_played = entry
+
+    def _prewarm_target(self) -> GameEntry | None:
+        """事前作成するゲーム（ホバー中のゲーム、なければ最後に起動したゲーム）"""
+        for entry, button in zip(self.games, self.game_buttons):
+            if button.is_highlighted:
+                return entry
+        return self.last_played
+
+    def _start_prewarm(self) -> None:
+        """
+        ホバー中か最後に起動したゲームのリソースの事前作成をバックグラウンドで始める
+
+        事前作成にはゲームモジュールのインポートが必要になる。全ゲームを事前作成すると
+        起動時に読み込まない（最初に起動したときにインポートする）効果がなくなるため、
+        次に遊びそうなゲームだけにする。初回起動でホバーもない場合は何もしない。
+        インポート（モジュール直下の pygame の処理を含む）はメインスレッドで行い、
+        prewarm() だけをバックグラウンドで実行する。
+        """
+        entry = self._prewarm_target()
+        if entry is None or self.prewarmer.submitted(entry.spec):
+            return
+        self.prewarmer.submit(entry.spec, entry.load().prewarm)
+
+    def _record_launch_latency(self, game: BaseGame) -> None:
+        """起動から最初のフレームまでの時間を記録する"""
+        if game.first_frame_ms is not None:
+            self.launch_latencies.setdefault(game.name, []).append(game.first_frame_ms)
+
+    def get_launch_stats(self) -> dict[str, dict[str, float]]:
+        """
+        ゲームごとの起動時間の統計を取得する
+
+        Returns:
+            {ゲーム名: {"count": 起動回数, "last_ms": 直近, "max_ms": 最大}}
+        """
+        return {
+            name: {"count": len(values), "last_ms": values[-1], "max_ms": max(values)}
+            for name, values in self.launch_latencies.items()
+        }
+
+    def handle_events(self, events: list[pygame.event.Event]) -> None:
         """イベント処理"""
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
                 return
@@ -132,29 +223,36 @@ class Launcher:
                     self.running = False
                     return
 
-            # ボタンのイベント処理
+            # ボタンのイベント処理（見た目が変わったボタンだけ描き直す）
             for button in self.game_buttons:
+                was_highlighted = button.is_highlighted
                 button.handle_event(event)
+                if button.is_highlighted != was_highlighted:
+                    self.dirty_regions.mark(button.rect)
 
     def update(self) -> None:
         """更新処理"""
         pass  # 現在は特に更新処理なし
 
-    def draw(self) -> None:
-        """描画処理"""
-        self.screen.fill(BACKGROUND_CREAM)
+    def _draw_background(self, screen: pygame.Surface) -> None:
+        """背景・タイトル・サブタイトルを描画（静的なレイヤー）"""
+        screen.fill(BACKGROUND_CREAM)
 
         # タイトル
-        title_text = self.title_font.render("Baby Fun Box", True, (80, 80, 80))
+        title_text = render_text(self.title_font, "Baby Fun Box", (80, 80, 80))
         title_rect = title_text.get_rect(centerx=self.width // 2, top=30)
-        self.screen.blit(title_text, title_rect)
+        screen.blit(title_text, title_rect)
 
         # サブタイトル
-        subtitle_text = self.subtitle_font.render(
-            "Choose a game!", True, (120, 120, 120)
+        subtitle_text = render_text(
+            self.subtitle_font, "Choose a game!", (120, 120, 120)
         )
         subtitle_rect = subtitle_text.get_rect(centerx=self.width // 2, top=100)
-        self.screen.blit(subtitle_text, subtitle_rect)
+        screen.blit(subtitle_text, subtitle_rect)
+
+    def draw(self) -> None:
+        """描画処理"""
+        self.layers.compose(self.screen)
 
         # ゲームボタンを描画
         for button in self.game_buttons:
@@ -162,20 +260,19 @@ class Launcher:
 
         # ゲームがない場合のメッセージ
         if len(self.games) == 0:
-            no_games_text = self.subtitle_font.render(
-                "No games available", True, (150, 150, 150)
+            no_games_text = render_text(
+                self.subtitle_font, "No games available", (150, 150, 150)
             )
             no_games_rect = no_games_text.get_rect(center=(self.width // 2, self.height // 2))
             self.screen.blit(no_games_text, no_games_rect)
 
-        pygame.display.flip()
-
     def run(self) -> None:
         """メインループ"""
         while self.running:
             # ゲームが起動されていたら実行
             if self.current_game is not None:
                 self.current_game.run()
+                self._record_launch_latency(self.current_game)
 
                 # ゲームが終了したらランチャーに戻る
                 if self.current_game.return_to_launcher:
@@ -187,10 +284,39 @@ class Launcher:
                 else:
                     self.current_game = None
 
+                # ゲームが画面全体を描き替えているため全体を描き直す
+                self.dirty_regions.mark_all()
+                self.frame_governor.wake()
                 continue
 
             # ランチャーの処理
-            self.clock.tick(60)
-            self.handle_events()
+            _, events = self.frame_governor.next_frame(animating=False)
+            self.profiler.begin_frame()
+
+            # 操作がなくなったら次に遊びそうなゲームのリソースを事前に作り始める
+            if self.frame_governor.is_idle:
+                self._start_prewarm()
+
+            # プロファイラの表示切り替え（Ctrl+Shift+P）
+            if self.profiler.handle_toggle(events):
+                self.dirty_regions.mark_all()
+
+            self.handle_events(events)
+            self.profiler.end_phase("events")
             self.update()
-            self.draw()
+            self.profiler.end_phase("update")
+
+            if self.profiler.enabled:
+                self.dirty_regions.mark(self.profiler.overlay_rect(self.screen))
+            if self.dirty_regions.needs_redraw:
+                self.draw()
+                self.profiler.end_phase("draw")
+                self.profiler.draw_overlay(self.screen)
+                self.dirty_regions.present()
+            else:
+                self.profiler.skip_phase("draw")
+            self.profiler.end_phase("present")
+            self.profiler.end_frame()
+
+        # 事前作成が残っていれば取り消す（pygame.quit() の前にスレッドを止める）
+        self.prewarmer.shutdown()
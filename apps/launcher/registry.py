@@ -0,0 +1,240 @@
+"""
+ゲーム登録 - ゲームモジュールを読み込まずにメタデータを取得する
+
+ランチャーの表示に必要なのは name / description / アイコンだけなので、
+ゲームモジュールをインポートせずにソースコードからクラス属性を読み取る。
+ゲームモジュールは最初に起動されたときにインポートする。
+読み取った情報はユーザーのキャッシュディレクトリに保存し、
+ソースファイルが変わらない限り次回起動時はソースの解析も省略する。
+"""
+
+import ast
+import importlib
+import importlib.util
+import inspect
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Type
+
+import pygame
+
+from shared.base_game import BaseGame
+from shared.paths import get_user_cache_dir
+
+# メタデータキャッシュのファイル名
+METADATA_CACHE_FILE: str = "game_metadata.json"
+
+# メタデータキャッシュの形式のバージョン（変えると既存のキャッシュは使われない）
+METADATA_CACHE_VERSION: int = 1
+
+# キャッシュの各エントリに必要な項目
+METADATA_CACHE_KEYS: tuple[str, ...] = ("source", "mtime_ns", "size", "name", "description", "icon_file")
+
+# ソースから読み取るクラス属性
+GAME_METADATA_FIELDS: tuple[str, ...] = ("name", "description", "icon_path")
+
+
+@dataclass
+class GameEntry:
+    """ランチャーに登録されたゲーム（クラスは起動時まで読み込まない）"""
+
+    spec: str  # "モジュール名:クラス名"
+    name: str
+    description: str
+    icon_file: Path | None = None  # アイコン画像の絶対パス
+    _game_class: Type[BaseGame] | None = field(default=None, repr=False)
+
+    @classmethod
+    def from_class(cls, game_class: Type[BaseGame]) -> "GameEntry":
+        """読み込み済みのゲームクラスから作る"""
+        icon_file = None
+        if game_class.icon_path is not None:
+            icon_file = Path(inspect.getfile(game_class)).parent / game_class.icon_path
+
+        return cls(
+            spec=f"{game_class.__module__}:{game_class.__qualname__}",
+            name=game_class.name,
+            description=game_class.description,
+            icon_file=icon_file,
+            _game_class=game_class,
+        )
+
+    @property
+    def is_loaded(self) -> bool:
+        """ゲームモジュールを読み込み済みか"""
+        return self._game_class is not None
+
+    def load(self) -> Type[BaseGame]:
+        """ゲームクラスを取得する（初回はモジュールをインポートする）"""
+        if self._game_class is None:
+            self._game_class = import_game_class(self.spec)
+        return self._game_class
+
+    def get_icon(self) -> pygame.Surface | None:
+        """アイコン画像を読み込む（モジュールはインポートしない）"""
+        if self.icon_file is None or not self.icon_file.exists():
+            return None
+        try:
+            return pygame.image.load(str(self.icon_file))
+        except (pygame.error, OSError):
+            return None
+
+
+def import_game_class(spec: str) -> Type[BaseGame]:
+    """ "モジュール名:クラス名" のゲームクラスをインポートする"""
+    module_name, class_name = spec.split(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
+def find_module_file(module_name: str) -> Path | None:
+    """
+    モジュールのソースファイルをインポートせずに探す
+
+    importlib.util.find_spec() はサブモジュールを探すときに親パッケージを
+    インポートしてしまう（apps/*/__init__.py はゲームクラスを読み込む）ため、
+    トップレベルのパッケージの場所からパスをたどる。
+    """
+    top, *rest = module_name.split(".")
+    spec = importlib.util.find_spec(top)
+    if spec is None:
+        return None
+
+    if not spec.submodule_search_locations:
+        # パッケージではない単体のモジュール
+        return Path(spec.origin) if spec.origin and not rest else None
+
+    path = Path(next(iter(spec.submodule_search_locations))).joinpath(*rest)
+    for candidate in (path.with_suffix(".py"), path / "__init__.py"):
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def read_class_metadata(source_file: Path, class_name: str) -> dict | None:
+    """
+    ソースコードからクラス属性（name / description / icon_path）を読み取る
+
+    Returns:
+        属性の辞書。クラスが見つからない、または属性がリテラルでない場合は None
+    """
+    tree = ast.parse(source_file.read_text(encoding="utf-8"), filename=str(source_file))
+
+    for node in tree.body:
+        if not (isinstance(node, ast.ClassDef) and node.name == class_name):
+            continue
+
+        # 定義されていない属性は BaseGame の値を使う
+        metadata = {key: getattr(BaseGame, key) for key in GAME_METADATA_FIELDS}
+        for stmt in node.body:
+            if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1:
+                target, value = stmt.targets[0], stmt.value
+            elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None:
+                target, value = stmt.target, stmt.value
+            else:
+                continue
+
+            if isinstance(target, ast.Name) and target.id in GAME_METADATA_FIELDS:
+                try:
+                    metadata[target.id] = ast.literal_eval(value)
+                except ValueError:
+                    return None
+        return metadata
+
+    return None
+
+
+class GameMetadataCache:
+    """ゲームのメタデータとアイコンのパスをディスクにキャッシュする"""
+
+    def __init__(self, path: Path | None = None) -> None:
+        """
+        Args:
+            path: キャッシュファイルのパス（None の場合はユーザーのキャッシュディレクトリ）
+        """
+        self.path = path or get_user_cache_dir() / METADATA_CACHE_FILE
+        self.entries: dict[str, dict] = self._load()
+
+    def _load(self) -> dict[str, dict]:
+        """キャッシュファイルを読み込む（壊れていれば空にする）"""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != METADATA_CACHE_VERSION:
+            return {}
+        games = data.get("games")
+        if not isinstance(games, dict):
+            return {}
+        # 項目が欠けたエントリはキャッシュにないものとして扱う
+        return {
+            spec: cached
+            for spec, cached in games.items()
+            if isinstance(cached, dict) and all(key in cached for key in METADATA_CACHE_KEYS)
+        }
+
+    def _save(self) -> None:
+        """キャッシュファイルを書き出す（書けなくても起動は続ける）"""
+        data = {"version": METADATA_CACHE_VERSION, "games": self.entries}
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+    def resolve(self, spec: str) -> GameEntry:
+        """
+        "モジュール名:クラス名" から GameEntry を作る
+
+        ソースファイルの更新日時とサイズがキャッシュと一致すればキャッシュを使い、
+        そうでなければソースを解析してキャッシュを更新する。
+        ソースから読み取れない場合はモジュールをインポートする。
+        """
+        module_name, class_name = spec.split(":")
+        source_file = find_module_file(module_name)
+        if source_file is None:
+            return GameEntry.from_class(import_game_class(spec))
+
+        stat = source_file.stat()
+        cached = self.entries.get(spec)
+        if (
+            cached is not None
+            and cached["source"] == str(source_file)
+            and cached["mtime_ns"] == stat.st_mtime_ns
+            and cached["size"] == stat.st_size
+        ):
+            return self._entry_from_cache(spec, cached)
+
+        metadata = read_class_metadata(source_file, class_name)
+        if metadata is None:
+            return GameEntry.from_class(import_game_class(spec))
+
+        icon_file = None
+        if metadata["icon_path"] is not None:
+            icon_file = source_file.parent / metadata["icon_path"]
+
+        self.entries[spec] = {
+            "source": str(source_file),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "name": metadata["name"],
+            "description": metadata["description"],
+            "icon_file": str(icon_file) if icon_file is not None else None,
+        }
+        self._save()
+        return self._entry_from_cache(spec, self.entries[spec])
+
+    @staticmethod
+    def _entry_from_cache(spec: str, cached: dict) -> GameEntry:
+        """キャッシュの内容から GameEntry を作る"""
+        icon_file = cached["icon_file"]
+        return GameEntry(
+            spec=spec,
+            name=cached["name"],
+            description=cached["description"],
+            icon_file=Path(icon_file) if icon_file is not None else None,
+        )
@@ -7,7 +7,6 @@ MoguraTatakiGame - もぐらたたき
 - 60秒のゲーム時間でスコアを競う
 """
 
-import array
 import math
 import random
 from dataclasses import dataclass
@@ -16,6 +15,9 @@ from pathlib import Path
 
 import pygame
 
+from shared import synth
+from shared.async_sound import SOUND_WAIT_TIMEOUT, AsyncSound, wait_all
+from shared.audio import init_audio
 from shared.base_game import BaseGame
 from shared.components import BackButton
 from shared.constants import (
@@ -30,6 +32,13 @@ from shared.constants import (
     WHITE,
 )
 from shared.fonts import get_font
+from shared.layers import LayerCompositor
+from shared.particles import ParticleSystem
+from shared.scaled_surfaces import scaled_surface
+from shared.sfx import SfxPriority, SfxRule, play_sfx
+from shared.sound_cache import disk_cached_sound
+from shared.sprite_baker import SpriteRenderer, get_sprite_baker
+from shared.text_cache import render_text
 
 
 class GameState(Enum):
@@ -43,6 +52,21 @@ ASSETS_DIR = Path(__file__).parent / "assets"
 SOUNDS_DIR = ASSETS_DIR / "sounds"
 IMAGES_DIR = ASSETS_DIR / "images"
 
+# パーティクルにかかる重力（px/秒^2）
+PARTICLE_GRAVITY: float = 300.0
+
+# パーティクルが消えるまでの時間（秒）
+PARTICLE_LIFE: float = 0.5
+
+# モグラが出てくる音
+POP_SFX = SfxRule(max_concurrent=2, min_interval=0.05)
+
+# モグラをたたいた音
+TAP_SFX = SfxRule(max_concurrent=3, min_interval=0.03)
+
+# 終了のファンファーレ（ゲームの音で埋まっていても必ず鳴らす）
+FINISH_SFX = SfxRule(max_concurrent=1, min_interval=0.0, priority=SfxPriority.UI)
+
 
 @dataclass
 class Hole:
@@ -79,6 +103,7 @@ class MoguraTatakiGame(BaseGame):
     GRID_COLS = 3
     GRID_ROWS = 2
     HOLE_SIZE = 140
+    CHARACTER_SIZE = 100
 
     # タイミング設定
     MIN_SHOW_TIME = 2.0  # 最小表示時間
@@ -112,14 +137,14 @@ class MoguraTatakiGame(BaseGame):
         self.remaining_time = self.GAME_TIME  # 残り時間
 
         # エフェクト
-        self.particles: list[dict] = []
+        self.particles = ParticleSystem(gravity=PARTICLE_GRAVITY)
 
         # サウンド
         self.custom_sounds: dict[str, pygame.mixer.Sound] = {}
-        self.pop_sound: pygame.mixer.Sound | None = None
-        self.tap_sound: pygame.mixer.Sound | None = None
-        self.miss_sound: pygame.mixer.Sound | None = None
-        self.finish_sound: pygame.mixer.Sound | None = None
+        self.pop_sound: AsyncSound | None = None
+        self.tap_sound: AsyncSound | None = None
+        self.miss_sound: AsyncSound | None = None
+        self.finish_sound: AsyncSound | None = None
 
         # カスタム画像
         self.custom_images: dict[str, pygame.Surface] = {}
@@ -142,6 +167,11 @@ class MoguraTatakiGame(BaseGame):
         self.big_font = get_font(72)
         self.button_font = get_font(32)
 
+        # 毎フレーム同じ内容の部分（最初の描画で1回だけ描いて保存する）
+        self.layers = LayerCompositor((self.width, self.height))
+        self.layers.add("background", self._draw_background)
+        self.layers.add("start_screen", self._draw_start_screen, transparent=True)
+
     def _setup_holes(self) -> None:
         """穴をセットアップ"""
         self.holes.clear()
@@ -199,102 +229,70 @@ class MoguraTatakiGame(BaseGame):
                     except pygame.error:
                         pass
 
-    def _create_pop_sound(self) -> pygame.mixer.Sound:
+    @classmethod
+    def prewarm(cls) -> None:
+        """効果音を事前に生成する"""
+        cls.cached_resource("pop_sound", cls._create_pop_sound)
+        cls.cached_resource("tap_sound", cls._create_tap_sound)
+        cls.cached_resource("finish_sound", cls._create_finish_sound)
+
+    @staticmethod
+    @disk_cached_sound
+    def _create_pop_sound() -> pygame.mixer.Sound:
         """ポップアップ音を生成"""
-        sample_rate = 22050
         duration = 0.1
-        samples = int(sample_rate * duration)
-        sound_array = array.array("h")
-
-        for i in range(samples):
-            t = i / sample_rate
-            # 上昇するピッチ
-            freq = 400 + (800 * t / duration)
-            envelope = 1.0 - (t / duration) ** 2
-            value = math.sin(2 * math.pi * freq * t)
-            amplitude = int(12000 * envelope * value)
-            sound_array.append(max(-32767, min(32767, amplitude)))
-
-        sound = pygame.mixer.Sound(buffer=sound_array)
-        sound.set_volume(0.3)
-        return sound
-
-    def _create_tap_sound(self) -> pygame.mixer.Sound:
+        t = synth.timeline(duration)
+        # 上昇するピッチ
+        freq = synth.sweep(400, 1200, duration, t)
+        wave = synth.tone(freq, t) * synth.power_decay(2, duration, t)
+        return synth.to_sound(wave, amplitude=12000, volume=0.3)
+
+    @staticmethod
+    @disk_cached_sound
+    def _create_tap_sound() -> pygame.mixer.Sound:
         """タップ成功音を生成"""
-        sample_rate = 22050
         duration = 0.15
-        samples = int(sample_rate * duration)
-        sound_array = array.array("h")
-
-        for i in range(samples):
-            t = i / sample_rate
-            envelope = 1.0 - (t / duration)
-
-            # 明るい和音
-            value = 0.0
-            for freq in [523, 659, 784]:  # C, E, G
-                value += math.sin(2 * math.pi * freq * t) / 3
-
-            amplitude = int(15000 * envelope * value)
-            sound_array.append(max(-32767, min(32767, amplitude)))
-
-        sound = pygame.mixer.Sound(buffer=sound_array)
-        sound.set_volume(0.35)
-        return sound
+        t = synth.timeline(duration)
+        # 明るい和音
+        wave = synth.chord([523, 659, 784], t)  # C, E, G
+        wave = wave * synth.linear_envelope([(0.0, 1.0), (duration, 0.0)], t)
+        return synth.to_sound(wave, amplitude=15000, volume=0.35)
 
     def _play_pop_sound(self) -> None:
-        """ポップ音を再生"""
-        if "pop" in self.custom_sounds:
-            self.custom_sounds["pop"].play()
-        elif self.pop_sound:
-            self.pop_sound.play()
+        """ポップ音を再生（作成中ならクリック音）"""
+        sound = self.custom_sounds.get("pop")
+        if sound is None and self.pop_sound is not None:
+            sound = self.pop_sound.get()
+        if sound:
+            play_sfx(sound, POP_SFX)
 
     def _play_tap_sound(self) -> None:
-        """タップ音を再生"""
-        if "tap" in self.custom_sounds:
-            self.custom_sounds["tap"].play()
-        elif self.tap_sound:
-            self.tap_sound.play()
-
-    def _create_finish_sound(self) -> pygame.mixer.Sound:
+        """タップ音を再生（作成中ならクリック音）"""
+        sound = self.custom_sounds.get("tap")
+        if sound is None and self.tap_sound is not None:
+            sound = self.tap_sound.get()
+        if sound:
+            play_sfx(sound, TAP_SFX)
+
+    @staticmethod
+    @disk_cached_sound
+    def _create_finish_sound() -> pygame.mixer.Sound:
         """終了音を生成（ファンファーレ風）"""
-        sample_rate = 22050
         duration = 0.8
-        samples = int(sample_rate * duration)
-        sound_array = array.array("h")
-
-        for i in range(samples):
-            t = i / sample_rate
-            envelope = max(0, 1.0 - (t / duration) ** 0.5)
-
-            # 上昇するファンファーレ
-            value = 0.0
-            if t < 0.2:
-                freq = 392  # G
-            elif t < 0.4:
-                freq = 523  # C
-            elif t < 0.6:
-                freq = 659  # E
-            else:
-                freq = 784  # High G
-
-            value = math.sin(2 * math.pi * freq * t)
-            # ハーモニクス追加
-            value += 0.3 * math.sin(2 * math.pi * freq * 2 * t)
-
-            amplitude = int(12000 * envelope * value)
-            sound_array.append(max(-32767, min(32767, amplitude)))
-
-        sound = pygame.mixer.Sound(buffer=sound_array)
-        sound.set_volume(0.4)
-        return sound
+        t = synth.timeline(duration)
+        # 上昇するファンファーレ（G, C, E, High G）+ ハーモニクス
+        freq = synth.steps([392, 523, 659, 784], 0.2, t)
+        wave = synth.tone(freq, t, harmonics=[(1, 1.0), (2, 0.3)])
+        wave = wave * synth.power_decay(0.5, duration, t)
+        return synth.to_sound(wave, amplitude=12000, volume=0.4)
 
     def _play_finish_sound(self) -> None:
-        """終了音を再生"""
-        if "finish" in self.custom_sounds:
-            self.custom_sounds["finish"].play()
-        elif self.finish_sound:
-            self.finish_sound.play()
+        """終了音を再生（結果発表なので、作成中なら完成を待つ）"""
+        sound = self.custom_sounds.get("finish")
+        if sound is None and self.finish_sound is not None:
+            sound = self.finish_sound.wait()
+        if sound:
+            play_sfx(sound, FINISH_SFX)
 
     def _reset_game(self) -> None:
         """ゲームをリセット"""
@@ -334,15 +332,15 @@ class MoguraTatakiGame(BaseGame):
         for _ in range(8):
             angle = random.uniform(0, math.pi * 2)
             speed = random.uniform(100, 200)
-            self.particles.append({
-                "x": float(x),
-                "y": float(y),
-                "vx": math.cos(angle) * speed,
-                "vy": math.sin(angle) * speed,
-                "life": 0.5,
-                "color": color,
-                "size": random.uniform(8, 15),
-            })
+            self.particles.emit(
+                x=x,
+                y=y,
+                vx=math.cos(angle) * speed,
+                vy=math.sin(angle) * speed,
+                size=random.uniform(8, 15),
+                color=color,
+                decay=1 / PARTICLE_LIFE,
+            )
 
     # ========== キャラクター描画 ==========
 
@@ -358,7 +356,7 @@ class MoguraTatakiGame(BaseGame):
         # カスタム画像があれば使用
         if char.image_key in self.custom_images:
             image = self.custom_images[char.image_key]
-            scaled = pygame.transform.scale(image, (size, size))
+            scaled = scaled_surface(image, (size, size))
 
             # クリップして表示
             clip_rect = pygame.Rect(0, size - visible_height, size, visible_height)
@@ -377,64 +375,83 @@ class MoguraTatakiGame(BaseGame):
         size: int,
         visible_height: int,
     ) -> None:
-        """キャラクターをプリミティブで描画"""
-        # 顔（円）
-        face_size = size * 0.8
+        """キャラクターをプリミティブで描画（顔は大きさごとに1回だけ焼き付けて貼る）"""
         face_y = y - visible_height // 2 + size // 4
 
         if visible_height > size * 0.3:
-            pygame.draw.circle(screen, char.color, (x, int(face_y)), int(face_size // 2))
-
-            # 目
-            eye_offset = face_size * 0.2
-            eye_y = face_y - face_size * 0.1
-            pygame.draw.circle(screen, (50, 50, 50), (int(x - eye_offset), int(eye_y)), 6)
-            pygame.draw.circle(screen, (50, 50, 50), (int(x + eye_offset), int(eye_y)), 6)
-            pygame.draw.circle(screen, WHITE, (int(x - eye_offset - 2), int(eye_y - 2)), 2)
-            pygame.draw.circle(screen, WHITE, (int(x + eye_offset - 2), int(eye_y - 2)), 2)
-
-            # 口（笑顔）
-            mouth_y = face_y + face_size * 0.15
-            pygame.draw.arc(
-                screen,
-                (50, 50, 50),
-                (int(x - face_size * 0.2), int(mouth_y - face_size * 0.1),
-                 int(face_size * 0.4), int(face_size * 0.2)),
-                math.pi, 0, 2
-            )
-
-            # 耳（キャラクターによって異なる）
-            if char.image_key in ["rabbit", "cat"]:
-                # 尖った耳
-                ear_size = face_size * 0.3
-                pygame.draw.polygon(
-                    screen, char.color,
-                    [(x - face_size * 0.3, face_y - face_size * 0.3),
-                     (x - face_size * 0.4, face_y - face_size * 0.7),
-                     (x - face_size * 0.15, face_y - face_size * 0.4)]
-                )
-                pygame.draw.polygon(
-                    screen, char.color,
-                    [(x + face_size * 0.3, face_y - face_size * 0.3),
-                     (x + face_size * 0.4, face_y - face_size * 0.7),
-                     (x + face_size * 0.15, face_y - face_size * 0.4)]
-                )
-            elif char.image_key in ["bear", "dog"]:
-                # 丸い耳
-                ear_radius = face_size * 0.15
-                pygame.draw.circle(screen, char.color, (int(x - face_size * 0.35), int(face_y - face_size * 0.35)), int(ear_radius))
-                pygame.draw.circle(screen, char.color, (int(x + face_size * 0.35), int(face_y - face_size * 0.35)), int(ear_radius))
+            key, render, extent = self._character_sprite(char, size)
+            get_sprite_baker().draw(screen, key, (x, face_y), render, extent)
+
+    def _character_sprite(self, char: Character, size: int) -> tuple[tuple, SpriteRenderer, tuple[int, int]]:
+        """キャラクターの顔を焼き付けるときのキー・描画関数・Surface の大きさ"""
+        return (
+            ("mogura", char.image_key, size),
+            lambda surface, x, y: self._draw_character_face(surface, char, x, y, size),
+            (size * 2, size * 2),
+        )
 
-            # 頬（ピンク）
-            cheek_y = face_y + face_size * 0.05
-            pygame.draw.circle(screen, (255, 180, 180), (int(x - face_size * 0.3), int(cheek_y)), 5)
-            pygame.draw.circle(screen, (255, 180, 180), (int(x + face_size * 0.3), int(cheek_y)), 5)
+    def _bake_characters(self) -> None:
+        """画像のないキャラクターの顔を先に焼き付けておく（最初に出てきたときに待たない）"""
+        baker = get_sprite_baker()
+        for char in self.characters:
+            if char.image_key not in self.custom_images:
+                baker.bake(*self._character_sprite(char, self.CHARACTER_SIZE))
 
-    def _draw_hole(self, screen: pygame.Surface, hole: Hole) -> None:
-        """穴を描画"""
-        x, y = hole.x, hole.y
+    def _draw_character_face(
+        self, screen: pygame.Surface, char: Character, x: int, face_y: int, size: int
+    ) -> None:
+        """キャラクターの顔を描画（(x, face_y) が顔の中心）"""
+        # 顔（円）
+        face_size = size * 0.8
+        pygame.draw.circle(screen, char.color, (x, int(face_y)), int(face_size // 2))
+
+        # 目
+        eye_offset = face_size * 0.2
+        eye_y = face_y - face_size * 0.1
+        pygame.draw.circle(screen, (50, 50, 50), (int(x - eye_offset), int(eye_y)), 6)
+        pygame.draw.circle(screen, (50, 50, 50), (int(x + eye_offset), int(eye_y)), 6)
+        pygame.draw.circle(screen, WHITE, (int(x - eye_offset - 2), int(eye_y - 2)), 2)
+        pygame.draw.circle(screen, WHITE, (int(x + eye_offset - 2), int(eye_y - 2)), 2)
+
+        # 口（笑顔）
+        mouth_y = face_y + face_size * 0.15
+        pygame.draw.arc(
+            screen,
+            (50, 50, 50),
+            (int(x - face_size * 0.2), int(mouth_y - face_size * 0.1),
+             int(face_size * 0.4), int(face_size * 0.2)),
+            math.pi, 0, 2
+        )
 
-        # 穴の背景（茶色の楕円）
+        # 耳（キャラクターによって異なる）
+        if char.image_key in ["rabbit", "cat"]:
+            # 尖った耳
+            ear_size = face_size * 0.3
+            pygame.draw.polygon(
+                screen, char.color,
+                [(x - face_size * 0.3, face_y - face_size * 0.3),
+                 (x - face_size * 0.4, face_y - face_size * 0.7),
+                 (x - face_size * 0.15, face_y - face_size * 0.4)]
+            )
+            pygame.draw.polygon(
+                screen, char.color,
+                [(x + face_size * 0.3, face_y - face_size * 0.3),
+                 (x + face_size * 0.4, face_y - face_size * 0.7),
+                 (x + face_size * 0.15, face_y - face_size * 0.4)]
+            )
+        elif char.image_key in ["bear", "dog"]:
+            # 丸い耳
+            ear_radius = face_size * 0.15
+            pygame.draw.circle(screen, char.color, (int(x - face_size * 0.35), int(face_y - face_size * 0.35)), int(ear_radius))
+            pygame.draw.circle(screen, char.color, (int(x + face_size * 0.35), int(face_y - face_size * 0.35)), int(ear_radius))
+
+        # 頬（ピンク）
+        cheek_y = face_y + face_size * 0.05
+        pygame.draw.circle(screen, (255, 180, 180), (int(x - face_size * 0.3), int(cheek_y)), 5)
+        pygame.draw.circle(screen, (255, 180, 180), (int(x + face_size * 0.3), int(cheek_y)), 5)
+
+    def _draw_hole_back(self, screen: pygame.Surface, x: int, y: int) -> None:
+        """穴（キャラクターの後ろ側）を描画"""
         hole_width = self.HOLE_SIZE
         hole_height = self.HOLE_SIZE // 3
 
@@ -452,6 +469,27 @@ class MoguraTatakiGame(BaseGame):
             (x - hole_width // 2, y + 25, hole_width, hole_height)
         )
 
+    def _draw_hole_rim(self, screen: pygame.Surface, x: int, y: int) -> None:
+        """穴の縁（キャラクターの前面）を描画"""
+        hole_width = self.HOLE_SIZE
+        hole_height = self.HOLE_SIZE // 3
+        pygame.draw.ellipse(
+            screen,
+            (100, 80, 50),
+            (x - hole_width // 2, y + 25, hole_width, hole_height),
+            4
+        )
+
+    def _draw_hole(self, screen: pygame.Surface, hole: Hole) -> None:
+        """穴を描画（穴の後ろ側 → キャラクター → 穴の縁の順に重ねる）"""
+        x, y = hole.x, hole.y
+        baker = get_sprite_baker()
+        # 穴の絵はどの穴も同じなので、焼き付けたスプライトを貼る（基準点から下に HOLE_SIZE // 3 + 30 まで描く）
+        extent = (self.HOLE_SIZE + 20, (self.HOLE_SIZE // 3 + 40) * 2)
+
+        # 穴（後ろ側）
+        baker.draw(screen, ("mogura_tataki", "hole_back", self.HOLE_SIZE), (x, y), self._draw_hole_back, extent)
+
         # キャラクター
         if hole.is_active:
             char = self.characters[hole.character_index]
@@ -463,26 +501,26 @@ class MoguraTatakiGame(BaseGame):
                 bounce = math.sin(hole.tap_animation * math.pi) * 30
                 char_y -= bounce
 
-            self._draw_character(screen, char, x, int(char_y), 100, hole.pop_progress)
+            self._draw_character(screen, char, x, int(char_y), self.CHARACTER_SIZE, hole.pop_progress)
 
         # 穴の縁（前面）
-        pygame.draw.ellipse(
-            screen,
-            (100, 80, 50),
-            (x - hole_width // 2, y + 25, hole_width, hole_height),
-            4
-        )
+        baker.draw(screen, ("mogura_tataki", "hole_rim", self.HOLE_SIZE), (x, y), self._draw_hole_rim, extent)
 
     # ========== ゲームロジック ==========
 
     def on_enter(self) -> None:
         """ゲーム開始時の初期化"""
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
+        init_audio()
+
+        # 効果音を取得（ランチャーの待機中に作成済みならそれを使う。まだなら完成を待たずに始める）
+        self.pop_sound = AsyncSound(self.cached_resource_async("pop_sound", self._create_pop_sound))
+        self.tap_sound = AsyncSound(self.cached_resource_async("tap_sound", self._create_tap_sound))
+        self.finish_sound = AsyncSound(
+            self.cached_resource_async("finish_sound", self._create_finish_sound)
+        )
 
-        self.pop_sound = self._create_pop_sound()
-        self.tap_sound = self._create_tap_sound()
-        self.finish_sound = self._create_finish_sound()
+        # キャラクターの顔は起動時に焼き付けておく
+        self._bake_characters()
 
         # スタート画面から開始
         self.game_state = GameState.START
@@ -505,6 +543,11 @@ class MoguraTatakiGame(BaseGame):
                     # スタート画面：スタートボタン
                     if self.game_state == GameState.START:
                         if self.start_button_rect.collidepoint(x, y):
+                            # プレイ中の効果音が揃ってから始める（通常はスタート画面の間に完成している）
+                            wait_all(
+                                [self.pop_sound, self.tap_sound, self.finish_sound],
+                                timeout=SOUND_WAIT_TIMEOUT,
+                            )
                             self.game_state = GameState.PLAYING
                             self._reset_game()
 
@@ -537,13 +580,7 @@ class MoguraTatakiGame(BaseGame):
     def update(self, dt: float) -> None:
         """更新処理"""
         # パーティクル更新（全状態で実行）
-        for particle in self.particles[:]:
-            particle["x"] += particle["vx"] * dt
-            particle["y"] += particle["vy"] * dt
-            particle["vy"] += 300 * dt  # 重力
-            particle["life"] -= dt
-            if particle["life"] <= 0:
-                self.particles.remove(particle)
+        self.particles.update(dt)
 
         # プレイ中以外は他の更新をスキップ
         if self.game_state != GameState.PLAYING:
@@ -588,20 +625,28 @@ class MoguraTatakiGame(BaseGame):
                             hole.is_active = False
                             self.active_count -= 1
 
-    def draw(self) -> None:
-        """描画処理"""
-        # 背景（草原）
-        self.screen.fill((150, 200, 100))
+    def has_active_animation(self) -> bool:
+        """プレイ中とパーティクル表示中はアニメーション中"""
+        return self.game_state == GameState.PLAYING or bool(self.particles)
+
+    def _draw_background(self, screen: pygame.Surface) -> None:
+        """背景（草原）を描画（静的なレイヤー）"""
+        screen.fill((150, 200, 100))
 
         # 背景のグラデーション効果
         for i in range(0, self.height, 20):
-            alpha = 50 - (i / self.height) * 50
-            color = (int(130 + alpha), int(180 + alpha), int(80 + alpha))
-            pygame.draw.rect(self.screen, color, (0, i, self.width, 20))
+            shade = 50 - (i / self.height) * 50
+            color = (int(130 + shade), int(180 + shade), int(80 + shade))
+            pygame.draw.rect(screen, color, (0, i, self.width, 20))
+
+    def draw(self, alpha: float = 1.0) -> None:
+        """描画処理"""
+        # 背景（草原）
+        self.layers.compose(self.screen, ["background"])
 
         # 状態に応じた描画
         if self.game_state == GameState.START:
-            self._draw_start_screen()
+            self.layers.compose(self.screen, ["start_screen"])
         elif self.game_state == GameState.PLAYING:
             self._draw_playing_screen()
         elif self.game_state == GameState.RESULT:
@@ -610,37 +655,37 @@ class MoguraTatakiGame(BaseGame):
         # 戻るボタン（常に表示）
         self.back_button.draw(self.screen)
 
-    def _draw_start_screen(self) -> None:
-        """スタート画面を描画"""
+    def _draw_start_screen(self, screen: pygame.Surface) -> None:
+        """スタート画面を描画（静的なレイヤー）"""
         # タイトル
-        title_text = self.big_font.render("もぐらたたき", True, (60, 80, 40))
+        title_text = render_text(self.big_font, "もぐらたたき", (60, 80, 40))
         title_rect = title_text.get_rect(centerx=self.width // 2, top=120)
 
         # タイトル背景
         bg_rect = title_rect.inflate(60, 30)
-        pygame.draw.rect(self.screen, WHITE, bg_rect, border_radius=20)
-        pygame.draw.rect(self.screen, (100, 150, 80), bg_rect, 4, border_radius=20)
-        self.screen.blit(title_text, title_rect)
+        pygame.draw.rect(screen, WHITE, bg_rect, border_radius=20)
+        pygame.draw.rect(screen, (100, 150, 80), bg_rect, 4, border_radius=20)
+        screen.blit(title_text, title_rect)
 
         # 説明
-        desc_text = self.hint_font.render("30びょうで どうぶつを たくさんタッチしよう！", True, (80, 100, 60))
+        desc_text = render_text(self.hint_font, "30びょうで どうぶつを たくさんタッチしよう！", (80, 100, 60))
         desc_rect = desc_text.get_rect(centerx=self.width // 2, top=title_rect.bottom + 40)
-        self.screen.blit(desc_text, desc_rect)
+        screen.blit(desc_text, desc_rect)
 
         # スタートボタン
-        pygame.draw.rect(self.screen, BABY_GREEN, self.start_button_rect, border_radius=20)
-        pygame.draw.rect(self.screen, (80, 150, 30), self.start_button_rect, 4, border_radius=20)
+        pygame.draw.rect(screen, BABY_GREEN, self.start_button_rect, border_radius=20)
+        pygame.draw.rect(screen, (80, 150, 30), self.start_button_rect, 4, border_radius=20)
 
-        start_text = self.button_font.render("ゲームスタート！", True, WHITE)
+        start_text = render_text(self.button_font, "ゲームスタート！", WHITE)
         start_text_rect = start_text.get_rect(center=self.start_button_rect.center)
-        self.screen.blit(start_text, start_text_rect)
+        screen.blit(start_text, start_text_rect)
 
     def _draw_playing_screen(self) -> None:
         """プレイ画面を描画"""
         # タイマー表示
         seconds = int(self.remaining_time)
         timer_color = BABY_RED if seconds <= 10 else (60, 80, 40)
-        timer_text = self.timer_font.render(f"{seconds}", True, timer_color)
+        timer_text = render_text(self.timer_font, f"{seconds}", timer_color)
         timer_rect = timer_text.get_rect(right=self.width - 30, top=20)
 
         # タイマー背景
@@ -650,7 +695,7 @@ class MoguraTatakiGame(BaseGame):
         self.screen.blit(timer_text, timer_rect)
 
         # スコア表示
-        score_text = self.score_font.render(f"スコア: {self.score}", True, (60, 80, 40))
+        score_text = render_text(self.score_font, f"スコア: {self.score}", (60, 80, 40))
         score_rect = score_text.get_rect(centerx=self.width // 2, top=20)
 
         # スコア背景
@@ -659,20 +704,12 @@ class MoguraTatakiGame(BaseGame):
         pygame.draw.rect(self.screen, (100, 150, 80), score_bg, 3, border_radius=10)
         self.screen.blit(score_text, score_rect)
 
-        # 穴とキャラクター
+        # 穴とキャラクター（キャラクターは穴の縁の後ろから出てくる。穴ごとに後ろ側 → キャラクター → 縁の順）
         for hole in self.holes:
             self._draw_hole(self.screen, hole)
 
         # パーティクル
-        for particle in self.particles:
-            size = int(particle["size"] * (particle["life"] / 0.5))
-            if size > 0:
-                pygame.draw.circle(
-                    self.screen,
-                    particle["color"],
-                    (int(particle["x"]), int(particle["y"])),
-                    size
-                )
+        self.particles.draw(self.screen)
 
     def _draw_result_screen(self) -> None:
         """結果画面を描画"""
@@ -682,12 +719,12 @@ class MoguraTatakiGame(BaseGame):
         self.screen.blit(overlay, (0, 0))
 
         # 結果タイトル
-        result_text = self.big_font.render("けっか", True, (60, 80, 40))
+        result_text = render_text(self.big_font, "けっか", (60, 80, 40))
         result_rect = result_text.get_rect(centerx=self.width // 2, top=150)
         self.screen.blit(result_text, result_rect)
 
         # スコア表示（大きく）
-        score_text = self.big_font.render(f"{self.score} てん", True, BABY_ORANGE)
+        score_text = render_text(self.big_font, f"{self.score} てん", BABY_ORANGE)
         score_rect = score_text.get_rect(centerx=self.width // 2, top=result_rect.bottom + 30)
 
         # スコア背景
@@ -706,7 +743,7 @@ class MoguraTatakiGame(BaseGame):
         else:
             praise = "たのしかったね！"
 
-        praise_text = self.title_font.render(praise, True, BABY_PINK)
+        praise_text = render_text(self.title_font, praise, BABY_PINK)
         praise_rect = praise_text.get_rect(centerx=self.width // 2, top=score_bg.bottom + 30)
         self.screen.blit(praise_text, praise_rect)
 
@@ -714,6 +751,6 @@ class MoguraTatakiGame(BaseGame):
         pygame.draw.rect(self.screen, BABY_BLUE, self.retry_button_rect, border_radius=15)
         pygame.draw.rect(self.screen, (20, 100, 160), self.retry_button_rect, 4, border_radius=15)
 
-        retry_text = self.button_font.render("もういちど", True, WHITE)
+        retry_text = render_text(self.button_font, "もういちど", WHITE)
         retry_text_rect = retry_text.get_rect(center=self.retry_button_rect.center)
         self.screen.blit(retry_text, retry_text_rect)
@@ -9,15 +9,16 @@ OekakiRakugakiGame - お絵かきらくがきアプリ
 - 楽しい音のフィードバック
 """
 
-import array
 import math
-import random
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable
 
 import pygame
 
+from shared import synth
+from shared.async_sound import AsyncSound
+from shared.audio import init_audio
 from shared.base_game import BaseGame
 from shared.components import BackButton
 from shared.constants import (
@@ -32,12 +33,23 @@ from shared.constants import (
     WHITE,
 )
 from shared.fonts import get_font
+from shared.layers import LayerCompositor
+from shared.scaled_surfaces import scaled_surface
+from shared.sfx import SfxPriority, SfxRule, play_sfx
+from shared.sound_cache import disk_cached_sound
+from shared.text_cache import render_text
 
 # アセットディレクトリ
 ASSETS_DIR = Path(__file__).parent / "assets"
 SOUNDS_DIR = ASSETS_DIR / "sounds"
 IMAGES_DIR = ASSETS_DIR / "images"
 
+# ツールバーのボタンの音（指でなぞると続けて鳴るので間隔をあける）
+POP_SFX = SfxRule(max_concurrent=2, min_interval=0.08, priority=SfxPriority.UI)
+
+# スタンプ・全消しの音
+SPARKLE_SFX = SfxRule(max_concurrent=3, min_interval=0.05)
+
 
 @dataclass
 class Stamp:
@@ -55,6 +67,9 @@ class OekakiRakugakiGame(BaseGame):
     description = "自由にお絵かきしよう！"
     icon_path = "assets/icon.png"
 
+    # 描いた部分とタッチしたUIだけを画面に転送する
+    use_dirty_rects = True
+
     # レイアウト定数
     HEADER_HEIGHT = 70
     TOOLBAR_HEIGHT = 110
@@ -105,13 +120,19 @@ class OekakiRakugakiGame(BaseGame):
 
         # サウンド
         self.custom_sounds: dict[str, pygame.mixer.Sound] = {}
-        self.pop_sound: pygame.mixer.Sound | None = None
-        self.sparkle_sound: pygame.mixer.Sound | None = None
+        self.pop_sound: AsyncSound | None = None
+        self.sparkle_sound: AsyncSound | None = None
 
         # カスタムアセット
         self.custom_images: dict[str, pygame.Surface] = {}
         self._load_custom_assets()
 
+        # ヘッダーとツールバー（最初の描画で1回だけ描いて保存する。ツールバーは選択が変わったら描き直す）
+        self.toolbar_rect = pygame.Rect(0, self.height - self.TOOLBAR_HEIGHT, self.width, self.TOOLBAR_HEIGHT)
+        self.layers = LayerCompositor((self.width, self.height))
+        self.layers.add("header", self._draw_header)
+        self.layers.add("toolbar", self._draw_toolbar, rect=self.toolbar_rect)
+
     def _setup_stamps(self) -> list[Stamp]:
         """スタンプをセットアップ"""
         return [
@@ -185,61 +206,48 @@ class OekakiRakugakiGame(BaseGame):
                     except pygame.error:
                         pass
 
-    def _create_pop_sound(self) -> pygame.mixer.Sound:
+    @classmethod
+    def prewarm(cls) -> None:
+        """効果音を事前に生成する"""
+        cls.cached_resource("pop_sound", cls._create_pop_sound)
+        cls.cached_resource("sparkle_sound", cls._create_sparkle_sound)
+
+    @staticmethod
+    @disk_cached_sound
+    def _create_pop_sound() -> pygame.mixer.Sound:
         """ポップ音を生成"""
-        sample_rate = 22050
         duration = 0.05
-        samples = int(sample_rate * duration)
-        sound_array = array.array("h")
-
-        for i in range(samples):
-            t = i / sample_rate
-            envelope = 1.0 - (t / duration)  # 減衰
-            freq = 800 + random.uniform(-50, 50)
-            value = math.sin(2 * math.pi * freq * t)
-            amplitude = int(8000 * envelope * value)
-            sound_array.append(max(-32767, min(32767, amplitude)))
-
-        sound = pygame.mixer.Sound(buffer=sound_array)
-        sound.set_volume(0.3)
-        return sound
-
-    def _create_sparkle_sound(self) -> pygame.mixer.Sound:
+        t = synth.timeline(duration)
+        # 周波数を細かく揺らしてザラついた音にする（synth.noise はゲームの random を使わない）
+        freq = 800 + synth.noise(50, t)
+        wave = synth.tone(freq, t) * synth.linear_envelope([(0.0, 1.0), (duration, 0.0)], t)
+        return synth.to_sound(wave, amplitude=8000, volume=0.3)
+
+    @staticmethod
+    @disk_cached_sound
+    def _create_sparkle_sound() -> pygame.mixer.Sound:
         """キラキラ音を生成"""
-        sample_rate = 22050
         duration = 0.15
-        samples = int(sample_rate * duration)
-        sound_array = array.array("h")
-
-        for i in range(samples):
-            t = i / sample_rate
-            envelope = 1.0 - (t / duration) ** 0.5
-
-            # 複数の高周波を組み合わせ
-            value = 0.0
-            for freq in [1200, 1500, 1800, 2100]:
-                value += math.sin(2 * math.pi * freq * t) * (1.0 / 4)
-
-            amplitude = int(10000 * envelope * value)
-            sound_array.append(max(-32767, min(32767, amplitude)))
-
-        sound = pygame.mixer.Sound(buffer=sound_array)
-        sound.set_volume(0.25)
-        return sound
+        t = synth.timeline(duration)
+        # 複数の高周波を組み合わせ
+        wave = synth.chord([1200, 1500, 1800, 2100], t) * synth.power_decay(0.5, duration, t)
+        return synth.to_sound(wave, amplitude=10000, volume=0.25)
 
     def _play_pop_sound(self) -> None:
-        """ポップ音を再生"""
-        if "pop" in self.custom_sounds:
-            self.custom_sounds["pop"].play()
-        elif self.pop_sound:
-            self.pop_sound.play()
+        """ポップ音を再生（作成中ならクリック音）"""
+        sound = self.custom_sounds.get("pop")
+        if sound is None and self.pop_sound is not None:
+            sound = self.pop_sound.get()
+        if sound:
+            play_sfx(sound, POP_SFX)
 
     def _play_sparkle_sound(self) -> None:
-        """キラキラ音を再生"""
-        if "sparkle" in self.custom_sounds:
-            self.custom_sounds["sparkle"].play()
-        elif self.sparkle_sound:
-            self.sparkle_sound.play()
+        """キラキラ音を再生（作成中ならクリック音）"""
+        sound = self.custom_sounds.get("sparkle")
+        if sound is None and self.sparkle_sound is not None:
+            sound = self.sparkle_sound.get()
+        if sound:
+            play_sfx(sound, SPARKLE_SFX)
 
     # ========== スタンプ描画関数 ==========
 
@@ -306,29 +314,40 @@ class OekakiRakugakiGame(BaseGame):
         # カスタム画像があれば使用
         if stamp.image_key in self.custom_images:
             image = self.custom_images[stamp.image_key]
-            scaled = pygame.transform.scale(image, (stamp_size * 2, stamp_size * 2))
+            scaled = scaled_surface(image, (stamp_size * 2, stamp_size * 2))
             rect = scaled.get_rect(center=(x, y))
             self.canvas.blit(scaled, rect)
         else:
             # プリミティブ描画
             stamp.draw_func(self.canvas, x, y, stamp_size, self.current_color)
 
+        # ハートは下方向に size * 1.2 まで伸びるため余裕をもって登録
+        stamp_rect = pygame.Rect(0, 0, stamp_size * 3, stamp_size * 3)
+        stamp_rect.center = (x, y)
+        self._mark_canvas_dirty(stamp_rect)
+
         self._play_sparkle_sound()
 
+    def _mark_canvas_dirty(self, rect: pygame.Rect) -> None:
+        """キャンバス座標の矩形を画面座標に変換して変化領域に登録"""
+        self.mark_dirty(rect.move(self.canvas_rect.topleft))
+
     # ========== ゲームロジック ==========
 
     def on_enter(self) -> None:
         """ゲーム開始時の初期化"""
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
+        init_audio()
 
-        # サウンド生成
-        self.pop_sound = self._create_pop_sound()
-        self.sparkle_sound = self._create_sparkle_sound()
+        # サウンドを取得（ランチャーの待機中に作成済みならそれを使う。まだなら完成を待たずに始める）
+        self.pop_sound = AsyncSound(self.cached_resource_async("pop_sound", self._create_pop_sound))
+        self.sparkle_sound = AsyncSound(
+            self.cached_resource_async("sparkle_sound", self._create_sparkle_sound)
+        )
 
     def _clear_canvas(self) -> None:
         """キャンバスをクリア"""
         self.canvas.fill(WHITE)
+        self.mark_dirty(self.canvas_rect)
         self._play_sparkle_sound()
 
     def _get_canvas_pos(self, screen_pos: tuple[int, int]) -> tuple[int, int] | None:
@@ -341,6 +360,10 @@ class OekakiRakugakiGame(BaseGame):
     def handle_events(self, events: list[pygame.event.Event]) -> None:
         """イベント処理"""
         for event in events:
+            # 戻るボタンはホバーで色が変わる
+            if event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                self.mark_dirty(self.back_button.rect)
+
             if self.back_button.handle_event(event):
                 continue
 
@@ -352,6 +375,11 @@ class OekakiRakugakiGame(BaseGame):
                 if event.button == 1:
                     x, y = event.pos
 
+                    # ツールバーの選択状態が変わる
+                    if self.toolbar_rect.collidepoint(x, y):
+                        self.layers.invalidate("toolbar")
+                        self.mark_dirty(self.toolbar_rect)
+
                     # クリアボタン
                     if self.clear_rect.collidepoint(x, y):
                         self._clear_canvas()
@@ -390,9 +418,10 @@ class OekakiRakugakiGame(BaseGame):
                             self.is_drawing = True
                             self.last_pos = canvas_pos
                             # 点を描画
-                            pygame.draw.circle(
+                            dot_rect = pygame.draw.circle(
                                 self.canvas, self.current_color, canvas_pos, self.current_size // 2
                             )
+                            self._mark_canvas_dirty(dot_rect)
                             self._play_pop_sound()
 
             elif event.type == pygame.MOUSEBUTTONUP:
@@ -405,7 +434,7 @@ class OekakiRakugakiGame(BaseGame):
                     canvas_pos = self._get_canvas_pos(event.pos)
                     if canvas_pos and self.last_pos:
                         # 線を描画
-                        pygame.draw.line(
+                        line_rect = pygame.draw.line(
                             self.canvas,
                             self.current_color,
                             self.last_pos,
@@ -413,90 +442,103 @@ class OekakiRakugakiGame(BaseGame):
                             self.current_size,
                         )
                         # 端を丸くするため円も描画
-                        pygame.draw.circle(
+                        dot_rect = pygame.draw.circle(
                             self.canvas, self.current_color, canvas_pos, self.current_size // 2
                         )
+                        self._mark_canvas_dirty(line_rect.union(dot_rect))
                         self.last_pos = canvas_pos
 
     def update(self, dt: float) -> None:
         """更新処理（特になし）"""
         pass
 
-    def draw(self) -> None:
-        """描画処理"""
+    def has_active_animation(self) -> bool:
+        """お絵かきは入力があったときしか画面が変わらない"""
+        return False
+
+    def _draw_header(self, screen: pygame.Surface) -> None:
+        """背景・ヘッダー・キャンバスの枠線を描画（静的なレイヤー）"""
         # 背景
-        self.screen.fill((245, 245, 250))
+        screen.fill((245, 245, 250))
 
         # ヘッダー背景
-        pygame.draw.rect(self.screen, (230, 230, 240), (0, 0, self.width, self.HEADER_HEIGHT))
+        pygame.draw.rect(screen, (230, 230, 240), (0, 0, self.width, self.HEADER_HEIGHT))
 
         # タイトル
-        title_text = self.title_font.render("おえかきらくがき", True, (80, 80, 80))
+        title_text = render_text(self.title_font, "おえかきらくがき", (80, 80, 80))
         title_rect = title_text.get_rect(centery=self.HEADER_HEIGHT // 2, left=100)
-        self.screen.blit(title_text, title_rect)
+        screen.blit(title_text, title_rect)
 
         # クリアボタン
-        pygame.draw.rect(self.screen, (220, 100, 100), self.clear_rect, border_radius=8)
-        pygame.draw.rect(self.screen, (180, 80, 80), self.clear_rect, 2, border_radius=8)
-        clear_text = self.button_font.render("クリア", True, WHITE)
+        pygame.draw.rect(screen, (220, 100, 100), self.clear_rect, border_radius=8)
+        pygame.draw.rect(screen, (180, 80, 80), self.clear_rect, 2, border_radius=8)
+        clear_text = render_text(self.button_font, "クリア", WHITE)
         clear_text_rect = clear_text.get_rect(center=self.clear_rect.center)
-        self.screen.blit(clear_text, clear_text_rect)
+        screen.blit(clear_text, clear_text_rect)
 
-        # キャンバス（枠線付き）
-        pygame.draw.rect(self.screen, (200, 200, 200), self.canvas_rect.inflate(4, 4), border_radius=5)
-        self.screen.blit(self.canvas, self.canvas_rect)
+        # キャンバスの枠線
+        pygame.draw.rect(screen, (200, 200, 200), self.canvas_rect.inflate(4, 4), border_radius=5)
 
+    def _draw_toolbar(self, screen: pygame.Surface) -> None:
+        """ツールバー（色・サイズ・スタンプの選択）を描画（静的なレイヤー）"""
         # ツールバー背景
-        toolbar_rect = pygame.Rect(0, self.height - self.TOOLBAR_HEIGHT, self.width, self.TOOLBAR_HEIGHT)
-        pygame.draw.rect(self.screen, (230, 230, 240), toolbar_rect)
+        pygame.draw.rect(screen, (230, 230, 240), self.toolbar_rect)
 
         # 色パレット
         for i, rect in enumerate(self.color_rects):
             color = BABY_COLORS[i]
-            pygame.draw.rect(self.screen, color, rect, border_radius=8)
+            pygame.draw.rect(screen, color, rect, border_radius=8)
 
             # 選択中の色は枠線を太く
             if color == self.current_color and not self.is_stamp_mode:
-                pygame.draw.rect(self.screen, (50, 50, 50), rect, 4, border_radius=8)
+                pygame.draw.rect(screen, (50, 50, 50), rect, 4, border_radius=8)
             else:
-                pygame.draw.rect(self.screen, (150, 150, 150), rect, 2, border_radius=8)
+                pygame.draw.rect(screen, (150, 150, 150), rect, 2, border_radius=8)
 
         # サイズボタン
         for i, rect in enumerate(self.size_rects):
             # 背景
             bg_color = (200, 200, 210) if self.current_size == self.PEN_SIZES[i] and not self.is_stamp_mode else (240, 240, 245)
-            pygame.draw.rect(self.screen, bg_color, rect, border_radius=8)
+            pygame.draw.rect(screen, bg_color, rect, border_radius=8)
 
             # 枠線
             border_color = (50, 50, 50) if self.current_size == self.PEN_SIZES[i] and not self.is_stamp_mode else (150, 150, 150)
             border_width = 3 if self.current_size == self.PEN_SIZES[i] and not self.is_stamp_mode else 2
-            pygame.draw.rect(self.screen, border_color, rect, border_width, border_radius=8)
+            pygame.draw.rect(screen, border_color, rect, border_width, border_radius=8)
 
             # サイズ表示（円）
             pygame.draw.circle(
-                self.screen, (80, 80, 80), rect.center, self.PEN_SIZES[i] // 2
+                screen, (80, 80, 80), rect.center, self.PEN_SIZES[i] // 2
             )
 
         # スタンプボタン
         for i, rect in enumerate(self.stamp_rects):
             # 背景
             bg_color = (200, 200, 210) if self.is_stamp_mode and self.selected_stamp_index == i else (240, 240, 245)
-            pygame.draw.rect(self.screen, bg_color, rect, border_radius=8)
+            pygame.draw.rect(screen, bg_color, rect, border_radius=8)
 
             # 枠線
             border_color = (50, 50, 50) if self.is_stamp_mode and self.selected_stamp_index == i else (150, 150, 150)
             border_width = 3 if self.is_stamp_mode and self.selected_stamp_index == i else 2
-            pygame.draw.rect(self.screen, border_color, rect, border_width, border_radius=8)
+            pygame.draw.rect(screen, border_color, rect, border_width, border_radius=8)
 
             # スタンプアイコン
             stamp = self.stamps[i]
             if stamp.image_key in self.custom_images:
                 image = self.custom_images[stamp.image_key]
-                scaled = pygame.transform.scale(image, (30, 30))
+                scaled = scaled_surface(image, (30, 30))
                 img_rect = scaled.get_rect(center=rect.center)
-                self.screen.blit(scaled, img_rect)
+                screen.blit(scaled, img_rect)
             else:
-                stamp.draw_func(self.screen, rect.centerx, rect.centery, 15, BABY_COLORS[i % len(BABY_COLORS)])
+                stamp.draw_func(screen, rect.centerx, rect.centery, 15, BABY_COLORS[i % len(BABY_COLORS)])
+
+    def draw(self, alpha: float = 1.0) -> None:
+        """描画処理"""
+        # 背景・ヘッダー・ツールバー
+        self.layers.compose(self.screen)
+
+        # キャンバス
+        self.screen.blit(self.canvas, self.canvas_rect)
 
         # 戻るボタン
         self.back_button.draw(self.screen)
@@ -8,13 +8,15 @@ Oekaki Rakugaki - 単体実行用エントリーポイント
 import pygame
 
 from apps.oekaki_rakugaki.game import OekakiRakugakiGame
+from shared.audio import init_audio, pre_init_audio
 from shared.constants import DEFAULT_HEIGHT, DEFAULT_WIDTH
 
 
 def main() -> None:
     """ゲームを単体で起動"""
+    pre_init_audio()
     pygame.init()
-    pygame.mixer.init()
+    init_audio()
 
     screen = pygame.display.set_mode((DEFAULT_WIDTH, DEFAULT_HEIGHT))
     pygame.display.set_caption("おえかきらくがき")
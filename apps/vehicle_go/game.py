@@ -7,15 +7,16 @@ VehicleGoGame - 乗り物をタップして走らせるゲーム
 - 楽しいアニメーションとエフェクト
 """
 
-import array
 import math
 import random
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Callable
 
 import pygame
 
+from shared import synth
+from shared.audio import init_audio
 from shared.base_game import BaseGame
 from shared.components import BackButton
 from shared.constants import (
@@ -30,24 +31,144 @@ from shared.constants import (
     WHITE,
 )
 from shared.fonts import get_font
+from shared.layers import LayerCompositor
+from shared.particles import ParticleSystem
+from shared.scaled_surfaces import scaled_surface
+from shared.sfx import SfxRule, play_sfx
+from shared.sound_cache import disk_cached_sound
+from shared.sprite_baker import get_sprite_baker
+from shared.streaming_voice import StreamingVoice
+from shared.text_cache import render_text
 
 # アセットディレクトリ
 ASSETS_DIR = Path(__file__).parent / "assets"
 SOUNDS_DIR = ASSETS_DIR / "sounds"
 IMAGES_DIR = ASSETS_DIR / "images"
 
-
-@dataclass
-class Particle:
-    """パーティクルエフェクト"""
-    x: float
-    y: float
-    vx: float
-    vy: float
-    life: float
-    max_life: float
-    color: tuple[int, int, int]
-    size: float
+# 乗り物の音（長いので、同じ乗り物の音は1つだけ鳴らす）
+VEHICLE_SFX = SfxRule(max_concurrent=1, min_interval=0.25)
+
+# サイレンを鳴らす乗り物（それ以外はエンジン音を走行に合わせて鳴らし続ける）
+SIREN_VEHICLES: tuple[str, ...] = ("firetruck", "ambulance")
+
+# エンジン音の倍音（周波数の倍率, 音量）と 16bit 換算の振幅（倍音の音量の合計で割る）
+ENGINE_HARMONICS: tuple[tuple[float, float], ...] = ((1, 1.0), (1.5, 0.5), (2, 0.3))
+ENGINE_AMPLITUDE: float = 15000 * 0.4 / 1.8
+
+# 船のエンジン音（警笛と同じ低い音）
+SHIP_HARMONICS: tuple[tuple[float, float], ...] = ((1, 1.0), (2, 0.3))
+SHIP_AMPLITUDE: float = 20000 * 0.4 / 1.3
+
+# エンジン音の振動（音量の揺れ）の速さ（Hz）と深さ
+ENGINE_TREMOLO_RATE: float = 8
+ENGINE_TREMOLO_DEPTH: float = 0.2
+
+# 走り出しの音の高さ（sound_freq に対する倍率。ここから速さに合わせて上がる）
+ENGINE_IDLE_PITCH: float = 0.6
+
+# 1ブロックごとに目標の高さへ近づける割合（小さいほどゆっくり変わる）
+ENGINE_GLIDE: float = 0.35
+
+# この速さ（px/s）で音量が最大になる（遅い乗り物は少し小さく鳴る）
+ENGINE_FULL_VOLUME_SPEED: float = 550
+
+# 画面の外で音を小さくしていく距離（px）
+ENGINE_FADE_DISTANCE: float = 200
+
+
+# 焼き付ける車輪の回転角の刻み（度。スポークの絵は 90 度ごとに同じになる）
+WHEEL_ANGLE_STEP: int = 3
+
+# エンジン音などの周波数（画像/音声キー → Hz）
+VEHICLE_SOUND_FREQS: dict[str, float] = {
+    "car": 150,
+    "bus": 100,
+    "train": 80,
+    "firetruck": 400,
+    "airplane": 200,
+    "ambulance": 450,
+    "motorcycle": 250,
+    "ship": 60,
+}
+
+
+class EngineSound:
+    """
+    乗り物の速さと位置に合わせてエンジン音のブロックを生成する（StreamingVoice の音源）
+
+    音の高さ・音量・左右の位置は、ブロックの中で前のブロックの終わりの値から
+    目標の値へ直線的に変えるので、ブロックの境目で音が途切れない。
+    """
+
+    def __init__(
+        self,
+        freq: float,
+        harmonics: tuple[tuple[float, float], ...] = ENGINE_HARMONICS,
+        amplitude: float = ENGINE_AMPLITUDE,
+        tremolo_depth: float = ENGINE_TREMOLO_DEPTH,
+    ) -> None:
+        self.harmonics = harmonics
+        self.amplitude = amplitude
+        self.tremolo_depth = tremolo_depth
+
+        # 前のブロックの終わりの値
+        self.freq = freq * ENGINE_IDLE_PITCH
+        self.level = 0.0
+        self.pan = -1.0
+        self._phase = 0.0
+        self._time = 0.0
+
+        # set_target() で指定した目標の値
+        self._target_freq = self.freq
+        self._target_level = 0.0
+        self._target_pan = -1.0
+
+    def set_target(self, freq: float, level: float, pan: float) -> None:
+        """
+        次のブロックで目指す音を設定する
+
+        Args:
+            freq: 周波数（Hz）
+            level: 音量（0.0〜1.0）
+            pan: 左右の位置（-1.0: 左 〜 1.0: 右）
+        """
+        self._target_freq = freq
+        self._target_level = level
+        self._target_pan = pan
+
+    def render(self, duration: float) -> pygame.mixer.Sound:
+        """duration 秒分のブロックを生成する（StreamingVoice のスレッドから呼ばれる）"""
+        # 生成中に set_target() が呼ばれても、ブロックの中では同じ目標を使う
+        target_freq, target_level, target_pan = self._target_freq, self._target_level, self._target_pan
+        t = synth.timeline(duration)
+        length = len(t) / synth.get_mixer_format()[0]  # 実際のブロックの長さ
+
+        freq = self.freq + (target_freq - self.freq) * ENGINE_GLIDE
+        wave = synth.partials(synth.glide(self.freq, freq, duration, t, self._phase), self.harmonics)
+        if self.tremolo_depth:
+            wave = wave * synth.tremolo(ENGINE_TREMOLO_RATE, self.tremolo_depth, t + self._time)
+        # 直線の変化は linear_envelope() を使わず四則演算で求める（純 Python でも速い）
+        wave = wave * (self.level + t * ((target_level - self.level) / duration))
+        pan = self.pan + t * ((target_pan - self.pan) / duration)
+
+        # 次のブロックは、このブロックの最後のサンプルの続きから始める
+        self._phase = synth.glide(self.freq, freq, duration, length, self._phase)
+        self._time += length
+        self.freq = freq
+        self.level = target_level
+        self.pan = target_pan
+
+        return pygame.mixer.Sound(buffer=synth.to_samples(wave, self.amplitude, pan=pan))
+
+
+@dataclass(frozen=True)
+class VehiclePose:
+    """乗り物の絵の動く部分（焼き付けたスプライトのキーに使う）"""
+
+    wheel_angle: int = 0  # 車輪の回転角（度。WHEEL_ANGLE_STEP 刻みで 0〜89）
+    light_on: bool = False  # 警告灯の点滅（True なら明るい色）
+    wave_phase: int = 0  # 波の模様の横のずれ（px）
+    bob: float = 0.0  # 絵全体の上下の揺れ（px。貼る位置をずらすだけなので絵は変わらない）
 
 
 @dataclass
@@ -62,6 +183,7 @@ class Vehicle:
     movement_type: str  # "horizontal", "diagonal_up", "wave"
     draw_func: Callable  # 描画関数
     y_offset: float = 0  # Y座標オフセット
+    pose_func: Callable[[], VehiclePose] | None = None  # 絵の動く部分を返す関数（None なら動かない）
 
 
 class VehicleGoGame(BaseGame):
@@ -86,15 +208,19 @@ class VehicleGoGame(BaseGame):
         self.running_vehicle: Vehicle | None = None
         self.vehicle_x: float = -200
         self.vehicle_y: float = 0
+        self.prev_vehicle_x: float = -200  # 描画補間用の前回位置
+        self.prev_vehicle_y: float = 0
         self.is_running: bool = False
         self.wheel_rotation: float = 0
 
         # パーティクル
-        self.particles: list[Particle] = []
+        self.particles = ParticleSystem(fade=True)
 
         # サウンド
         self.sounds: dict[str, pygame.mixer.Sound] = {}
         self.current_sound: pygame.mixer.Sound | None = None
+        self.engine_voice: StreamingVoice | None = None  # on_enter() で作る
+        self.engine_sound: EngineSound | None = None  # 走行中のエンジン音
 
         # UI
         self.back_button = BackButton(x=20, y=20, on_click=self.request_return_to_launcher)
@@ -112,6 +238,10 @@ class VehicleGoGame(BaseGame):
         # アニメーション領域
         self.animation_area_y = self.height - 200
 
+        # タイトル・乗り物選択グリッド・走る場所の背景（最初の描画で1回だけ描いて保存する）
+        self.layers = LayerCompositor((self.width, self.height))
+        self.layers.add("background", self._draw_background)
+
     def _setup_vehicles(self) -> None:
         """乗り物データをセットアップ"""
         self.vehicles = [
@@ -120,17 +250,18 @@ class VehicleGoGame(BaseGame):
                 image_key="car",
                 color=BABY_RED,
                 secondary_color=(200, 50, 50),
-                sound_freq=150,
+                sound_freq=VEHICLE_SOUND_FREQS["car"],
                 speed=400,
                 movement_type="horizontal",
                 draw_func=self._draw_car,
+                pose_func=self._wheel_pose,
             ),
             Vehicle(
                 name="バス",
                 image_key="bus",
                 color=BABY_YELLOW,
                 secondary_color=(200, 180, 50),
-                sound_freq=100,
+                sound_freq=VEHICLE_SOUND_FREQS["bus"],
                 speed=300,
                 movement_type="horizontal",
                 draw_func=self._draw_bus,
@@ -140,7 +271,7 @@ class VehicleGoGame(BaseGame):
                 image_key="train",
                 color=BABY_GREEN,
                 secondary_color=(50, 180, 50),
-                sound_freq=80,
+                sound_freq=VEHICLE_SOUND_FREQS["train"],
                 speed=350,
                 movement_type="horizontal",
                 draw_func=self._draw_train,
@@ -150,17 +281,18 @@ class VehicleGoGame(BaseGame):
                 image_key="firetruck",
                 color=(220, 50, 50),
                 secondary_color=(180, 180, 180),
-                sound_freq=400,
+                sound_freq=VEHICLE_SOUND_FREQS["firetruck"],
                 speed=450,
                 movement_type="horizontal",
                 draw_func=self._draw_firetruck,
+                pose_func=lambda: self._light_pose(200),
             ),
             Vehicle(
                 name="ひこうき",
                 image_key="airplane",
                 color=WHITE,
                 secondary_color=BABY_BLUE,
-                sound_freq=200,
+                sound_freq=VEHICLE_SOUND_FREQS["airplane"],
                 speed=500,
                 movement_type="diagonal_up",
                 draw_func=self._draw_airplane,
@@ -171,30 +303,33 @@ class VehicleGoGame(BaseGame):
                 image_key="ambulance",
                 color=WHITE,
                 secondary_color=BABY_RED,
-                sound_freq=450,
+                sound_freq=VEHICLE_SOUND_FREQS["ambulance"],
                 speed=500,
                 movement_type="horizontal",
                 draw_func=self._draw_ambulance,
+                pose_func=lambda: self._light_pose(150),
             ),
             Vehicle(
                 name="バイク",
                 image_key="motorcycle",
                 color=BABY_PURPLE,
                 secondary_color=(100, 100, 100),
-                sound_freq=250,
+                sound_freq=VEHICLE_SOUND_FREQS["motorcycle"],
                 speed=550,
                 movement_type="horizontal",
                 draw_func=self._draw_motorcycle,
+                pose_func=self._wheel_pose,
             ),
             Vehicle(
                 name="ふね",
                 image_key="ship",
                 color=BABY_BLUE,
                 secondary_color=(200, 150, 100),
-                sound_freq=60,
+                sound_freq=VEHICLE_SOUND_FREQS["ship"],
                 speed=200,
                 movement_type="wave",
                 draw_func=self._draw_ship,
+                pose_func=self._ship_pose,
                 y_offset=30,
             ),
         ]
@@ -250,82 +385,26 @@ class VehicleGoGame(BaseGame):
                     except pygame.error:
                         pass
 
-    def _create_engine_sound(self, freq: float, duration: float = 1.5) -> pygame.mixer.Sound:
-        """エンジン音を生成"""
-        sample_rate = 22050
-        samples = int(sample_rate * duration)
-        sound_array = array.array("h")
-
-        for i in range(samples):
-            t = i / sample_rate
-            # エンベロープ
-            if t < 0.1:
-                envelope = t / 0.1
-            elif t < duration - 0.3:
-                envelope = 1.0
-            else:
-                envelope = (duration - t) / 0.3
-
-            # エンジン音（複数の周波数を組み合わせ）
-            value = math.sin(2 * math.pi * freq * t)
-            value += 0.5 * math.sin(2 * math.pi * freq * 1.5 * t)
-            value += 0.3 * math.sin(2 * math.pi * freq * 2 * t)
-            # 振動感を追加
-            value *= 1 + 0.2 * math.sin(2 * math.pi * 8 * t)
-
-            amplitude = int(15000 * envelope * value / 1.8)
-            sound_array.append(max(-32767, min(32767, amplitude)))
+    @classmethod
+    def prewarm(cls) -> None:
+        """サイレンの音を事前に生成する（エンジン音は走行中に生成する）"""
+        cls._get_siren_sound()
 
-        sound = pygame.mixer.Sound(buffer=sound_array)
-        sound.set_volume(0.4)
-        return sound
+    @classmethod
+    def _get_siren_sound(cls) -> pygame.mixer.Sound:
+        """サイレンの音を取得する（生成済みなら共有キャッシュから）"""
+        return cls.cached_resource("siren_sound", lambda: cls._create_siren_sound(400, 500))
 
-    def _create_siren_sound(self, freq1: float, freq2: float) -> pygame.mixer.Sound:
+    @staticmethod
+    @disk_cached_sound
+    def _create_siren_sound(freq1: float, freq2: float) -> pygame.mixer.Sound:
         """サイレン音を生成（消防車・救急車用）"""
-        sample_rate = 22050
         duration = 2.0
-        samples = int(sample_rate * duration)
-        sound_array = array.array("h")
-
-        for i in range(samples):
-            t = i / sample_rate
-            # サイレンの周波数を切り替え
-            cycle = (t * 2) % 1.0
-            freq = freq1 if cycle < 0.5 else freq2
-
-            envelope = 1.0 if t < duration - 0.2 else (duration - t) / 0.2
-            value = math.sin(2 * math.pi * freq * t)
-            amplitude = int(18000 * envelope * value)
-            sound_array.append(max(-32767, min(32767, amplitude)))
-
-        sound = pygame.mixer.Sound(buffer=sound_array)
-        sound.set_volume(0.35)
-        return sound
-
-    def _create_horn_sound(self, freq: float) -> pygame.mixer.Sound:
-        """警笛音を生成（船用）"""
-        sample_rate = 22050
-        duration = 1.5
-        samples = int(sample_rate * duration)
-        sound_array = array.array("h")
-
-        for i in range(samples):
-            t = i / sample_rate
-            if t < 0.2:
-                envelope = t / 0.2
-            elif t < duration - 0.5:
-                envelope = 1.0
-            else:
-                envelope = (duration - t) / 0.5
-
-            value = math.sin(2 * math.pi * freq * t)
-            value += 0.3 * math.sin(2 * math.pi * freq * 2 * t)
-            amplitude = int(20000 * envelope * value / 1.3)
-            sound_array.append(max(-32767, min(32767, amplitude)))
-
-        sound = pygame.mixer.Sound(buffer=sound_array)
-        sound.set_volume(0.4)
-        return sound
+        t = synth.timeline(duration)
+        # サイレンの周波数を 0.5 秒周期で切り替え
+        freq = synth.alternate(freq1, freq2, 2, t)
+        envelope = synth.linear_envelope([(0.0, 1.0), (duration - 0.2, 1.0), (duration, 0.0)], t)
+        return synth.to_sound(synth.tone(freq, t) * envelope, amplitude=18000, volume=0.35)
 
     def _start_vehicle(self, vehicle: Vehicle) -> None:
         """乗り物を走らせる"""
@@ -335,63 +414,87 @@ class VehicleGoGame(BaseGame):
         self.running_vehicle = vehicle
         self.vehicle_x = -200
         self.vehicle_y = self.animation_area_y + vehicle.y_offset
+        self.prev_vehicle_x = self.vehicle_x
+        self.prev_vehicle_y = self.vehicle_y
         self.is_running = True
         self.wheel_rotation = 0
         self.particles.clear()
 
-        # サウンド再生（カスタム音声があれば使用）
-        if vehicle.image_key in self.custom_sounds:
-            self.current_sound = self.custom_sounds[vehicle.image_key]
-        elif vehicle.image_key in ["firetruck", "ambulance"]:
-            self.current_sound = self._create_siren_sound(400, 500)
-        elif vehicle.image_key == "ship":
-            self.current_sound = self._create_horn_sound(vehicle.sound_freq)
+        # カスタム音声とサイレンは1回鳴らす（エンジン音は走行に合わせて鳴らし続ける）
+        key = vehicle.image_key
+        if key in self.custom_sounds:
+            self.current_sound = self.custom_sounds[key]
+        elif key in SIREN_VEHICLES:
+            self.current_sound = self._get_siren_sound()
+        else:
+            if self.engine_voice is not None:
+                self._start_engine_sound(vehicle)
+            return
+        play_sfx(self.current_sound, VEHICLE_SFX)
+
+    def _start_engine_sound(self, vehicle: Vehicle) -> None:
+        """エンジン音のストリーミング再生を始める"""
+        if vehicle.image_key == "ship":
+            self.engine_sound = EngineSound(
+                vehicle.sound_freq, SHIP_HARMONICS, SHIP_AMPLITUDE, tremolo_depth=0.0
+            )
         else:
-            self.current_sound = self._create_engine_sound(vehicle.sound_freq)
-        self.current_sound.play()
+            self.engine_sound = EngineSound(vehicle.sound_freq)
+        self._update_engine_sound(vehicle, vehicle.speed)
+        self.engine_voice.start(self.engine_sound.render)
+
+    def _update_engine_sound(self, vehicle: Vehicle, speed: float) -> None:
+        """エンジン音の高さ・音量・左右の位置を乗り物の速さと位置に合わせる"""
+        speed_ratio = speed / vehicle.speed
+        # 画面の外では離れるほど小さくする
+        outside = max(-self.vehicle_x, self.vehicle_x - self.width, 0.0)
+        fade = max(0.0, 1.0 - outside / ENGINE_FADE_DISTANCE)
+        level = min(1.0, 0.5 + 0.5 * speed / ENGINE_FULL_VOLUME_SPEED) * fade
+        pan = max(-1.0, min(1.0, self.vehicle_x / self.width * 2 - 1))
+        self.engine_sound.set_target(vehicle.sound_freq * speed_ratio, level, pan)
+
+    def _stop_engine_sound(self) -> None:
+        """エンジン音を止める"""
+        if self.engine_voice is not None:
+            self.engine_voice.stop()
+        self.engine_sound = None
 
     def _spawn_particle(self, x: float, y: float, particle_type: str) -> None:
         """パーティクルを生成"""
         if particle_type == "exhaust":
-            particle = Particle(
+            self.particles.emit(
                 x=x,
                 y=y,
                 vx=random.uniform(-30, -10),
                 vy=random.uniform(-20, 20),
-                life=0.8,
-                max_life=0.8,
-                color=(150, 150, 150),
                 size=random.uniform(5, 15),
+                color=(150, 150, 150),
+                decay=1 / 0.8,
             )
         elif particle_type == "water":
-            particle = Particle(
+            self.particles.emit(
                 x=x,
                 y=y,
                 vx=random.uniform(-50, -20),
                 vy=random.uniform(-30, 10),
-                life=0.6,
-                max_life=0.6,
-                color=(150, 200, 255),
                 size=random.uniform(3, 8),
+                color=(150, 200, 255),
+                decay=1 / 0.6,
             )
         elif particle_type == "cloud":
-            particle = Particle(
+            self.particles.emit(
                 x=x,
                 y=y,
                 vx=random.uniform(-20, 0),
                 vy=random.uniform(-10, 10),
-                life=1.0,
-                max_life=1.0,
-                color=(255, 255, 255),
                 size=random.uniform(10, 20),
+                color=(255, 255, 255),
+                decay=1.0,
             )
-        else:
-            return
-        self.particles.append(particle)
 
     # ========== 乗り物の描画関数 ==========
 
-    def _draw_car(self, screen: pygame.Surface, x: float, y: float, size: float, vehicle: Vehicle) -> None:
+    def _draw_car(self, screen: pygame.Surface, x: float, y: float, size: float, vehicle: Vehicle, pose: VehiclePose) -> None:
         """車を描画"""
         # ボディ
         body_rect = pygame.Rect(x - size // 2, y - size // 4, size, size // 2)
@@ -423,12 +526,12 @@ class VehicleGoGame(BaseGame):
         for wheel_x in [wheel1_x, wheel2_x]:
             spoke_len = wheel_radius - 3
             for angle in [0, 90, 180, 270]:
-                rad = math.radians(angle + self.wheel_rotation)
+                rad = math.radians(angle + pose.wheel_angle)
                 sx = wheel_x + math.cos(rad) * spoke_len
                 sy = wheel_y + math.sin(rad) * spoke_len
                 pygame.draw.line(screen, (150, 150, 150), (int(wheel_x), int(wheel_y)), (int(sx), int(sy)), 2)
 
-    def _draw_bus(self, screen: pygame.Surface, x: float, y: float, size: float, vehicle: Vehicle) -> None:
+    def _draw_bus(self, screen: pygame.Surface, x: float, y: float, size: float, vehicle: Vehicle, pose: VehiclePose) -> None:
         """バスを描画"""
         # ボディ（長方形）
         body_rect = pygame.Rect(x - size * 0.6, y - size // 3, size * 1.2, size * 0.6)
@@ -446,7 +549,7 @@ class VehicleGoGame(BaseGame):
         pygame.draw.circle(screen, (50, 50, 50), (int(x - size * 0.4), int(y + size // 4)), wheel_radius)
         pygame.draw.circle(screen, (50, 50, 50), (int(x + size * 0.4), int(y + size // 4)), wheel_radius)
 
-    def _draw_train(self, screen: pygame.Surface, x: float, y: float, size: float, vehicle: Vehicle) -> None:
+    def _draw_train(self, screen: pygame.Surface, x: float, y: float, size: float, vehicle: Vehicle, pose: VehiclePose) -> None:
         """電車を描画"""
         car_width = size * 0.5
         car_height = size * 0.4
@@ -471,7 +574,7 @@ class VehicleGoGame(BaseGame):
             pygame.draw.circle(screen, (50, 50, 50), (int(cx + car_width // 4), int(y + car_height // 2)), size // 12)
             pygame.draw.circle(screen, (50, 50, 50), (int(cx + car_width * 3 // 4), int(y + car_height // 2)), size // 12)
 
-    def _draw_firetruck(self, screen: pygame.Surface, x: float, y: float, size: float, vehicle: Vehicle) -> None:
+    def _draw_firetruck(self, screen: pygame.Surface, x: float, y: float, size: float, vehicle: Vehicle, pose: VehiclePose) -> None:
         """消防車を描画"""
         # ボディ
         body_rect = pygame.Rect(x - size // 2, y - size // 4, size, size // 2)
@@ -489,14 +592,14 @@ class VehicleGoGame(BaseGame):
         pygame.draw.rect(screen, vehicle.secondary_color, (x - size * 0.4, y - size // 3, size * 0.6, size // 10))
 
         # 警告灯
-        light_color = (255, 100, 100) if (pygame.time.get_ticks() // 200) % 2 == 0 else (255, 200, 200)
+        light_color = (255, 100, 100) if pose.light_on else (255, 200, 200)
         pygame.draw.circle(screen, light_color, (int(x + size // 3), int(y - size // 2 - 10)), 8)
 
         # 車輪
         pygame.draw.circle(screen, (50, 50, 50), (int(x - size // 3), int(y + size // 4)), size // 7)
         pygame.draw.circle(screen, (50, 50, 50), (int(x + size // 4), int(y + size // 4)), size // 7)
 
-    def _draw_airplane(self, screen: pygame.Surface, x: float, y: float, size: float, vehicle: Vehicle) -> None:
+    def _draw_airplane(self, screen: pygame.Surface, x: float, y: float, size: float, vehicle: Vehicle, pose: VehiclePose) -> None:
         """飛行機を描画"""
         # 機体
         body_points = [
@@ -538,7 +641,7 @@ class VehicleGoGame(BaseGame):
             wx = x + size // 4 - i * (size // 6)
             pygame.draw.circle(screen, (200, 230, 255), (int(wx), int(y)), 5)
 
-    def _draw_ambulance(self, screen: pygame.Surface, x: float, y: float, size: float, vehicle: Vehicle) -> None:
+    def _draw_ambulance(self, screen: pygame.Surface, x: float, y: float, size: float, vehicle: Vehicle, pose: VehiclePose) -> None:
         """救急車を描画"""
         # ボディ
         body_rect = pygame.Rect(x - size // 2, y - size // 4, size, size // 2)
@@ -554,14 +657,14 @@ class VehicleGoGame(BaseGame):
         pygame.draw.rect(screen, vehicle.secondary_color, (x - cross_size, y - size // 6 - cross_size // 2, cross_size * 2, cross_size))
 
         # 警告灯
-        light_color = (255, 50, 50) if (pygame.time.get_ticks() // 150) % 2 == 0 else (50, 50, 255)
+        light_color = (255, 50, 50) if pose.light_on else (50, 50, 255)
         pygame.draw.circle(screen, light_color, (int(x), int(y - size // 4 - 10)), 8)
 
         # 車輪
         pygame.draw.circle(screen, (50, 50, 50), (int(x - size // 3), int(y + size // 4)), size // 7)
         pygame.draw.circle(screen, (50, 50, 50), (int(x + size // 3), int(y + size // 4)), size // 7)
 
-    def _draw_motorcycle(self, screen: pygame.Surface, x: float, y: float, size: float, vehicle: Vehicle) -> None:
+    def _draw_motorcycle(self, screen: pygame.Surface, x: float, y: float, size: float, vehicle: Vehicle, pose: VehiclePose) -> None:
         """バイクを描画"""
         # フレーム
         frame_points = [
@@ -589,17 +692,13 @@ class VehicleGoGame(BaseGame):
         # スポーク
         for wheel_x in [x - size // 3, x + size // 4]:
             for angle in range(0, 360, 45):
-                rad = math.radians(angle + self.wheel_rotation)
+                rad = math.radians(angle + pose.wheel_angle)
                 sx = wheel_x + math.cos(rad) * (wheel_radius - 3)
                 sy = y + size // 6 + math.sin(rad) * (wheel_radius - 3)
                 pygame.draw.line(screen, (150, 150, 150), (int(wheel_x), int(y + size // 6)), (int(sx), int(sy)), 2)
 
-    def _draw_ship(self, screen: pygame.Surface, x: float, y: float, size: float, vehicle: Vehicle) -> None:
-        """船を描画"""
-        # 波のアニメーション
-        wave_offset = math.sin(pygame.time.get_ticks() / 200) * 5
-        y += wave_offset
-
+    def _draw_ship(self, screen: pygame.Surface, x: float, y: float, size: float, vehicle: Vehicle, pose: VehiclePose) -> None:
+        """船を描画（波の上下の揺れは pose.bob で貼る位置をずらす）"""
         # 船体
         hull_points = [
             (x - size // 2, y),
@@ -624,10 +723,36 @@ class VehicleGoGame(BaseGame):
         # 波（水面）
         wave_y = y + size // 3 + 10
         for i in range(-2, 3):
-            wave_x = x + i * 30 + (pygame.time.get_ticks() // 50) % 30
+            wave_x = x + i * 30 + pose.wave_phase
             pygame.draw.arc(screen, (100, 180, 255),
                           (wave_x - 15, wave_y - 5, 30, 20), 0, math.pi, 3)
 
+    def _wheel_pose(self) -> VehiclePose:
+        """車輪の回転"""
+        angle = int(self.wheel_rotation) // WHEEL_ANGLE_STEP * WHEEL_ANGLE_STEP % 90
+        return VehiclePose(wheel_angle=angle)
+
+    def _light_pose(self, interval_ms: int) -> VehiclePose:
+        """警告灯の点滅（interval_ms ごとに切り替わる）"""
+        return VehiclePose(light_on=(pygame.time.get_ticks() // interval_ms) % 2 == 0)
+
+    def _ship_pose(self) -> VehiclePose:
+        """波のアニメーション（上下の揺れと波の模様の流れ）"""
+        ticks = pygame.time.get_ticks()
+        return VehiclePose(wave_phase=(ticks // 50) % 30, bob=math.sin(ticks / 200) * 5)
+
+    def _draw_vehicle_primitive(self, screen: pygame.Surface, vehicle: Vehicle, x: float, y: float, size: float) -> None:
+        """プリミティブの乗り物を貼る（大きさと姿勢ごとに1回だけ焼き付ける）"""
+        pose = vehicle.pose_func() if vehicle.pose_func is not None else VehiclePose()
+        shape = replace(pose, bob=0.0)
+        get_sprite_baker().draw(
+            screen,
+            ("vehicle_go", vehicle.image_key, size, shape),
+            (x, y + pose.bob),
+            lambda surface, vx, vy: vehicle.draw_func(surface, vx, vy, size, vehicle, shape),
+            (int(size * 3), int(size * 2)),
+        )
+
     # ========== アイコン描画（選択画面用） ==========
 
     def _draw_vehicle_icon(self, screen: pygame.Surface, vehicle: Vehicle, rect: pygame.Rect) -> None:
@@ -644,23 +769,34 @@ class VehicleGoGame(BaseGame):
         if vehicle.image_key in self.custom_images:
             image = self.custom_images[vehicle.image_key]
             # アイコンサイズにスケール
-            scaled = pygame.transform.scale(image, (int(icon_size), int(icon_size * 0.7)))
+            scaled = scaled_surface(image, (int(icon_size), int(icon_size * 0.7)))
             image_rect = scaled.get_rect(center=(cx, cy))
             screen.blit(scaled, image_rect)
         else:
-            vehicle.draw_func(screen, cx, cy, icon_size, vehicle)
+            self._draw_vehicle_primitive(screen, vehicle, cx, cy, icon_size)
 
         # 名前（黒色）
-        name_surface = self.name_font.render(vehicle.name, True, (0, 0, 0))
+        name_surface = render_text(self.name_font, vehicle.name, (0, 0, 0))
         name_rect = name_surface.get_rect(centerx=rect.centerx, bottom=rect.bottom - 5)
         screen.blit(name_surface, name_rect)
 
+    def _is_icon_animated(self, vehicle: Vehicle) -> bool:
+        """アイコンを毎フレーム描き直す必要があるか（カスタム画像のアイコンは動かない）"""
+        return vehicle.pose_func is not None and vehicle.image_key not in self.custom_images
+
     # ========== ゲームロジック ==========
 
     def on_enter(self) -> None:
         """ゲーム開始時の初期化"""
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
+        init_audio()
+        self.engine_voice = StreamingVoice()
+
+    def on_exit(self) -> None:
+        """ゲーム終了時の処理"""
+        if self.engine_voice is not None:
+            self.engine_voice.release()
+            self.engine_voice = None
+        self.engine_sound = None
 
     def handle_events(self, events: list[pygame.event.Event]) -> None:
         """イベント処理"""
@@ -686,6 +822,8 @@ class VehicleGoGame(BaseGame):
             vehicle = self.running_vehicle
 
             # 位置更新
+            self.prev_vehicle_x = self.vehicle_x
+            self.prev_vehicle_y = self.vehicle_y
             self.vehicle_x += vehicle.speed * dt
 
             # 移動タイプ別の処理
@@ -697,6 +835,14 @@ class VehicleGoGame(BaseGame):
             # 車輪回転
             self.wheel_rotation += vehicle.speed * dt * 0.5
 
+            # エンジン音を今の速さ（波の上下の動きも含む）と位置に合わせる
+            if self.engine_sound is not None:
+                dx = self.vehicle_x - self.prev_vehicle_x
+                dy = self.vehicle_y - self.prev_vehicle_y
+                speed = math.hypot(dx, dy) / dt
+                self._update_engine_sound(vehicle, speed)
+                self.engine_voice.pump()
+
             # パーティクル生成
             if random.random() < 0.3:
                 if vehicle.movement_type == "wave":
@@ -710,66 +856,68 @@ class VehicleGoGame(BaseGame):
             if self.vehicle_x > self.width + 200:
                 self.is_running = False
                 self.running_vehicle = None
+                self._stop_engine_sound()
 
         # パーティクル更新
-        for particle in self.particles[:]:
-            particle.x += particle.vx * dt
-            particle.y += particle.vy * dt
-            particle.life -= dt
-            if particle.life <= 0:
-                self.particles.remove(particle)
-
-    def draw(self) -> None:
-        """描画処理"""
-        self.screen.fill(BACKGROUND_CREAM)
+        self.particles.update(dt)
+
+    def has_active_animation(self) -> bool:
+        """走行中とパーティクル表示中はアニメーション中"""
+        return self.is_running or bool(self.particles)
+
+    def _draw_background(self, screen: pygame.Surface) -> None:
+        """タイトル・乗り物選択グリッド・アニメーション領域の背景を描画（静的なレイヤー）"""
+        screen.fill(BACKGROUND_CREAM)
 
         # タイトル
-        title_text = self.title_font.render("のりものビュンビュン", True, (80, 80, 80))
+        title_text = render_text(self.title_font, "のりものビュンビュン", (80, 80, 80))
         title_rect = title_text.get_rect(centerx=self.width // 2, top=20)
-        self.screen.blit(title_text, title_rect)
+        screen.blit(title_text, title_rect)
 
-        # 乗り物選択グリッド
-        for i, vehicle in enumerate(self.vehicles):
-            self._draw_vehicle_icon(self.screen, vehicle, self.vehicle_rects[i])
+        # 乗り物選択グリッド（動かないアイコンだけ）
+        for vehicle, rect in zip(self.vehicles, self.vehicle_rects):
+            if not self._is_icon_animated(vehicle):
+                self._draw_vehicle_icon(screen, vehicle, rect)
 
         # アニメーション領域の背景
         animation_rect = pygame.Rect(0, self.animation_area_y - 50, self.width, 200)
-        pygame.draw.rect(self.screen, (230, 240, 250), animation_rect)
+        pygame.draw.rect(screen, (230, 240, 250), animation_rect)
 
         # 地面/水面
         ground_y = self.animation_area_y + 80
-        pygame.draw.rect(self.screen, (200, 200, 200), (0, ground_y, self.width, 5))
+        pygame.draw.rect(screen, (200, 200, 200), (0, ground_y, self.width, 5))
+
+    def draw(self, alpha: float = 1.0) -> None:
+        """描画処理"""
+        self.layers.compose(self.screen)
+
+        # 動くアイコンは毎フレーム描く
+        for vehicle, rect in zip(self.vehicles, self.vehicle_rects):
+            if self._is_icon_animated(vehicle):
+                self._draw_vehicle_icon(self.screen, vehicle, rect)
 
         # パーティクル描画
-        for particle in self.particles:
-            alpha = int(255 * (particle.life / particle.max_life))
-            size = int(particle.size * (particle.life / particle.max_life))
-            if size > 0:
-                pygame.draw.circle(self.screen, particle.color,
-                                 (int(particle.x), int(particle.y)), size)
+        self.particles.draw(self.screen, alpha)
 
         # 走行中の乗り物
         if self.is_running and self.running_vehicle:
             vehicle = self.running_vehicle
+            # 前回と今回のシミュレーション位置の間を補間して描画
+            draw_x = self.prev_vehicle_x + (self.vehicle_x - self.prev_vehicle_x) * alpha
+            draw_y = self.prev_vehicle_y + (self.vehicle_y - self.prev_vehicle_y) * alpha
             if vehicle.image_key in self.custom_images:
                 # カスタム画像を使用
                 image = self.custom_images[vehicle.image_key]
-                scaled = pygame.transform.scale(image, (150, 100))
-                image_rect = scaled.get_rect(center=(int(self.vehicle_x), int(self.vehicle_y)))
+                scaled = scaled_surface(image, (150, 100))
+                image_rect = scaled.get_rect(center=(int(draw_x), int(draw_y)))
                 self.screen.blit(scaled, image_rect)
             else:
                 # プリミティブ描画
-                vehicle.draw_func(
-                    self.screen,
-                    self.vehicle_x,
-                    self.vehicle_y,
-                    120,
-                    vehicle
-                )
+                self._draw_vehicle_primitive(self.screen, vehicle, draw_x, draw_y, 120)
 
         # ヒント
         if not self.is_running:
-            hint_text = self.hint_font.render("のりものをタップしよう！", True, (150, 150, 150))
+            hint_text = render_text(self.hint_font, "のりものをタップしよう！", (150, 150, 150))
             hint_rect = hint_text.get_rect(centerx=self.width // 2, bottom=self.height - 20)
             self.screen.blit(hint_text, hint_rect)
 
@@ -8,12 +8,15 @@ Vehicle Go - 単体実行用エントリーポイント
 import pygame
 
 from apps.vehicle_go.game import VehicleGoGame
+from shared.audio import init_audio, pre_init_audio
 from shared.constants import DEFAULT_HEIGHT, DEFAULT_WIDTH
 
 
 def main() -> None:
     """ゲームを単体で起動"""
+    pre_init_audio()
     pygame.init()
+    init_audio()
 
     screen = pygame.display.set_mode((DEFAULT_WIDTH, DEFAULT_HEIGHT))
     pygame.display.set_caption("Vehicle Go - のりものビュンビュン")
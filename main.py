@@ -7,21 +7,18 @@ Baby Fun Box - 幼児向けゲームコレクション
 
 import pygame
 
-from apps.animal_touch.game import AnimalTouchGame
-from apps.baby_piano.game import BabyPianoGame
-from apps.balloon_pop.game import BalloonPopGame
-from apps.mogura_tataki.game import MoguraTatakiGame
-from apps.oekaki_rakugaki.game import OekakiRakugakiGame
-from apps.vehicle_go.game import VehicleGoGame
 from apps.launcher import Launcher
+from shared.audio import init_audio, pre_init_audio
 from shared.constants import DEFAULT_HEIGHT, DEFAULT_WIDTH
+from shared.replay import start_session_from_env, stop_session
 
 
 def main() -> None:
     """メインエントリーポイント"""
     # Pygame初期化
+    pre_init_audio()
     pygame.init()
-    pygame.mixer.init()
+    init_audio()
 
     # 画面設定
     screen = pygame.display.set_mode((DEFAULT_WIDTH, DEFAULT_HEIGHT))
@@ -30,16 +27,22 @@ def main() -> None:
     # ランチャーを作成
     launcher = Launcher(screen)
 
-    # ゲームを登録
-    launcher.register_game(BalloonPopGame)
-    launcher.register_game(AnimalTouchGame)
-    launcher.register_game(BabyPianoGame)
-    launcher.register_game(VehicleGoGame)
-    launcher.register_game(OekakiRakugakiGame)
-    launcher.register_game(MoguraTatakiGame)
+    # ゲームを登録（モジュールは最初に起動されたときにインポートする）
+    launcher.register_game("apps.balloon_pop.game:BalloonPopGame")
+    launcher.register_game("apps.animal_touch.game:AnimalTouchGame")
+    launcher.register_game("apps.baby_piano.game:BabyPianoGame")
+    launcher.register_game("apps.vehicle_go.game:VehicleGoGame")
+    launcher.register_game("apps.oekaki_rakugaki.game:OekakiRakugakiGame")
+    launcher.register_game("apps.mogura_tataki.game:MoguraTatakiGame")
+
+    # 入力の記録・再生（BABY_FUN_BOX_RECORD / BABY_FUN_BOX_REPLAY）
+    start_session_from_env()
 
     # ランチャーを実行
-    launcher.run()
+    try:
+        launcher.run()
+    finally:
+        stop_session()
 
     # 終了処理
     pygame.quit()
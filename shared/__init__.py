@@ -3,7 +3,8 @@
 from shared.base_game import BaseGame
 from shared import constants
 from shared.components import Button, IconButton, BackButton
-from shared.fonts import get_font, get_japanese_font_path
+from shared.fonts import get_font, get_japanese_font_path, warm_up_fonts
+from shared.text_cache import render_text
 
 __all__ = [
     "BaseGame",
@@ -13,4 +14,6 @@ __all__ = [
     "BackButton",
     "get_font",
     "get_japanese_font_path",
+    "warm_up_fonts",
+    "render_text",
 ]
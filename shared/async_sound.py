@@ -0,0 +1,92 @@
+"""
+非同期の効果音 - 効果音の完成を待たずにゲームを始める
+
+on_enter() で効果音を同期的に合成すると、合成が終わるまで最初のフレームが描画されない。
+AsyncSound は BaseGame.cached_resource_async() の Future を包み、完成していればその音を、
+まだなら（または作成に失敗したら）代わりの短いクリック音を返す。本当に必要な場面（結果発表のファンファーレなど）では
+wait() / wait_all() で完成を待てる。
+
+使い方:
+    self.pop_sound = AsyncSound(self.cached_resource_async("pop_sound", self._create_pop_sound))
+    play_sfx(self.pop_sound.get(), POP_SFX)       # 完成前はクリック音
+    play_sfx(self.finish_sound.wait(), FINISH_SFX)  # 完成を待つ
+"""
+
+import concurrent.futures
+from concurrent.futures import Future
+from typing import Iterable
+
+import pygame
+
+from shared import synth
+from shared.resource_cache import get_resource_cache
+
+# 完成を待つ最大時間（秒）。過ぎたらクリック音で代用する
+SOUND_WAIT_TIMEOUT: float = 1.0
+
+
+def _create_fallback_click() -> pygame.mixer.Sound:
+    """効果音の完成前に鳴らすクリック音を生成"""
+    t = synth.timeline(0.015)
+    wave = synth.tone(1200, t) * synth.exp_decay(300, t)
+    return synth.to_sound(wave, amplitude=8000, volume=0.3)
+
+
+def get_fallback_click() -> pygame.mixer.Sound:
+    """効果音の完成前に鳴らすクリック音を取得する（全ゲームで共有）"""
+    return get_resource_cache().get_or_create(("shared", "fallback_click"), _create_fallback_click)
+
+
+class AsyncSound:
+    """作成中の効果音（完成するまではクリック音で代用する）"""
+
+    def __init__(self, future: Future[pygame.mixer.Sound]) -> None:
+        """
+        Args:
+            future: 効果音を返す Future（BaseGame.cached_resource_async() の戻り値）
+        """
+        self.future = future
+
+    @property
+    def ready(self) -> bool:
+        """効果音が完成したか"""
+        return self.future.done()
+
+    @property
+    def failed(self) -> bool:
+        """効果音の作成に失敗したか（合成・ディスクキャッシュ・ミキサーの例外）"""
+        return self.future.done() and self.future.exception() is not None
+
+    def get(self) -> pygame.mixer.Sound:
+        """完成していればその効果音を、まだなら（または作成に失敗したら）クリック音を返す（待たない）"""
+        if self.future.done() and not self.failed:
+            return self.future.result()
+        return get_fallback_click()
+
+    def wait(self, timeout: float | None = SOUND_WAIT_TIMEOUT) -> pygame.mixer.Sound:
+        """
+        効果音の完成を待って返す
+
+        Args:
+            timeout: 待つ最大時間（秒）。過ぎたら（または作成に失敗したら）クリック音を返す
+                （None なら完成まで待つ）
+        """
+        try:
+            return self.future.result(timeout)
+        except Exception:  # 時間切れ・作成の失敗のどちらもゲームを止めずにクリック音で代用する
+            return get_fallback_click()
+
+
+def wait_all(sounds: Iterable[AsyncSound], timeout: float | None = None) -> bool:
+    """
+    効果音がすべて完成するまで待つ
+
+    Args:
+        sounds: 待つ効果音
+        timeout: 待つ最大時間（秒。None なら完成まで待つ）
+
+    Returns:
+        すべて完成したか
+    """
+    _, not_done = concurrent.futures.wait([sound.future for sound in sounds], timeout)
+    return not not_done
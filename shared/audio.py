@@ -0,0 +1,148 @@
+"""
+音声設定 - ミキサーの初期化をまとめて行う
+
+ミキサーのバッファサイズ・周波数・チャンネル数・同時に鳴らせる音の数を
+端末に合わせたプロファイルとして定義し、すべてのエントリーポイントとゲームで同じ設定を使う。
+バッファが小さいほどタップしてから音が鳴るまでが短くなるが、
+処理の遅い端末では音が途切れやすくなる。
+
+プロファイルは環境変数で選ぶ:
+    BABY_FUN_BOX_AUDIO_PROFILE=low_latency python main.py
+"""
+
+import os
+from dataclasses import dataclass
+
+import pygame
+
+# プロファイル名を指定する環境変数
+AUDIO_PROFILE_ENV_VAR: str = "BABY_FUN_BOX_AUDIO_PROFILE"
+
+# 環境変数が未設定の場合のプロファイル
+DEFAULT_AUDIO_PROFILE: str = "standard"
+
+# チャンネルを予約しても、Sound.play() が使えるように残しておくチャンネル数
+MIN_SHARED_CHANNELS: int = 4
+
+
+@dataclass(frozen=True)
+class AudioConfig:
+    """ミキサーの設定"""
+
+    frequency: int  # サンプリングレート（Hz）
+    size: int  # サンプルのビット数（負は符号付き）
+    channels: int  # 出力チャンネル数（1: モノラル, 2: ステレオ）
+    buffer: int  # バッファのサンプル数（2のべき乗）
+    mixing_channels: int  # 同時に鳴らせる音の数
+
+    @property
+    def buffer_ms(self) -> float:
+        """バッファ1つ分の時間（ミリ秒）"""
+        return self.buffer * 1000.0 / self.frequency
+
+
+# 端末ごとのプロファイル
+AUDIO_PROFILES: dict[str, AudioConfig] = {
+    # 一般的な PC・タブレット（pygame の既定と同じバッファ）
+    "standard": AudioConfig(frequency=44100, size=-16, channels=2, buffer=512, mixing_channels=16),
+    # タップへの反応を優先する（速い端末向け）
+    "low_latency": AudioConfig(
+        frequency=44100, size=-16, channels=2, buffer=256, mixing_channels=16
+    ),
+    # メモリの少ない端末（効果音のサイズが 1/4 になる）
+    "low_memory": AudioConfig(frequency=22050, size=-16, channels=1, buffer=256, mixing_channels=8),
+    # 音が途切れる端末（Bluetooth スピーカーや遅い端末）
+    "safe": AudioConfig(frequency=44100, size=-16, channels=2, buffer=2048, mixing_channels=16),
+}
+
+
+def get_audio_config(profile: str | None = None) -> AudioConfig:
+    """
+    音声設定を取得する
+
+    Args:
+        profile: プロファイル名（None の場合は環境変数 BABY_FUN_BOX_AUDIO_PROFILE、
+                 未設定なら DEFAULT_AUDIO_PROFILE）
+
+    Raises:
+        ValueError: 存在しないプロファイル名の場合
+    """
+    name = profile or os.environ.get(AUDIO_PROFILE_ENV_VAR) or DEFAULT_AUDIO_PROFILE
+    if name not in AUDIO_PROFILES:
+        raise ValueError(f"未知の音声プロファイルです: {name}（{', '.join(AUDIO_PROFILES)}）")
+    return AUDIO_PROFILES[name]
+
+
+def pre_init_audio(config: AudioConfig | None = None) -> AudioConfig:
+    """
+    pygame.init() より前に呼び、ミキサーの設定を予約する
+
+    pygame.init() はミキサーも初期化するため、先に設定しておかないと
+    既定のバッファサイズで初期化されてしまう。
+    """
+    config = config or get_audio_config()
+    pygame.mixer.pre_init(config.frequency, config.size, config.channels, config.buffer)
+    return config
+
+
+def init_audio(config: AudioConfig | None = None) -> AudioConfig:
+    """
+    ミキサーを初期化する（初期化済みなら同時に鳴らせる音の数だけ設定する）
+
+    ゲームの on_enter() からも呼ばれるので、何度呼んでもよい。
+    """
+    config = config or get_audio_config()
+    if not pygame.mixer.get_init():
+        pygame.mixer.init(config.frequency, config.size, config.channels, config.buffer)
+        _reserved_channels.clear()
+    pygame.mixer.set_num_channels(max(config.mixing_channels, _reserved_end() + MIN_SHARED_CHANNELS))
+    return config
+
+
+# 予約済みのチャンネル番号
+_reserved_channels: set[int] = set()
+
+
+def _reserved_end() -> int:
+    """予約済みのチャンネル番号の最大値 + 1"""
+    return max(_reserved_channels) + 1 if _reserved_channels else 0
+
+
+def reserve_channels(count: int) -> list[int]:
+    """
+    専用のチャンネルを予約する（Sound.play() の自動割り当てに使われなくなる）
+
+    pygame.mixer.set_reserved() は先頭から n 個のチャンネルを予約する仕組みなので、
+    空いている番号を先頭から割り当て、予約数を最大の番号までに広げる。
+
+    Args:
+        count: 予約するチャンネル数
+
+    Returns:
+        予約したチャンネル番号のリスト（pygame.mixer.Channel() に渡す）
+    """
+    indices = []
+    index = 0
+    while len(indices) < count:
+        if index not in _reserved_channels:
+            indices.append(index)
+        index += 1
+    _reserved_channels.update(indices)
+    _apply_reservation()
+    return indices
+
+
+def release_channels(indices: list[int]) -> None:
+    """reserve_channels() で予約したチャンネルを解放する"""
+    _reserved_channels.difference_update(indices)
+    _apply_reservation()
+
+
+def _apply_reservation() -> None:
+    """予約数をミキサーに反映する（予約していないチャンネルも MIN_SHARED_CHANNELS 個残す）"""
+    if not pygame.mixer.get_init():
+        return
+    end = _reserved_end()
+    if pygame.mixer.get_num_channels() < end + MIN_SHARED_CHANNELS:
+        pygame.mixer.set_num_channels(end + MIN_SHARED_CHANNELS)
+    pygame.mixer.set_reserved(end)
@@ -5,11 +5,22 @@ BaseGame - 全ゲーム共通の基底クラス
 ランチャーからの統一的なゲーム起動・終了を可能にする。
 """
 
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from pathlib import Path
+from typing import Callable, Hashable, TypeVar
 
 import pygame
 
+from shared.constants import MAX_FRAME_TIME, SIMULATION_DT
+from shared.dirty_rects import DirtyRegions
+from shared.frame_rate import FrameRateGovernor
+from shared.profiler import get_frame_profiler
+from shared.resource_cache import get_resource_cache, load_resource_async
+
+T = TypeVar("T")
+
 
 class BaseGame(ABC):
     """全ゲーム共通の基底クラス"""
@@ -19,6 +30,9 @@ class BaseGame(ABC):
     description: str = "Game description"
     icon_path: str | None = None  # アイコン画像のパス（assets/icon.pngなど）
 
+    # ダーティ矩形モード（True にすると mark_dirty() された領域だけを画面に転送する）
+    use_dirty_rects: bool = False
+
     def __init__(self, screen: pygame.Surface) -> None:
         """
         ゲームを初期化する
@@ -32,6 +46,14 @@ class BaseGame(ABC):
         self.running = True
         self.return_to_launcher = False
         self.clock = pygame.time.Clock()
+        self.frame_governor = FrameRateGovernor(self.clock)
+        self.sim_accumulator = 0.0  # まだシミュレーションしていない経過時間（秒）
+        self.profiler = get_frame_profiler()
+        self.dirty_regions = DirtyRegions((self.width, self.height))
+
+        # 起動から最初のフレームまでの時間（ランチャーが launched_at を設定する）
+        self.launched_at: float | None = None  # time.perf_counter() の値
+        self.first_frame_ms: float | None = None
 
     @abstractmethod
     def handle_events(self, events: list[pygame.event.Event]) -> None:
@@ -48,16 +70,37 @@ class BaseGame(ABC):
         """
         ゲーム状態の更新
 
+        描画のフレームレートに関係なく、一定間隔で呼ばれる。
+
         Args:
-            dt: 前フレームからの経過時間（秒）
+            dt: シミュレーション1ステップの時間（秒、常に SIMULATION_DT）
         """
         pass
 
     @abstractmethod
-    def draw(self) -> None:
-        """描画処理"""
+    def draw(self, alpha: float = 1.0) -> None:
+        """
+        描画処理
+
+        Args:
+            alpha: 直前の update() と次の update() の間の補間係数（0.0〜1.0）。
+                動きを滑らかにしたいオブジェクトは、前回位置と現在位置を
+                この値で補間して描画する。
+        """
         pass
 
+    def has_active_animation(self) -> bool:
+        """
+        アニメーション中かどうか（オーバーライド可能）
+
+        False を返している間に一定時間入力がなければ、ゲームループは
+        アイドル用の低いフレームレートに切り替わる。
+
+        Returns:
+            画面が時間経過で変化する場合 True
+        """
+        return True
+
     def on_enter(self) -> None:
         """
         ゲーム開始時に呼ばれる（オーバーライド可能）
@@ -74,22 +117,87 @@ class BaseGame(ABC):
         """
         pass
 
+    @classmethod
+    def prewarm(cls) -> None:
+        """
+        重いリソースを事前に作っておく（オーバーライド可能）
+
+        ランチャーが待機している間にバックグラウンドスレッドから呼ばれる。
+        cached_resource() で作ったリソースは、起動後に同じキーで取り出せる。
+        画面に依存する処理（convert() など）はここでは行わないこと。
+        """
+        pass
+
+    @classmethod
+    def cached_resource(cls, key: Hashable, factory: Callable[[], T]) -> T:
+        """
+        ゲームごとの共有リソースを取得する（なければ factory で作る）
+
+        Args:
+            key: リソースのキー（ゲームクラスごとに区別される）
+            factory: リソースを作る関数
+
+        Returns:
+            キャッシュされたリソース
+        """
+        return get_resource_cache().get_or_create((cls.__name__, key), factory)
+
+    @classmethod
+    def cached_resource_async(cls, key: Hashable, factory: Callable[[], T]) -> Future[T]:
+        """
+        ゲームごとの共有リソースを待たずに取得する（なければワーカースレッドで作る）
+
+        on_enter() で使うと、リソースの完成を待たずに最初のフレームを描画できる。
+
+        Args:
+            key: リソースのキー（cached_resource() と同じキーを使える）
+            factory: リソースを作る関数
+
+        Returns:
+            リソースを返す Future
+        """
+        return load_resource_async((cls.__name__, key), factory)
+
     def request_return_to_launcher(self) -> None:
         """ランチャーに戻ることをリクエストする"""
         self.return_to_launcher = True
 
+    def mark_dirty(self, rect: pygame.Rect | tuple[int, int, int, int]) -> None:
+        """
+        変化した領域を登録する（ダーティ矩形モード用）
+
+        Args:
+            rect: 次のフレームで描き直す矩形（画面座標）
+        """
+        if self.use_dirty_rects:
+            self.dirty_regions.mark(rect)
+
+    def mark_all_dirty(self) -> None:
+        """画面全体を描き直す（ダーティ矩形モード用）"""
+        self.dirty_regions.mark_all()
+
     def run(self) -> None:
         """
         ゲームループを実行する
 
         このメソッドはランチャーから呼ばれる。
         return_to_launcher が True になるとループを抜ける。
+
+        update() は固定タイムステップ（SIMULATION_DT）で呼ばれ、描画の
+        フレームレートが落ちてもゲームの進み方は変わらない。
+        has_active_animation() が False で入力もない間はフレームレートを落とす。
+        use_dirty_rects が True の場合、変化した領域がないフレームは
+        draw() を呼ばず、変化した領域だけを画面に転送する。
         """
         self.on_enter()
+        self.dirty_regions.mark_all()
+        self.frame_governor.wake()
+        self.sim_accumulator = 0.0
 
         while self.running and not self.return_to_launcher:
-            dt = self.clock.tick(60) / 1000.0  # 60FPS、秒単位のデルタタイム
-            events = pygame.event.get()
+            # 秒単位のデルタタイム（アイドル時は入力を待って低いフレームレートで進む）
+            dt, events = self.frame_governor.next_frame(self.has_active_animation())
+            self.profiler.begin_frame()
 
             # 共通のイベント処理
             for event in events:
@@ -97,13 +205,43 @@ class BaseGame(ABC):
                     self.running = False
                     return
 
+            # プロファイラの表示切り替え（Ctrl+Shift+P）
+            if self.profiler.handle_toggle(events):
+                self.dirty_regions.mark_all()
+
             # ゲーム固有のイベント処理
             self.handle_events(events)
+            self.profiler.end_phase("events")
+
+            # 固定タイムステップで更新
+            self.sim_accumulator += min(dt, MAX_FRAME_TIME)
+            while self.sim_accumulator >= SIMULATION_DT:
+                self.update(SIMULATION_DT)
+                self.sim_accumulator -= SIMULATION_DT
+            alpha = self.sim_accumulator / SIMULATION_DT
+            self.profiler.end_phase("update")
+
+            # 描画
+            if self.profiler.enabled and self.use_dirty_rects:
+                self.dirty_regions.mark(self.profiler.overlay_rect(self.screen))
+
+            if not self.use_dirty_rects:
+                self.draw(alpha)
+                self.profiler.end_phase("draw")
+                self.profiler.draw_overlay(self.screen)
+                pygame.display.flip()
+            elif self.dirty_regions.needs_redraw:
+                self.draw(alpha)
+                self.profiler.end_phase("draw")
+                self.profiler.draw_overlay(self.screen)
+                self.dirty_regions.present()
+            else:
+                self.profiler.skip_phase("draw")
+            self.profiler.end_phase("present")
+            self.profiler.end_frame()
 
-            # 更新と描画
-            self.update(dt)
-            self.draw()
-            pygame.display.flip()
+            if self.first_frame_ms is None and self.launched_at is not None:
+                self.first_frame_ms = (time.perf_counter() - self.launched_at) * 1000.0
 
         self.on_exit()
 
@@ -0,0 +1,1184 @@
+"""
+ベンチマーク - 全ゲームをヘッドレスで実行して性能を計測する
+
+SDL_VIDEODRIVER=dummy / SDL_AUDIODRIVER=dummy で画面・音声なしにゲームを起動し、
+合成した入力（タップ・ドラッグ）を与えながら FPS 制限なしで N フレーム実行する。
+ゲームごとにフレーム時間のパーセンタイル、メモリ割り当て量、ピーク RSS を
+JSON で出力する。ディスプレイのないビルドマシンでも実行できる。
+
+使い方:
+    python -m shared.bench                     # 全ゲーム
+    python -m shared.bench --frames 1200 --game balloon
+    python -m shared.bench --output bench.json
+    python -m shared.bench --prewarm                 # prewarm() 済みの状態で起動時間を計測
+    python -m shared.bench --replay session.bfbrec   # 記録した操作を再生して計測
+    python -m shared.bench --synth                   # 効果音の合成時間（純 Python / NumPy）を比較
+    python -m shared.bench --synth-check             # ミキサーの形式ごとに効果音の長さと音程を確認
+    python -m shared.bench --latency                 # タップから音が鳴るまでの時間（dummy / ALSA）
+    python -m shared.bench --sample-bank             # ピアノの音を音階ごとのファイルとサンプルバンクで比較
+    python -m shared.bench --particles               # パーティクルの更新・描画時間（NumPy / 純 Python / 従来のリスト）
+    python -m shared.bench --sprites                 # キャラクターの描画時間（pygame.draw / 焼き付けたスプライト）
+    python -m shared.bench --layers                  # 静的な部分の描画（毎フレーム直接描く / 保存したレイヤーを貼る）
+"""
+
+import argparse
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+# プロジェクトルート（python -m shared.bench の実行ディレクトリ）
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# デフォルトの計測フレーム数
+DEFAULT_FRAMES: int = 600
+
+# 計測前に捨てるフレーム数（初回描画のキャッシュ作成などを除外する）
+WARMUP_FRAMES: int = 30
+
+# 合成時間を計測する効果音
+# （"モジュール名:クラス名", メソッド名, 引数, 長さ（秒）, 基本周波数（Hz、確認しない場合は None））
+SYNTH_BENCH_SOUNDS: list[tuple[str, str, tuple, float, float | None]] = [
+    ("apps.balloon_pop.game:BalloonPopGame", "_create_pop_sound", (), 0.1, 400.0),
+    ("apps.mogura_tataki.game:MoguraTatakiGame", "_create_pop_sound", (), 0.1, None),
+    ("apps.mogura_tataki.game:MoguraTatakiGame", "_create_tap_sound", (), 0.15, None),
+    ("apps.mogura_tataki.game:MoguraTatakiGame", "_create_finish_sound", (), 0.8, None),
+    ("apps.oekaki_rakugaki.game:OekakiRakugakiGame", "_create_pop_sound", (), 0.05, None),
+    ("apps.oekaki_rakugaki.game:OekakiRakugakiGame", "_create_sparkle_sound", (), 0.15, None),
+    ("apps.baby_piano.game:BabyPianoGame", "_synthesize_note", (261.63,), 0.5, 261.63),
+    ("apps.animal_touch.game:AnimalTouchGame", "_synthesize_animal_sound", (300,), 0.3, None),
+    ("apps.vehicle_go.game:VehicleGoGame", "_create_siren_sound", (400, 500), 2.0, None),
+]
+
+# --synth-check で確認するミキサーの形式（周波数, サンプルのビット数, チャンネル数）
+SYNTH_CHECK_FORMATS: list[tuple[int, int, int]] = [
+    (22050, -16, 1),
+    (44100, -16, 2),
+    (48000, 32, 2),
+    (22050, 8, 1),
+    (44100, 16, 2),
+]
+
+# --synth-check で許容する長さ・周波数のずれ（割合）
+SYNTH_CHECK_TOLERANCE: float = 0.01
+
+# --sample-bank で比較する音域（オクターブ数 → ドからの半音数）
+SAMPLE_BANK_RANGES: dict[int, range] = {1: range(0, 13), 2: range(-12, 13), 3: range(-12, 25)}
+
+# --particles で計測するパーティクル数
+PARTICLE_BENCH_COUNTS: list[int] = [1000, 10000]
+
+# --particles で更新を計測するフレーム数（描画は PARTICLE_BENCH_DRAW_FRAMES フレーム）
+PARTICLE_BENCH_FRAMES: int = 120
+PARTICLE_BENCH_DRAW_FRAMES: int = 10
+
+# タップから音が鳴るまでの時間を計測するゲームと、タップする位置（ゲーム, 何回目か → 座標）
+LATENCY_TARGETS: dict[str, Callable[[Any, int], tuple[int, int]]] = {
+    "apps.baby_piano.game:BabyPianoGame": lambda game, i: game.keys[i % len(game.keys)].rect.center,
+    "apps.animal_touch.game:AnimalTouchGame": lambda game, i: (game.width // 2, game.height // 2),
+}
+
+# タップの回数
+LATENCY_TAPS: int = 50
+
+# タップの遅延を計測する SDL の音声ドライバ
+LATENCY_DRIVERS: list[str] = ["dummy", "alsa"]
+
+# 効果音の合成を繰り返す回数（最小値を採用する）
+SYNTH_REPEAT: int = 5
+
+# 描画の回数（blit・pygame.draw）を数えるフレーム数
+DRAW_OPS_FRAMES: int = 120
+
+# 描画の回数として数える pygame.draw の関数
+DRAW_OPS_FUNCTIONS: tuple[str, ...] = (
+    "rect", "polygon", "circle", "ellipse", "arc", "line", "lines", "aaline", "aalines",
+)
+
+# 合成入力でタップを発生させる間隔（フレーム）
+TAP_INTERVAL: int = 6
+
+
+def _use_dummy_drivers() -> None:
+    """ディスプレイ・音声デバイスなしで動くように SDL のドライバを設定する"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+def discover_games() -> list[str]:
+    """
+    apps/ 以下の BaseGame サブクラスを探す
+
+    Returns:
+        "モジュール名:クラス名" のリスト
+    """
+    import apps
+    from shared.base_game import BaseGame
+
+    for module_info in pkgutil.iter_modules(apps.__path__):
+        if not module_info.ispkg:
+            continue
+        try:
+            importlib.import_module(f"apps.{module_info.name}.game")
+        except ModuleNotFoundError:
+            # game.py を持たないパッケージ（launcher など）
+            continue
+
+    specs = []
+    pending = list(BaseGame.__subclasses__())
+    while pending:
+        game_class = pending.pop(0)
+        pending.extend(game_class.__subclasses__())
+        if getattr(game_class, "__abstractmethods__", None):
+            continue
+        specs.append(f"{game_class.__module__}:{game_class.__qualname__}")
+
+    return sorted(specs)
+
+
+def _load_game_class(spec: str) -> type:
+    """ "モジュール名:クラス名" からクラスを読み込む"""
+    module_name, class_name = spec.split(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
+def synthetic_input(seed: int, width: int, height: int) -> Iterator[list]:
+    """
+    フレームごとの合成入力イベントを生成する
+
+    TAP_INTERVAL フレームごとに「押す → ドラッグ → 離す」を3フレームかけて行う。
+    同じシードなら同じ入力列になる。
+
+    Args:
+        seed: 入力位置を決める乱数シード
+        width: 画面幅
+        height: 画面高さ
+
+    Yields:
+        そのフレームの pygame イベントのリスト
+    """
+    import pygame
+
+    rng = random.Random(seed)
+    while True:
+        pos = (rng.randrange(width), rng.randrange(height))
+        yield [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)]
+
+        new_pos = (
+            max(0, min(width - 1, pos[0] + rng.randint(-60, 60))),
+            max(0, min(height - 1, pos[1] + rng.randint(-60, 60))),
+        )
+        rel = (new_pos[0] - pos[0], new_pos[1] - pos[1])
+        yield [pygame.event.Event(pygame.MOUSEMOTION, pos=new_pos, rel=rel, buttons=(1, 0, 0))]
+
+        yield [pygame.event.Event(pygame.MOUSEBUTTONUP, pos=new_pos, button=1)]
+
+        for _ in range(TAP_INTERVAL - 3):
+            yield []
+
+
+def _peak_rss_kb() -> int | None:
+    """プロセスのピーク RSS（KB）。取得できない環境では None"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS はバイト単位、Linux は KB 単位
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _drive_frames(game, frames: int, seed: int) -> list[float]:
+    """合成入力を与えながらゲームを frames フレーム進め、各フレームの時間（ms）を返す"""
+    import pygame
+
+    from shared.constants import SIMULATION_DT
+
+    frame_times = []
+    inputs = synthetic_input(seed, game.width, game.height)
+    for _ in range(frames):
+        events = next(inputs)
+        start = time.perf_counter()
+        game.handle_events(events)
+        game.update(SIMULATION_DT)
+        game.draw()
+        pygame.display.flip()
+        frame_times.append((time.perf_counter() - start) * 1000.0)
+
+        # 戻るボタンに当たってもランチャーには戻らず計測を続ける
+        game.return_to_launcher = False
+
+    return frame_times
+
+
+def _count_draw_ops(game, frames: int, seed: int) -> dict:
+    """
+    1フレームあたりの画面への blit と pygame.draw の呼び出し回数を数える
+
+    ゲームの画面を、blit() を数える Surface に一時的に差し替えて frames フレーム進める。
+    pygame.draw はゲームが描く先（キャンバスなど）に関わらず数える。
+    """
+    import pygame
+
+    counts = {"blits": 0, "fills": 0, "draw_calls": 0}
+
+    class CountingSurface(pygame.Surface):
+        def blit(self, *args, **kwargs):
+            counts["blits"] += 1
+            return super().blit(*args, **kwargs)
+
+        def blits(self, blit_sequence, *args, **kwargs):
+            blit_sequence = list(blit_sequence)
+            counts["blits"] += len(blit_sequence)
+            return super().blits(blit_sequence, *args, **kwargs)
+
+        def fill(self, *args, **kwargs):
+            counts["fills"] += 1
+            return super().fill(*args, **kwargs)
+
+    def counted(function):
+        def wrapper(*args, **kwargs):
+            counts["draw_calls"] += 1
+            return function(*args, **kwargs)
+
+        return wrapper
+
+    originals = {name: getattr(pygame.draw, name) for name in DRAW_OPS_FUNCTIONS}
+    screen = game.screen
+    game.screen = CountingSurface(screen.get_size())
+    try:
+        for name, function in originals.items():
+            setattr(pygame.draw, name, counted(function))
+        random.seed(seed)
+        _drive_frames(game, frames, seed)
+    finally:
+        for name, function in originals.items():
+            setattr(pygame.draw, name, function)
+        game.screen = screen
+
+    return {key: round(value / frames, 1) for key, value in counts.items()}
+
+
+def run_single(spec: str, frames: int, seed: int, prewarm: bool = False) -> dict:
+    """
+    1つのゲームを計測する（子プロセス内で呼ばれる）
+
+    Args:
+        spec: "モジュール名:クラス名"
+        frames: 計測フレーム数
+        seed: 乱数シード（ゲームの random と合成入力の両方に使う）
+        prewarm: 起動前に prewarm() を実行しておくか（ランチャーの待機中に相当）
+
+    Returns:
+        計測結果の辞書
+    """
+    _use_dummy_drivers()
+    import pygame
+
+    from shared.async_sound import AsyncSound, wait_all
+    from shared.audio import init_audio, pre_init_audio
+    from shared.constants import DEFAULT_HEIGHT, DEFAULT_WIDTH
+    from shared.profiler import percentile
+    from shared.scaled_surfaces import get_scaled_surface_cache
+    from shared.sfx import get_sfx_dispatcher
+
+    pre_init_audio()
+    pygame.init()
+    init_audio()
+    screen = pygame.display.set_mode((DEFAULT_WIDTH, DEFAULT_HEIGHT))
+
+    game_class = _load_game_class(spec)
+
+    prewarm_ms = None
+    if prewarm:
+        start = time.perf_counter()
+        game_class.prewarm()
+        prewarm_ms = (time.perf_counter() - start) * 1000.0
+
+    # 起動時間（コンストラクタ + on_enter）と最初のフレームまでの時間
+    random.seed(seed)
+    start = time.perf_counter()
+    game = game_class(screen)
+    game.on_enter()
+    startup_ms = (time.perf_counter() - start) * 1000.0
+    _drive_frames(game, 1, seed)
+    first_frame_ms = (time.perf_counter() - start) * 1000.0
+
+    # 非同期に作っている効果音がすべて完成するまでの時間（起動から）
+    pending_sounds = [value for value in vars(game).values() if isinstance(value, AsyncSound)]
+    wait_all(pending_sounds)
+    sounds_ready_ms = (time.perf_counter() - start) * 1000.0 if pending_sounds else None
+
+    _drive_frames(game, WARMUP_FRAMES, seed)
+
+    # フレーム時間の計測（tracemalloc なし）
+    random.seed(seed)
+    get_sfx_dispatcher().reset_stats()
+    scaled_cache = get_scaled_surface_cache()
+    scaled_cache.stats.update(hits=0, misses=0, evictions=0)
+    frame_times = sorted(_drive_frames(game, frames, seed))
+    sfx_stats = dict(get_sfx_dispatcher().stats)
+    scaled_stats = {**scaled_cache.stats, "bytes": scaled_cache.bytes_used, "surfaces": len(scaled_cache)}
+    stream = getattr(game, "engine_voice", None)  # ストリーミング再生しているゲーム
+    stream_stats = dict(stream.stats) if stream is not None else None
+
+    # メモリ割り当ての計測（tracemalloc は遅いため別パスで行う）
+    random.seed(seed)
+    tracemalloc.start()
+    _drive_frames(game, frames, seed)
+    alloc_current, alloc_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # 描画の回数（blit の差し替えで遅くなるため別パスで行う）
+    draw_ops = _count_draw_ops(game, min(frames, DRAW_OPS_FRAMES), seed)
+
+    game.on_exit()
+    pygame.quit()
+
+    result = {
+        "game": game_class.name,
+        "spec": spec,
+        "frames": frames,
+        "prewarm_ms": round(prewarm_ms, 3) if prewarm_ms is not None else None,
+        "startup_ms": round(startup_ms, 3),
+        "first_frame_ms": round(first_frame_ms, 3),
+        "sounds_ready_ms": round(sounds_ready_ms, 3) if sounds_ready_ms is not None else None,
+        "frame_ms": {
+            "mean": round(sum(frame_times) / len(frame_times), 3),
+            "p50": round(percentile(frame_times, 0.50), 3),
+            "p95": round(percentile(frame_times, 0.95), 3),
+            "p99": round(percentile(frame_times, 0.99), 3),
+            "max": round(frame_times[-1], 3),
+        },
+        "alloc_net_bytes": alloc_current,
+        "alloc_peak_bytes": alloc_peak,
+        "peak_rss_kb": _peak_rss_kb(),
+        "sfx": sfx_stats,
+        "scaled_surfaces": scaled_stats,
+        "draw_ops_per_frame": draw_ops,
+    }
+    if stream_stats is not None:
+        result["stream"] = stream_stats
+    return result
+
+
+def run_replay(path: Path) -> dict:
+    """
+    記録した操作（shared/replay.py）をランチャーごと再生して計測する
+
+    待ち時間なしで再生し、フレームプロファイラでフェーズ別の処理時間を集計する。
+
+    Args:
+        path: 記録ファイルのパス
+
+    Returns:
+        計測結果の辞書
+    """
+    _use_dummy_drivers()
+    import main as app
+    from shared.profiler import get_frame_profiler
+    from shared.replay import REPLAY_ENV_VAR, REPLAY_REALTIME_ENV_VAR, InputReplayer
+
+    recording = InputReplayer(path)
+
+    profiler = get_frame_profiler()
+    profiler.enabled = True
+    profiler.overlay_visible = False
+    profiler.set_window(max(1, recording.frame_count))
+
+    os.environ[REPLAY_ENV_VAR] = str(path)
+    os.environ.pop(REPLAY_REALTIME_ENV_VAR, None)
+
+    start = time.perf_counter()
+    app.main()
+    wall_ms = (time.perf_counter() - start) * 1000.0
+
+    stats = profiler.get_stats()
+    return {
+        "replay": str(path),
+        "seed": recording.seed,
+        "frames": stats["frames"],
+        "wall_ms": round(wall_ms, 3),
+        "phase_ms": {
+            phase: {key: round(value, 3) for key, value in values.items()}
+            for phase, values in stats["phases"].items()
+        },
+        "frames_over_budget": stats["frames_over_budget"],
+        "budget_ms": round(stats["budget_ms"], 3),
+        "peak_rss_kb": _peak_rss_kb(),
+    }
+
+
+def run_synth(repeat: int = SYNTH_REPEAT) -> list[dict]:
+    """
+    効果音ごとに合成時間を純 Python と NumPy で比較する
+
+    ディスクキャッシュ（shared/sound_cache.py）を通さずに合成した時間と、
+    キャッシュから読み込んだ時間（cached_ms）を別々に計測する。
+
+    Args:
+        repeat: 各効果音を合成する回数（最小値を採用する）
+
+    Returns:
+        効果音ごとの計測結果のリスト
+    """
+    import pygame
+
+    from shared import synth
+    from shared.audio import init_audio
+
+    init_audio()
+
+    def measure(factory) -> float:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            factory()
+            best = min(best, (time.perf_counter() - start) * 1000.0)
+        return best
+
+    results = []
+    previous = synth.is_numpy_enabled()
+    try:
+        for spec, method, args, _, _ in SYNTH_BENCH_SOUNDS:
+            cached_factory = getattr(_load_game_class(spec), method)
+            factory = inspect.unwrap(cached_factory)  # @disk_cached_sound を外す
+
+            synth.use_numpy(False)
+            python_ms = measure(lambda: factory(*args))
+            result = {"sound": f"{spec.split(':')[1]}.{method}", "python_ms": round(python_ms, 3)}
+
+            synth.use_numpy(True)
+            if synth.is_numpy_enabled():
+                numpy_ms = measure(lambda: factory(*args))
+                result["numpy_ms"] = round(numpy_ms, 3)
+                result["speedup"] = round(python_ms / numpy_ms, 1) if numpy_ms > 0 else None
+
+            cached_factory(*args)  # キャッシュに保存しておく
+            result["cached_ms"] = round(measure(lambda: cached_factory(*args)), 3)
+            results.append(result)
+    finally:
+        synth.use_numpy(previous)
+
+    return results
+
+
+def _decode_first_channel(sound, mixer_format: tuple[int, int, int]) -> list[float]:
+    """Sound の PCM から最初のチャンネルのサンプルを取り出す（中心が 0 になるよう戻す）"""
+    import array
+
+    from shared import synth
+
+    _, size, channels = mixer_format
+    samples = array.array(synth.SAMPLE_TYPECODES[size], sound.get_raw())[::channels]
+    offset = 0 if size < 0 else 2 ** (size - 1)
+    return [v - offset for v in samples]
+
+
+def _estimate_pitch(samples: list[float], sample_rate: int) -> float | None:
+    """上向きのゼロ交差の間隔から基本周波数を推定する"""
+    crossings = [i for i in range(1, len(samples)) if samples[i - 1] < 0 <= samples[i]]
+    if len(crossings) < 2:
+        return None
+    return sample_rate * (len(crossings) - 1) / (crossings[-1] - crossings[0])
+
+
+def run_synth_check() -> list[dict]:
+    """
+    ミキサーの形式ごとに、効果音の長さと基本周波数が仕様どおりか確認する
+
+    ミキサーを SYNTH_CHECK_FORMATS の各形式で初期化し直して効果音を合成し、
+    Sound の長さと（指定があれば）ゼロ交差から求めた周波数を比較する。
+
+    Returns:
+        形式ごとの結果のリスト（"ok" が False のものは仕様と異なる）
+    """
+    import pygame
+
+    results = []
+    for mixer_format in SYNTH_CHECK_FORMATS:
+        pygame.mixer.quit()
+        pygame.mixer.init(*mixer_format)
+        actual_format = pygame.mixer.get_init()
+        rate = actual_format[0]
+
+        sounds = []
+        for spec, method, args, duration, pitch in SYNTH_BENCH_SOUNDS:
+            factory = inspect.unwrap(getattr(_load_game_class(spec), method))
+            sound = factory(*args)
+            length = sound.get_length()
+            check = {
+                "sound": f"{spec.split(':')[1]}.{method}",
+                "length_s": round(length, 4),
+                "ok": abs(length - duration) <= duration * SYNTH_CHECK_TOLERANCE,
+            }
+            if pitch is not None:
+                measured = _estimate_pitch(_decode_first_channel(sound, actual_format), rate)
+                check["pitch_hz"] = round(measured, 2) if measured is not None else None
+                check["ok"] = check["ok"] and (
+                    measured is not None and abs(measured - pitch) <= pitch * SYNTH_CHECK_TOLERANCE
+                )
+            sounds.append(check)
+
+        results.append(
+            {
+                "requested": list(mixer_format),
+                "mixer": list(actual_format),
+                "ok": all(c["ok"] for c in sounds),
+                "sounds": sounds,
+            }
+        )
+    pygame.mixer.quit()
+    return results
+
+
+def _write_wav(path: Path, sound, mixer_format: tuple[int, int, int]) -> None:
+    """Sound の PCM を WAV ファイルに書き出す（符号付き 16bit のミキサー用）"""
+    import wave
+
+    frequency, size, channels = mixer_format
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(channels)
+        f.setsampwidth(abs(size) // 8)
+        f.setframerate(frequency)
+        f.writeframes(sound.get_raw())
+
+
+def run_sample_bank() -> list[dict]:
+    """
+    Baby Piano の鍵盤の音を、音階ごとのファイルから読み込む場合と、
+    1つの録音からサンプルバンク（shared/sample_bank.py）で作る場合で比較する
+
+    録音の代わりに合成した音を WAV ファイルに書き出して使う。音域ごとに、
+    ファイル数・ファイルサイズ・メモリ上の PCM のサイズ・読み込み（作成）時間を記録する。
+
+    Returns:
+        音域ごとの計測結果のリスト
+    """
+    import tempfile
+
+    import pygame
+
+    from shared import synth
+    from shared.audio import init_audio
+    from shared.resource_cache import get_resource_cache
+    from shared.sample_bank import SampleBank, equal_temperament
+
+    init_audio()
+    mixer_format = pygame.mixer.get_init()
+    piano_module = importlib.import_module("apps.baby_piano.game")
+    synthesize = inspect.unwrap(piano_module.BabyPianoGame._synthesize_note)
+    root_freq = piano_module.INSTRUMENT_ROOT_FREQ
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        source_path = directory / "instrument.wav"
+        _write_wav(source_path, synthesize(root_freq), mixer_format)
+
+        for octaves, semitones in SAMPLE_BANK_RANGES.items():
+            freqs = equal_temperament(root_freq, semitones)
+
+            # 音階ごとのファイル（従来の c4.wav〜c5.wav と同じ方式）
+            paths = []
+            for i, freq in enumerate(freqs):
+                path = directory / f"note{octaves}_{i}.wav"
+                _write_wav(path, synthesize(freq), mixer_format)
+                paths.append(path)
+            start = time.perf_counter()
+            sounds = [pygame.mixer.Sound(str(path)) for path in paths]
+            per_file_ms = (time.perf_counter() - start) * 1000.0
+
+            result = {
+                "octaves": octaves,
+                "notes": len(freqs),
+                "mixer": list(mixer_format),
+                "per_file": {
+                    "files": len(paths),
+                    "disk_bytes": sum(path.stat().st_size for path in paths),
+                    "pcm_bytes": sum(len(sound.get_raw()) for sound in sounds),
+                    "load_ms": round(per_file_ms, 3),
+                },
+            }
+
+            # サンプルバンク（1つの録音から全ての音階を作る）
+            bank_result = {"files": 1, "disk_bytes": source_path.stat().st_size}
+            previous = synth.is_numpy_enabled()
+            try:
+                for label, enabled in (("numpy_ms", True), ("python_ms", False)):
+                    synth.use_numpy(enabled)
+                    if enabled and not synth.is_numpy_enabled():
+                        continue
+                    get_resource_cache().clear()
+                    start = time.perf_counter()
+                    bank = SampleBank.load(source_path, root_freq)
+                    bank.prerender(freqs)
+                    bank_result[label] = round((time.perf_counter() - start) * 1000.0, 3)
+            finally:
+                synth.use_numpy(previous)
+            bank_result["pcm_bytes"] = sum(len(bank.get(freq).get_raw()) for freq in freqs)
+            result["sample_bank"] = bank_result
+            results.append(result)
+
+    get_resource_cache().clear()
+    return results
+
+
+def _update_particle_list(particles: list[dict], gravity: float, dt: float) -> None:
+    """従来のパーティクルの更新（dict のリストと list.remove()。比較用）"""
+    for particle in particles[:]:
+        particle["x"] += particle["vx"] * dt
+        particle["y"] += particle["vy"] * dt
+        particle["vy"] += gravity * dt
+        particle["life"] -= particle["decay"] * dt
+        if particle["life"] <= 0:
+            particles.remove(particle)
+
+
+def _draw_particle_list(screen, particles: list[dict]) -> None:
+    """従来のパーティクルの描画（1つずつ SRCALPHA の Surface を作る。比較用）"""
+    import pygame
+
+    for particle in particles:
+        radius = int(particle["size"] * particle["life"])
+        if radius > 0:
+            surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(
+                surface, (*particle["color"], int(255 * particle["life"])), (radius, radius), radius
+            )
+            screen.blit(surface, (int(particle["x"] - radius), int(particle["y"] - radius)))
+
+
+def run_particles(
+    counts: list[int] = PARTICLE_BENCH_COUNTS, frames: int = PARTICLE_BENCH_FRAMES, seed: int = 0
+) -> list[dict]:
+    """
+    パーティクルの更新・描画時間を、ParticleSystem（NumPy / 純 Python）と従来のリストで比較する
+
+    毎フレーム、消えた分のパーティクルを追加して数を保ちながら計測する（追加の時間は含めない）。
+    描画は不透明の円（draw_ms）と、寿命に合わせた半透明の円（fade_draw_ms）を計測する。
+    従来のリスト（list）の描画は、1つずつ SRCALPHA の Surface を作る半透明の円だけを計測する。
+
+    Args:
+        counts: パーティクル数のリスト
+        frames: 更新を計測するフレーム数
+        seed: 乱数シード
+
+    Returns:
+        パーティクル数と実装ごとの計測結果のリスト
+    """
+    import pygame
+
+    from shared.particles import ParticleSystem
+
+    gravity = 300.0
+    dt = 1 / 60
+    width, height = 1280, 800
+    screen = pygame.Surface((width, height))
+
+    def new_particle(rng: random.Random) -> dict:
+        return {
+            "x": rng.uniform(0, width),
+            "y": rng.uniform(0, height),
+            "vx": rng.uniform(-200, 200),
+            "vy": rng.uniform(-200, 200),
+            "size": rng.uniform(3, 15),
+            "color": rng.choice([(255, 120, 120), (120, 200, 255), (255, 255, 100)]),
+            "decay": rng.uniform(0.5, 2.0),
+            "life": 1.0,
+        }
+
+    def fill(system: ParticleSystem, count: int, rng: random.Random) -> None:
+        while len(system) < count:
+            particle = new_particle(rng)
+            system.emit(
+                particle["x"], particle["y"], particle["vx"], particle["vy"],
+                particle["size"], particle["color"], particle["decay"],
+            )
+
+    results = []
+    for count in counts:
+        for impl in ("numpy", "python", "list"):
+            rng = random.Random(seed)
+            if impl == "list":
+                particles: list[dict] = []
+                update_times = []
+                for _ in range(frames):
+                    particles.extend(new_particle(rng) for _ in range(count - len(particles)))
+                    start = time.perf_counter()
+                    _update_particle_list(particles, gravity, dt)
+                    update_times.append((time.perf_counter() - start) * 1000.0)
+                draw_times = []
+                for _ in range(PARTICLE_BENCH_DRAW_FRAMES):
+                    particles.extend(new_particle(rng) for _ in range(count - len(particles)))
+                    _update_particle_list(particles, gravity, dt)
+                    screen.fill((255, 255, 255))
+                    start = time.perf_counter()
+                    _draw_particle_list(screen, particles)
+                    draw_times.append((time.perf_counter() - start) * 1000.0)
+                results.append({
+                    "particles": count,
+                    "impl": impl,
+                    "update_ms": _summarize_ms(update_times),
+                    "fade_draw_ms": _summarize_ms(draw_times),
+                })
+                continue
+
+            system = ParticleSystem(gravity=gravity, vectorized=impl == "numpy")
+            if system.vectorized != (impl == "numpy"):
+                continue  # NumPy がない
+            update_times = []
+            for _ in range(frames):
+                fill(system, count, rng)
+                start = time.perf_counter()
+                system.update(dt)
+                update_times.append((time.perf_counter() - start) * 1000.0)
+
+            result = {"particles": count, "impl": impl, "update_ms": _summarize_ms(update_times)}
+            for key, fade in (("draw_ms", False), ("fade_draw_ms", True)):
+                system.fade = fade
+                draw_times = []
+                for _ in range(PARTICLE_BENCH_DRAW_FRAMES):
+                    fill(system, count, rng)
+                    system.update(dt)
+                    screen.fill((255, 255, 255))
+                    start = time.perf_counter()
+                    system.draw(screen, 0.5)
+                    draw_times.append((time.perf_counter() - start) * 1000.0)
+                result[key] = _summarize_ms(draw_times)
+            results.append(result)
+
+    return results
+
+
+def _time_draws(game, frames: int, seed: int) -> list[float]:
+    """合成入力を与えながらゲームを frames フレーム進め、各フレームの draw() だけの時間（ms）を返す"""
+    from shared.constants import SIMULATION_DT
+
+    draw_times = []
+    inputs = synthetic_input(seed, game.width, game.height)
+    for _ in range(frames):
+        game.handle_events(next(inputs))
+        game.update(SIMULATION_DT)
+        start = time.perf_counter()
+        game.draw()
+        draw_times.append((time.perf_counter() - start) * 1000.0)
+        game.return_to_launcher = False
+
+    return draw_times
+
+
+def run_sprites(specs: list[str], frames: int, seed: int) -> list[dict]:
+    """
+    キャラクターを毎フレーム pygame.draw で描く場合（primitive）と、
+    焼き付けたスプライト（shared/sprite_baker.py）を貼る場合（baked）で描画時間を比較する
+
+    同じシード・同じ合成入力で、ゲームごとに draw() 全体の時間、そのうちキャラクターを
+    描いた時間（SpriteBaker.draw() の合計を 1 フレームあたりにしたもの）、1 フレームあたりの
+    pygame.draw の呼び出し回数を計測する。焼き付けの多くは最初の WARMUP_FRAMES フレーム
+    （と起動時）に済む。スプライトを焼き付けなかったゲームは結果に含めない。
+
+    Args:
+        specs: "モジュール名:クラス名" のリスト
+        frames: 計測フレーム数
+        seed: 乱数シード
+
+    Returns:
+        ゲームごとの計測結果のリスト
+    """
+    import pygame
+
+    from shared.audio import init_audio, pre_init_audio
+    from shared.constants import DEFAULT_HEIGHT, DEFAULT_WIDTH
+    from shared.sprite_baker import get_sprite_baker
+
+    pre_init_audio()
+    pygame.init()
+    init_audio()
+    screen = pygame.display.set_mode((DEFAULT_WIDTH, DEFAULT_HEIGHT))
+    baker = get_sprite_baker()
+    sprite_ms = [0.0]
+    baker_draw = baker.draw
+
+    def timed_draw(*args, **kwargs) -> None:
+        start = time.perf_counter()
+        baker_draw(*args, **kwargs)
+        sprite_ms[0] += (time.perf_counter() - start) * 1000.0
+
+    results = []
+    try:
+        for spec in specs:
+            game_class = _load_game_class(spec)
+            result: dict[str, Any] = {"game": game_class.name, "spec": spec}
+            for mode in ("primitive", "baked"):
+                baker.enabled = mode == "baked"
+                baker.clear()
+                baker.stats.update(hits=0, misses=0, evictions=0)
+
+                random.seed(seed)
+                game = game_class(screen)
+                game.on_enter()
+                _drive_frames(game, WARMUP_FRAMES, seed)
+                random.seed(seed)
+                sprite_ms[0] = 0.0
+                baker.draw = timed_draw
+                try:
+                    draw_times = _time_draws(game, frames, seed)
+                finally:
+                    del baker.draw
+                draw_calls = _count_draw_ops(game, min(frames, DRAW_OPS_FRAMES), seed)["draw_calls"]
+                game.on_exit()
+
+                result[mode] = {
+                    "draw_ms": _summarize_ms(draw_times),
+                    "sprite_ms_per_frame": round(sprite_ms[0] / frames, 4),
+                    "draw_calls": draw_calls,
+                }
+                if mode == "baked":
+                    result[mode].update(sprites=len(baker), bytes=baker.bytes_used, **baker.stats)
+            if result["baked"]["sprites"]:
+                results.append(result)
+    finally:
+        baker.enabled = True
+        pygame.quit()
+
+    return results
+
+
+def run_layers(specs: list[str], frames: int, seed: int) -> list[dict]:
+    """
+    静的な部分を毎フレーム pygame.draw で直接描く場合（direct）と、保存したレイヤー
+    （shared/layers.py）を貼る場合（composited）で描画時間と描画の回数を比較する
+
+    同じシード・同じ合成入力で、ゲームごとに draw() 全体の時間と、1 フレームあたりの
+    画面への blit・fill と pygame.draw の呼び出し回数を計測する。
+    LayerCompositor を使っていないゲームは結果に含めない。
+
+    Args:
+        specs: "モジュール名:クラス名" のリスト
+        frames: 計測フレーム数
+        seed: 乱数シード
+
+    Returns:
+        ゲームごとの計測結果のリスト
+    """
+    import pygame
+
+    from shared.audio import init_audio, pre_init_audio
+    from shared.constants import DEFAULT_HEIGHT, DEFAULT_WIDTH
+    from shared.layers import LayerCompositor
+
+    pre_init_audio()
+    pygame.init()
+    init_audio()
+    screen = pygame.display.set_mode((DEFAULT_WIDTH, DEFAULT_HEIGHT))
+
+    results = []
+    try:
+        for spec in specs:
+            game_class = _load_game_class(spec)
+            result: dict[str, Any] = {"game": game_class.name, "spec": spec}
+            for mode in ("direct", "composited"):
+                random.seed(seed)
+                game = game_class(screen)
+                layers = getattr(game, "layers", None)
+                if not isinstance(layers, LayerCompositor):
+                    break
+                layers.enabled = mode == "composited"
+                game.on_enter()
+                _drive_frames(game, WARMUP_FRAMES, seed)
+                random.seed(seed)
+                draw_times = _time_draws(game, frames, seed)
+                draw_ops = _count_draw_ops(game, min(frames, DRAW_OPS_FRAMES), seed)
+                game.on_exit()
+
+                result[mode] = {"draw_ms": _summarize_ms(draw_times), **draw_ops}
+                if mode == "composited":
+                    result[mode].update(
+                        layers=len(layers.layers),
+                        layer_renders=layers.stats["renders"],
+                        layer_blits=layers.stats["blits"],
+                    )
+            else:
+                results.append(result)
+    finally:
+        pygame.quit()
+
+    return results
+
+
+def _summarize_ms(values: list[float]) -> dict:
+    """時間（ms）のリストを p50 / p95 / max にまとめる"""
+    from shared.profiler import percentile
+
+    ordered = sorted(values)
+    return {
+        "p50": round(percentile(ordered, 0.50), 3),
+        "p95": round(percentile(ordered, 0.95), 3),
+        "max": round(ordered[-1], 3),
+    }
+
+
+def run_latency_single(profile: str, taps: int = LATENCY_TAPS) -> dict:
+    """
+    タップから音が鳴るまでの時間を計測する（子プロセス内で呼ばれる）
+
+    合成した MOUSEBUTTONDOWN を handle_events() に渡してから Sound.play() が呼ばれる
+    （チャンネルが再生中になる）までの時間を計測する。
+    音声バッファに書き込まれる時刻は pygame から取得できないため、
+    play() の後にミキサーがバッファ1つ分を処理するまでの最大値として
+    submit_ms = play_ms + buffer_ms で見積もる。
+
+    Args:
+        profile: 音声プロファイル名（shared/audio.py）
+        taps: ゲームごとのタップ回数
+
+    Returns:
+        計測結果の辞書
+    """
+    _use_dummy_drivers()
+    import pygame
+
+    from shared.audio import get_audio_config, init_audio, pre_init_audio
+    from shared.sfx import get_sfx_dispatcher
+    from shared.constants import DEFAULT_HEIGHT, DEFAULT_WIDTH, FPS, SIMULATION_DT
+
+    config = pre_init_audio(get_audio_config(profile))
+    pygame.init()
+    init_audio(config)
+    screen = pygame.display.set_mode((DEFAULT_WIDTH, DEFAULT_HEIGHT))
+
+    games = {}
+    for spec, target in LATENCY_TARGETS.items():
+        game = _load_game_class(spec)(screen)
+        game.on_enter()
+        _drive_frames(game, WARMUP_FRAMES, seed=0)
+
+        sfx = get_sfx_dispatcher()
+        sfx.reset_stats()
+        play_ms = []
+        for i in range(taps):
+            pygame.mixer.stop()
+            sfx.stop_all()
+            pos = target(game, i)
+
+            start = time.perf_counter()
+            game.handle_events([pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)])
+            if not pygame.mixer.get_busy():
+                # update() で鳴らすゲームもあるので1フレーム分進めて確認する
+                game.update(SIMULATION_DT)
+            if pygame.mixer.get_busy():
+                play_ms.append((time.perf_counter() - start) * 1000.0)
+
+            game.handle_events([pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=1)])
+            game.update(SIMULATION_DT)
+            game.draw()
+            pygame.display.flip()
+
+        # 連打: 前の音を止めずに毎フレーム（実時間で 1/FPS 秒ごとに）タップし、
+        # タップの処理時間を計測する
+        mash_ms = []
+        for i in range(taps):
+            pos = target(game, i)
+            start = time.perf_counter()
+            game.handle_events([pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)])
+            mash_ms.append((time.perf_counter() - start) * 1000.0)
+
+            game.handle_events([pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=1)])
+            game.update(SIMULATION_DT)
+            game.draw()
+            pygame.display.flip()
+            time.sleep(max(0.0, SIMULATION_DT - (time.perf_counter() - start)))
+
+        result = {"taps": taps, "played": len(play_ms)}
+        if play_ms:
+            result["play_ms"] = _summarize_ms(play_ms)
+            result["submit_ms"] = _summarize_ms([ms + config.buffer_ms for ms in play_ms])
+        result["mash_tap_ms"] = _summarize_ms(mash_ms)
+        voices = getattr(game, "voices", None)
+        if voices is not None:
+            result["voices"] = dict(voices.stats)
+        result["sfx"] = dict(sfx.stats)
+        game.on_exit()
+        games[spec.split(":")[1]] = result
+
+    return {
+        "driver": os.environ.get("SDL_AUDIODRIVER"),
+        "profile": profile,
+        "mixer": list(pygame.mixer.get_init()),
+        "buffer": config.buffer,
+        "buffer_ms": round(config.buffer_ms, 3),
+        # タップはフレームの先頭でまとめて処理されるので、最大で1フレーム待つ
+        "frame_wait_max_ms": round(1000.0 / FPS, 3),
+        "games": games,
+    }
+
+
+def run_latency(profiles: list[str], drivers: list[str] = LATENCY_DRIVERS) -> list[dict]:
+    """
+    音声ドライバと音声プロファイルの組み合わせごとに、別プロセスでタップの遅延を計測する
+
+    Returns:
+        組み合わせごとの計測結果のリスト（ドライバが使えない場合は "error" を含む）
+    """
+    results = []
+    for driver in drivers:
+        for profile in profiles:
+            command = [sys.executable, "-m", "shared.bench", "--latency-single", profile]
+            env = {**os.environ, "SDL_AUDIODRIVER": driver, "PYGAME_HIDE_SUPPORT_PROMPT": "1"}
+            proc = subprocess.run(command, cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+
+            lines = proc.stdout.strip().splitlines()
+            if proc.returncode != 0 or not lines:
+                error = (proc.stderr.strip().splitlines() or ["failed"])[-1]
+                results.append({"driver": driver, "profile": profile, "error": error})
+                continue
+            results.append(json.loads(lines[-1]))
+
+    return results
+
+
+def run_all(specs: list[str], frames: int, seed: int, prewarm: bool = False) -> list[dict]:
+    """
+    各ゲームを別プロセスで計測する（ピーク RSS をゲームごとに分けるため）
+
+    Returns:
+        ゲームごとの計測結果のリスト（失敗したゲームは "error" を含む）
+    """
+    results = []
+    for spec in specs:
+        command = [
+            sys.executable, "-m", "shared.bench",
+            "--single", spec,
+            "--frames", str(frames),
+            "--seed", str(seed),
+        ]
+        if prewarm:
+            command.append("--prewarm")
+        env = {**os.environ, "PYGAME_HIDE_SUPPORT_PROMPT": "1"}
+        proc = subprocess.run(command, cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+
+        lines = proc.stdout.strip().splitlines()
+        if proc.returncode != 0 or not lines:
+            error = (proc.stderr.strip().splitlines() or ["failed"])[-1]
+            results.append({"spec": spec, "error": error})
+            continue
+        results.append(json.loads(lines[-1]))
+
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    """コマンドラインのエントリーポイント"""
+    parser = argparse.ArgumentParser(description="Baby Fun Box headless benchmark")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="計測フレーム数")
+    parser.add_argument("--seed", type=int, default=0, help="乱数シード")
+    parser.add_argument("--game", action="append", default=[], help="計測するゲーム（名前の一部、複数指定可）")
+    parser.add_argument("--output", type=Path, help="結果を書き出す JSON ファイル")
+    parser.add_argument("--replay", type=Path, help="記録した操作を再生して計測する")
+    parser.add_argument("--prewarm", action="store_true", help="起動前に prewarm() を実行しておく")
+    parser.add_argument("--synth", action="store_true", help="効果音の合成時間を計測する")
+    parser.add_argument(
+        "--synth-check", action="store_true", help="ミキサーの形式ごとに効果音の長さと音程を確認する"
+    )
+    parser.add_argument(
+        "--latency", action="store_true", help="タップから音が鳴るまでの時間を音声プロファイルごとに計測する"
+    )
+    parser.add_argument(
+        "--audio-profile", action="append", default=[], help="--latency で計測する音声プロファイル（複数指定可）"
+    )
+    parser.add_argument(
+        "--sample-bank", action="store_true", help="ピアノの音を音階ごとのファイルとサンプルバンクで比較する"
+    )
+    parser.add_argument(
+        "--particles", action="store_true", help="パーティクルの更新・描画時間を実装ごとに比較する"
+    )
+    parser.add_argument(
+        "--sprites", action="store_true", help="キャラクターの描画時間を pygame.draw と焼き付けたスプライトで比較する"
+    )
+    parser.add_argument(
+        "--layers", action="store_true", help="静的な部分の描画を毎フレーム直接描く場合と保存したレイヤーで比較する"
+    )
+    parser.add_argument("--single", help=argparse.SUPPRESS)  # 子プロセス用
+    parser.add_argument("--latency-single", help=argparse.SUPPRESS)  # 子プロセス用
+    args = parser.parse_args(argv)
+
+    _use_dummy_drivers()
+
+    if args.latency_single:
+        print(json.dumps(run_latency_single(args.latency_single), ensure_ascii=False))
+        return
+
+    if args.single:
+        result = run_single(args.single, args.frames, args.seed, args.prewarm)
+        print(json.dumps(result, ensure_ascii=False))
+        return
+
+    if args.replay:
+        report = run_replay(args.replay)
+    elif args.latency:
+        from shared.audio import AUDIO_PROFILES
+
+        report = {"results": run_latency(args.audio_profile or list(AUDIO_PROFILES))}
+    elif args.synth_check:
+        report = {"results": run_synth_check()}
+        report["ok"] = all(r["ok"] for r in report["results"])
+    elif args.particles:
+        from shared.sprite_atlas import get_circle_atlas
+
+        results = run_particles(seed=args.seed)
+        atlas = get_circle_atlas()
+        report = {
+            "seed": args.seed,
+            "results": results,
+            "atlas": {"sprites": len(atlas), "bytes": atlas.bytes_used, **atlas.stats},
+        }
+    elif args.sample_bank:
+        report = {"results": run_sample_bank()}
+    elif args.sprites:
+        specs = discover_games()
+        if args.game:
+            specs = [s for s in specs if any(g.lower() in s.lower() for g in args.game)]
+        report = {"frames": args.frames, "seed": args.seed, "results": run_sprites(specs, args.frames, args.seed)}
+    elif args.layers:
+        specs = discover_games()
+        if args.game:
+            specs = [s for s in specs if any(g.lower() in s.lower() for g in args.game)]
+        report = {"frames": args.frames, "seed": args.seed, "results": run_layers(specs, args.frames, args.seed)}
+    elif args.synth:
+        from shared import synth
+
+        report = {"numpy_available": synth.np is not None, "results": run_synth()}
+    else:
+        specs = discover_games()
+        if args.game:
+            specs = [s for s in specs if any(g.lower() in s.lower() for g in args.game)]
+
+        report = {
+            "frames": args.frames,
+            "seed": args.seed,
+            "prewarm": args.prewarm,
+            "results": run_all(specs, args.frames, args.seed, args.prewarm),
+        }
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+    if args.synth_check and not report["ok"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
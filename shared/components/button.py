@@ -20,6 +20,8 @@ from shared.constants import (
     WHITE,
 )
 from shared.fonts import get_font
+from shared.scaled_surfaces import scaled_surface
+from shared.text_cache import render_text
 
 
 @dataclass
@@ -104,7 +106,7 @@ class Button:
 
         # テキストを描画
         if self.text and self._font:
-            text_surface = self._font.render(self.text, True, self.text_color)
+            text_surface = render_text(self._font, self.text, self.text_color)
             text_rect = text_surface.get_rect(center=self.center)
             screen.blit(text_surface, text_rect)
 
@@ -146,6 +148,11 @@ class IconButton:
         """アイコン部分の中心座標"""
         return (self.x + self.size // 2, self.y + self.size // 2)
 
+    @property
+    def is_highlighted(self) -> bool:
+        """ホバーまたは押下中で強調表示されているか"""
+        return self._is_hovered or self._is_pressed
+
     def contains_point(self, x: int, y: int) -> bool:
         """指定した点がボタン内にあるか判定"""
         return self.rect.collidepoint(x, y)
@@ -191,7 +198,7 @@ class IconButton:
         if self.icon:
             # アイコンをリサイズして中央に配置
             icon_size = int(self.size * 0.6)
-            scaled_icon = pygame.transform.scale(self.icon, (icon_size, icon_size))
+            scaled_icon = scaled_surface(self.icon, (icon_size, icon_size))
             icon_pos = (
                 self.x + (self.size - icon_size) // 2,
                 self.y + (self.size - icon_size) // 2,
@@ -202,13 +209,13 @@ class IconButton:
             if self.label and self._font:
                 big_font = get_font(72)
                 initial = self.label[0].upper()
-                text_surface = big_font.render(initial, True, WHITE)
+                text_surface = render_text(big_font, initial, WHITE)
                 text_rect = text_surface.get_rect(center=self.center)
                 screen.blit(text_surface, text_rect)
 
         # ラベルを描画
         if self.label and self._font:
-            text_surface = self._font.render(self.label, True, (50, 50, 50))
+            text_surface = render_text(self._font, self.label, (50, 50, 50))
             text_rect = text_surface.get_rect(
                 centerx=self.x + self.size // 2,
                 top=self.y + self.size + 5,
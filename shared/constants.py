@@ -15,6 +15,19 @@ DEFAULT_HEIGHT: int = 768
 # フレームレート
 FPS: int = 60
 
+# アイドル時のフレームレート（アニメーションも入力もないとき）
+IDLE_FPS: int = 10
+
+# 最後の入力からアイドル状態に移るまでの時間（秒）
+IDLE_DELAY: float = 1.0
+
+# シミュレーションの固定タイムステップ（秒）
+SIMULATION_DT: float = 1.0 / FPS
+
+# 1フレームで進めるシミュレーション時間の上限（秒）
+# 長時間止まった後に大量の update() が走るのを防ぐ
+MAX_FRAME_TIME: float = 0.25
+
 
 # =============================================================================
 # 色定義（RGB）
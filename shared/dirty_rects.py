@@ -0,0 +1,71 @@
+"""
+ダーティ矩形管理 - 変化した領域だけを画面に転送する
+
+毎フレーム pygame.display.flip() で画面全体を転送する代わりに、
+変化した領域だけを pygame.display.update(rects) で転送する。
+変化した面積が大きい場合は全体転送（flip）に切り替える。
+"""
+
+import pygame
+
+# 画面面積に対する変化領域の割合がこれを超えたら全体を flip する
+DIRTY_FULL_FLIP_THRESHOLD: float = 0.5
+
+
+class DirtyRegions:
+    """フレーム内で変化した領域を集めて画面に反映する"""
+
+    def __init__(
+        self,
+        screen_size: tuple[int, int],
+        threshold: float = DIRTY_FULL_FLIP_THRESHOLD,
+    ) -> None:
+        """
+        Args:
+            screen_size: 画面サイズ (幅, 高さ)
+            threshold: 全体 flip に切り替える面積の割合（0.0〜1.0）
+        """
+        self.screen_rect = pygame.Rect((0, 0), screen_size)
+        self.threshold = threshold
+        self.rects: list[pygame.Rect] = []
+        self.full_redraw = True  # 最初のフレームは必ず全体を描画する
+
+    @property
+    def needs_redraw(self) -> bool:
+        """このフレームで描画が必要か"""
+        return self.full_redraw or bool(self.rects)
+
+    def mark(self, rect: pygame.Rect | tuple[int, int, int, int]) -> None:
+        """
+        変化した領域を登録する
+
+        Args:
+            rect: 変化した矩形（画面座標）
+        """
+        if self.full_redraw:
+            return
+
+        clipped = pygame.Rect(rect).clip(self.screen_rect)
+        if clipped.width > 0 and clipped.height > 0:
+            self.rects.append(clipped)
+
+    def mark_all(self) -> None:
+        """画面全体を変化したものとして扱う"""
+        self.full_redraw = True
+        self.rects.clear()
+
+    def present(self) -> None:
+        """登録された領域を画面に反映し、状態をリセットする"""
+        if self.full_redraw:
+            pygame.display.flip()
+        elif self.rects:
+            # 重なりは考慮しない（多めに見積もって flip 側に倒す）
+            dirty_area = sum(r.width * r.height for r in self.rects)
+            screen_area = self.screen_rect.width * self.screen_rect.height
+            if dirty_area > screen_area * self.threshold:
+                pygame.display.flip()
+            else:
+                pygame.display.update(self.rects)
+
+        self.full_redraw = False
+        self.rects.clear()
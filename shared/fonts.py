@@ -3,9 +3,14 @@
 
 pygameのデフォルトフォントは日本語をサポートしないため、
 システムの日本語フォントを使用する。
+
+フォントファイル（特に Noto CJK の .ttc）の読み込みは重いため、
+生成した Font オブジェクトはプロセス全体で共有する LRU キャッシュに保持する。
 """
 
+from collections import OrderedDict
 from pathlib import Path
+from typing import Iterable
 
 import pygame
 
@@ -27,6 +32,18 @@ JAPANESE_FONT_PATHS = [
 # キャッシュされたフォントパス
 _cached_font_path: str | None = None
 
+# フォントキャッシュの最大エントリ数（超えたら最も古く使われたものから破棄）
+FONT_CACHE_SIZE: int = 32
+
+# よく使うフォントサイズ（起動時のウォームアップ用）
+COMMON_FONT_SIZES: tuple[int, ...] = (18, 20, 28, 32, 36, 42, 48, 72, 96)
+
+# (フォントパス, サイズ, 太字, 斜体) -> Font
+_font_cache: OrderedDict[tuple[str | None, int, bool, bool], pygame.font.Font] = OrderedDict()
+
+# キャッシュの統計情報
+_font_cache_stats: dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+
 
 def get_japanese_font_path() -> str | None:
     """
@@ -48,26 +65,87 @@ def get_japanese_font_path() -> str | None:
     return None
 
 
-def get_font(size: int) -> pygame.font.Font:
+def _load_font(font_path: str | None, size: int) -> pygame.font.Font:
+    """フォントファイルから Font を生成する（失敗時はデフォルトフォント）"""
+    if font_path:
+        try:
+            return pygame.font.Font(font_path, size)
+        except Exception:
+            pass
+
+    # フォールバック: デフォルトフォント
+    return pygame.font.Font(None, size)
+
+
+def get_font(size: int, bold: bool = False, italic: bool = False) -> pygame.font.Font:
     """
     指定サイズの日本語対応フォントを取得する
 
+    同じ (パス, サイズ, スタイル) の組み合わせでは同一の Font オブジェクトを返す。
+    返された Font は共有されるため、set_bold() などで状態を変更しないこと。
+
     Args:
         size: フォントサイズ
+        bold: 太字にするか
+        italic: 斜体にするか
 
     Returns:
         pygame.font.Font オブジェクト
     """
     if not pygame.font.get_init():
+        # 以前の初期化で作った Font は font.quit() 後は使えないため破棄する
+        _font_cache.clear()
         pygame.font.init()
 
     font_path = get_japanese_font_path()
+    key = (font_path, size, bold, italic)
 
-    if font_path:
-        try:
-            return pygame.font.Font(font_path, size)
-        except Exception:
-            pass
+    font = _font_cache.get(key)
+    if font is not None:
+        _font_cache.move_to_end(key)
+        _font_cache_stats["hits"] += 1
+        return font
 
-    # フォールバック: デフォルトフォント
-    return pygame.font.Font(None, size)
+    _font_cache_stats["misses"] += 1
+    font = _load_font(font_path, size)
+    if bold:
+        font.set_bold(True)
+    if italic:
+        font.set_italic(True)
+
+    _font_cache[key] = font
+    while len(_font_cache) > FONT_CACHE_SIZE:
+        _font_cache.popitem(last=False)
+        _font_cache_stats["evictions"] += 1
+
+    return font
+
+
+def warm_up_fonts(sizes: Iterable[int] = COMMON_FONT_SIZES) -> None:
+    """
+    指定サイズのフォントを事前に読み込む
+
+    ランチャー起動時に呼ぶことで、ゲーム開始時のフォント読み込みを省く。
+
+    Args:
+        sizes: 読み込むフォントサイズ
+    """
+    for size in sizes:
+        get_font(size)
+
+
+def get_font_cache_stats() -> dict[str, int]:
+    """
+    フォントキャッシュの統計情報を取得する
+
+    Returns:
+        hits / misses / evictions / size を含む辞書
+    """
+    return {**_font_cache_stats, "size": len(_font_cache)}
+
+
+def clear_font_cache() -> None:
+    """フォントキャッシュと統計情報をクリアする"""
+    _font_cache.clear()
+    for key in _font_cache_stats:
+        _font_cache_stats[key] = 0
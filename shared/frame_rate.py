@@ -0,0 +1,115 @@
+"""
+フレームレート制御 - アイドル時のフレームレート抑制
+
+アニメーションも入力もない間は IDLE_FPS まで落とし、
+pygame.event.wait() で入力を待つことで CPU 使用率と発熱を抑える。
+入力が来た時点で待機を抜け、通常の FPS に戻る。
+入力の記録・再生（shared/replay.py）もここで行う。
+"""
+
+import pygame
+
+from shared.constants import FPS, IDLE_DELAY, IDLE_FPS
+from shared.replay import InputReplayer, get_recorder, get_replayer
+
+# アイドル状態を解除する入力イベント
+INPUT_EVENT_TYPES: frozenset[int] = frozenset(
+    {
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEMOTION,
+        pygame.MOUSEWHEEL,
+        pygame.KEYDOWN,
+        pygame.KEYUP,
+        pygame.FINGERDOWN,
+        pygame.FINGERUP,
+        pygame.FINGERMOTION,
+    }
+)
+
+
+class FrameRateGovernor:
+    """アニメーション・入力の有無に応じてフレームレートを切り替える"""
+
+    def __init__(
+        self,
+        clock: pygame.time.Clock | None = None,
+        fps: int = FPS,
+        idle_fps: int = IDLE_FPS,
+        idle_delay: float = IDLE_DELAY,
+    ) -> None:
+        """
+        Args:
+            clock: フレーム間隔の計測に使うクロック
+            fps: 通常時のフレームレート
+            idle_fps: アイドル時のフレームレート
+            idle_delay: 最後の入力からアイドルに移るまでの時間（秒）
+        """
+        self.clock = clock or pygame.time.Clock()
+        self.fps = fps
+        self.idle_fps = idle_fps
+        self.idle_delay = idle_delay
+        self.is_idle = False
+        self._last_input_ms = pygame.time.get_ticks()
+
+    def wake(self) -> None:
+        """入力があったものとして扱い、通常のフレームレートに戻す"""
+        self._last_input_ms = pygame.time.get_ticks()
+        self.is_idle = False
+
+    def next_frame(self, animating: bool) -> tuple[float, list[pygame.event.Event]]:
+        """
+        次のフレームまで待ち、経過時間とイベントを返す
+
+        Args:
+            animating: 現在アニメーション中か（True の間はアイドルにならない）
+
+        Returns:
+            (前フレームからの経過時間（秒）, イベントのリスト)
+        """
+        replayer = get_replayer()
+        if replayer is not None:
+            return self._next_replay_frame(replayer)
+
+        idle_ms = pygame.time.get_ticks() - self._last_input_ms
+        self.is_idle = not animating and idle_ms >= self.idle_delay * 1000
+
+        if self.is_idle:
+            # 入力が来ればすぐに戻る。来なければ idle_fps 相当の間隔で1フレーム進める
+            event = pygame.event.wait(1000 // self.idle_fps)
+            events = [] if event.type == pygame.NOEVENT else [event]
+            events.extend(pygame.event.get())
+            dt_ms = self.clock.tick()
+        else:
+            dt_ms = self.clock.tick(self.fps)
+            events = pygame.event.get()
+
+        for event in events:
+            if event.type in INPUT_EVENT_TYPES:
+                self.wake()
+                break
+
+        recorder = get_recorder()
+        if recorder is not None:
+            recorder.record(dt_ms, events)
+
+        return dt_ms / 1000.0, events
+
+    def _next_replay_frame(self, replayer: InputReplayer) -> tuple[float, list[pygame.event.Event]]:
+        """
+        記録したフレームを返す
+
+        実際の入力は捨てる（ウィンドウを閉じる操作だけは受け付ける）。
+        最後まで再生したら QUIT を返してループを終了させる。
+        """
+        live_events = [e for e in pygame.event.get() if e.type == pygame.QUIT]
+
+        frame = replayer.next_frame()
+        if frame is None:
+            return 0.0, [pygame.event.Event(pygame.QUIT)]
+
+        dt_ms, events = frame
+        if replayer.realtime and dt_ms > 0:
+            self.clock.tick(1000.0 / dt_ms)
+
+        return dt_ms / 1000.0, events + live_events
@@ -0,0 +1,114 @@
+"""
+レイヤー - 毎フレーム同じ背景や UI を描き直さない
+
+背景のグラデーションやタイトル、ツールバーなど、毎フレーム同じ内容を
+pygame.draw で描き直している部分を「静的なレイヤー」として宣言すると、
+LayerCompositor が最初の1回だけ Surface に描いて保存し、以降は貼るだけにする。
+内容が変わったとき（選択中の色が変わったなど）は invalidate() で描き直させる。
+動くもの（キャラクターやパーティクル）は、これまでどおり compose() の後に画面へ描く。
+
+使い方:
+    self.layers = LayerCompositor((self.width, self.height))
+    self.layers.add("background", self._draw_background)
+    self.layers.add("toolbar", self._draw_toolbar, rect=toolbar_rect)
+
+    def draw(self, alpha):
+        self.layers.compose(self.screen)    # 静的なレイヤーを貼る
+        ...                                 # 動くものを描く
+
+    self.layers.invalidate("toolbar")       # 内容が変わったら
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+import pygame
+
+
+@dataclass
+class Layer:
+    """静的なレイヤー"""
+
+    name: str
+    render: Callable[[pygame.Surface], None]  # 画面座標で描く関数
+    rect: pygame.Rect  # 画面上の範囲
+    transparent: bool = False  # 描かなかった部分を透明にするか
+    surface: pygame.Surface | None = None  # 描いた内容（None なら描き直す）
+
+
+class LayerCompositor:
+    """静的なレイヤーを保存しておき、画面に重ねて貼る"""
+
+    def __init__(self, size: tuple[int, int]) -> None:
+        """
+        Args:
+            size: 画面の大きさ（幅, 高さ）
+        """
+        self.size = size
+        self.layers: dict[str, Layer] = {}  # 追加した順（下から順に貼る）
+        self.enabled = True  # False なら保存せずに毎回描画関数で画面に直接描く（ベンチマーク用）
+        self.stats = {"renders": 0, "blits": 0}
+
+    def add(
+        self,
+        name: str,
+        render: Callable[[pygame.Surface], None],
+        rect: pygame.Rect | None = None,
+        transparent: bool = False,
+    ) -> None:
+        """
+        静的なレイヤーを追加する（追加した順に下から重ねる）
+
+        Args:
+            name: レイヤーの名前
+            render: レイヤーを描く関数（画面と同じ大きさの Surface に画面座標で描く）
+            rect: 画面上の範囲（None なら画面全体）。範囲の外に描いたものは捨てる
+            transparent: 描かなかった部分を透明にするか（False なら範囲をすべて塗りつぶす前提）
+        """
+        screen_rect = pygame.Rect((0, 0), self.size)
+        rect = pygame.Rect(rect).clip(screen_rect) if rect is not None else screen_rect
+        self.layers[name] = Layer(name, render, rect, transparent)
+
+    def invalidate(self, name: str | None = None) -> None:
+        """
+        レイヤーを次に貼るときに描き直させる
+
+        Args:
+            name: レイヤーの名前（None ならすべて）
+        """
+        layers = self.layers.values() if name is None else [self.layers[name]]
+        for layer in layers:
+            layer.surface = None
+
+    def _render(self, layer: Layer) -> pygame.Surface:
+        """レイヤーを描いて保存する"""
+        flags = pygame.SRCALPHA if layer.transparent else 0
+        canvas = pygame.Surface(self.size, flags)
+        layer.render(canvas)
+        surface = canvas.subsurface(layer.rect).copy()
+        if pygame.display.get_surface() is not None:
+            # 画面の形式に合わせて貼る時間を短くする
+            surface = surface.convert_alpha() if layer.transparent else surface.convert()
+        if layer.transparent:
+            # 透明な部分がほとんどなので、連続した画素をまとめて貼る（RLE）
+            surface.set_alpha(255, pygame.RLEACCEL)
+        self.stats["renders"] += 1
+        layer.surface = surface
+        return surface
+
+    def compose(self, screen: pygame.Surface, names: Iterable[str] | None = None) -> None:
+        """
+        静的なレイヤーを画面に貼る（無効になったレイヤーは描き直す）
+
+        Args:
+            screen: 画面
+            names: 貼るレイヤーの名前（None ならすべてを追加した順に）
+        """
+        layers = self.layers.values() if names is None else [self.layers[name] for name in names]
+        for layer in layers:
+            if not self.enabled:
+                layer.render(screen)
+                continue
+            surface = layer.surface if layer.surface is not None else self._render(layer)
+            screen.blit(surface, layer.rect)
+            self.stats["blits"] += 1
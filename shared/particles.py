@@ -0,0 +1,255 @@
+"""
+パーティクルエンジン - 多数のパーティクルを配列でまとめて動かす
+
+パーティクルを1つずつのオブジェクト（dataclass や dict）で持つと、更新は Python の
+ループで1つずつ、消滅したものの削除は list.remove() で1つずつ（O(n²)）行うことになる。
+ParticleSystem は位置・速度・寿命・大きさ・色をそれぞれ連続した配列（struct-of-arrays）に
+持ち、生きているパーティクルを1回の計算でまとめて更新し、消滅したものは配列を詰め直して
+取り除く。NumPy があれば NumPy の配列で、なければ Python のリストで同じ計算を行う
+（array.array より要素の読み書きが速い）。
+
+使い方:
+    self.particles = ParticleSystem(gravity=1080.0, fade=True)
+    self.particles.emit(x, y, vx, vy, size=10, color=(255, 0, 0), decay=1.2)
+    self.particles.update(dt)           # update() で呼ぶ
+    self.particles.draw(screen, alpha)  # draw() で呼ぶ
+"""
+
+import pygame
+
+from shared.sprite_atlas import CircleSpriteAtlas, get_circle_atlas
+
+try:
+    import numpy as np
+except ImportError:  # NumPy がない環境では純 Python で計算する
+    np = None
+
+# 最初に確保するパーティクル数（足りなくなったら倍にする）
+PARTICLE_INITIAL_CAPACITY: int = 256
+
+# 実数の配列（位置・速度・寿命・大きさ）
+_FLOAT_FIELDS: tuple[str, ...] = ("x", "y", "prev_x", "prev_y", "vx", "vy", "life", "decay", "size")
+
+
+class ParticleSystem:
+    """
+    パーティクルを配列で管理する
+
+    life は 1.0 で生まれ、毎秒 decay ずつ減って 0 以下で消える。
+    描画する半径は size * life（fade=True なら不透明度も life に比例）。
+    円は共有のアトラス（shared/sprite_atlas.py）に保存したものを貼る。
+    """
+
+    def __init__(
+        self,
+        gravity: float = 0.0,
+        fade: bool = False,
+        capacity: int = PARTICLE_INITIAL_CAPACITY,
+        vectorized: bool | None = None,
+    ) -> None:
+        """
+        Args:
+            gravity: 下向きの加速度（px/秒^2）
+            fade: 寿命に合わせて半透明にするか
+            capacity: 最初に確保するパーティクル数
+            vectorized: NumPy で計算するか（None なら NumPy があれば使う。ベンチマーク用）
+        """
+        self.gravity = gravity
+        self.fade = fade
+        self.vectorized = np is not None if vectorized is None else vectorized and np is not None
+        self.count = 0  # 生きているパーティクル数（配列の先頭から count 個）
+        self.capacity = 0
+        # 色は一覧（colors）の番号で持つ
+        self.colors: list[tuple[int, int, int]] = []
+        self._color_ids: dict[tuple[int, int, int], int] = {}
+        self._resize(max(1, capacity))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _new_array(self, typecode: str, capacity: int):
+        """配列を確保する（typecode は "d": 実数、"H": 色の番号）"""
+        if self.vectorized:
+            return np.zeros(capacity, dtype=typecode)
+        return [0] * capacity if typecode == "H" else [0.0] * capacity
+
+    def _fields(self) -> list[str]:
+        return [*_FLOAT_FIELDS, "color"]
+
+    def _resize(self, capacity: int) -> None:
+        """配列を確保し直す（生きているパーティクルはコピーする）"""
+        for name in self._fields():
+            new = self._new_array("H" if name == "color" else "d", capacity)
+            if self.count:
+                new[: self.count] = getattr(self, name)[: self.count]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def _color_id(self, color: tuple[int, int, int]) -> int:
+        color_id = self._color_ids.get(color)
+        if color_id is None:
+            color_id = self._color_ids[color] = len(self.colors)
+            self.colors.append(color)
+        return color_id
+
+    def emit(
+        self,
+        x: float,
+        y: float,
+        vx: float,
+        vy: float,
+        size: float,
+        color: tuple[int, int, int],
+        decay: float = 1.0,
+    ) -> None:
+        """
+        パーティクルを1つ追加する
+
+        Args:
+            x, y: 位置
+            vx, vy: 速度（px/秒）
+            size: 生まれたときの半径
+            color: 色
+            decay: 寿命の減る速さ（毎秒。1 / decay 秒で消える）
+        """
+        if self.count == self.capacity:
+            self._resize(self.capacity * 2)
+
+        i = self.count
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.life[i] = 1.0
+        self.decay[i] = decay
+        self.size[i] = size
+        self.color[i] = self._color_id(color)
+        self.count += 1
+
+    def clear(self) -> None:
+        """パーティクルをすべて消す"""
+        self.count = 0
+
+    def update(self, dt: float) -> None:
+        """生きているパーティクルをまとめて動かし、消滅したものを取り除く"""
+        if self.count == 0:
+            return
+        if self.vectorized:
+            self._update_numpy(dt)
+        else:
+            self._update_python(dt)
+
+    def _update_numpy(self, dt: float) -> None:
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        x += self.vx[:n] * dt
+        y += self.vy[:n] * dt
+        if self.gravity:
+            self.vy[:n] += self.gravity * dt
+        life = self.life[:n]
+        life -= self.decay[:n] * dt
+
+        # 生きているものを先頭に詰める（順番は変えない）
+        alive = life > 0
+        remaining = int(np.count_nonzero(alive))
+        if remaining < n:
+            for name in self._fields():
+                values = getattr(self, name)
+                values[:remaining] = values[:n][alive]
+            self.count = remaining
+
+    def _update_python(self, dt: float) -> None:
+        x, y, prev_x, prev_y = self.x, self.y, self.prev_x, self.prev_y
+        vx, vy, life, decay, size, color = self.vx, self.vy, self.life, self.decay, self.size, self.color
+        gravity = self.gravity * dt
+
+        # 更新しながら、生きているものを先頭に詰める（1回のループ）
+        alive = 0
+        for i in range(self.count):
+            remaining = life[i] - decay[i] * dt
+            if remaining <= 0:
+                continue
+            px, py = x[i], y[i]
+            prev_x[alive] = px
+            prev_y[alive] = py
+            x[alive] = px + vx[i] * dt
+            y[alive] = py + vy[i] * dt
+            vx[alive] = vx[i]
+            vy[alive] = vy[i] + gravity
+            life[alive] = remaining
+            decay[alive] = decay[i]
+            size[alive] = size[i]
+            color[alive] = color[i]
+            alive += 1
+        self.count = alive
+
+    def _blits_numpy(self, alpha: float, atlas: CircleSpriteAtlas) -> list:
+        """貼る円と位置の一覧（NumPy）。同じ色・半径・不透明度の円はまとめて取得する"""
+        n = self.count
+        life = self.life[:n]
+        radius = (self.size[:n] * life).astype(np.int64)
+        top_level = atlas.alpha_levels - 1
+        if self.fade:
+            level = np.rint(life * top_level).astype(np.int64)
+        else:
+            level = np.full(n, top_level, dtype=np.int64)
+        visible = (radius > 0) & (level > 0)
+        if not visible.any():
+            return []
+
+        radius = radius[visible]
+        level = level[visible]
+        color = self.color[:n][visible].astype(np.int64)
+        lefts = self.prev_x[:n][visible] + (self.x[:n][visible] - self.prev_x[:n][visible]) * alpha - radius
+        tops = self.prev_y[:n][visible] + (self.y[:n][visible] - self.prev_y[:n][visible]) * alpha - radius
+
+        # 色・半径・不透明度の組を1つの整数にして、組ごとに1回だけアトラスから取得する
+        keys = (color * (int(radius.max()) + 1) + radius) * atlas.alpha_levels + level
+        unique, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        images = [
+            atlas.sprite_at_level(self.colors[c], r, lv)
+            for c, r, lv in zip(color[first].tolist(), radius[first].tolist(), level[first].tolist())
+        ]
+        return list(zip(
+            [images[i] for i in inverse.tolist()],
+            zip(lefts.astype(np.int64).tolist(), tops.astype(np.int64).tolist()),
+        ))
+
+    def _blits_python(self, alpha: float, atlas: CircleSpriteAtlas) -> list:
+        """貼る円と位置の一覧（純 Python）"""
+        top_level = atlas.alpha_levels - 1
+        images: dict[tuple[int, int, int], pygame.Surface | None] = {}
+        blits = []
+        for i in range(self.count):
+            life = self.life[i]
+            radius = int(self.size[i] * life)
+            level = round(life * top_level) if self.fade else top_level
+            if radius <= 0 or level <= 0:
+                continue
+            key = (self.color[i], radius, level)
+            if key not in images:
+                images[key] = atlas.sprite_at_level(self.colors[key[0]], radius, level)
+            prev_x, prev_y = self.prev_x[i], self.prev_y[i]
+            left = int(prev_x + (self.x[i] - prev_x) * alpha - radius)
+            top = int(prev_y + (self.y[i] - prev_y) * alpha - radius)
+            blits.append((images[key], (left, top)))
+        return blits
+
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> None:
+        """
+        パーティクルを描画する（共有のアトラスの円を Surface.blits() でまとめて貼る）
+
+        Args:
+            screen: 描画先
+            alpha: 前回と今回のシミュレーション位置の間の補間係数（0.0〜1.0）
+        """
+        if self.count == 0:
+            return
+        atlas = get_circle_atlas()
+        if self.vectorized:
+            blits = self._blits_numpy(alpha, atlas)
+        else:
+            blits = self._blits_python(alpha, atlas)
+        screen.blits(blits, doreturn=False)
@@ -0,0 +1,43 @@
+"""
+パス管理 - ユーザーごとのキャッシュディレクトリ
+
+起動を速くするためのキャッシュ（ゲーム情報など）を置くディレクトリを決める。
+キャッシュは消えても作り直せるものだけを置く。
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# キャッシュディレクトリを上書きする環境変数
+CACHE_DIR_ENV_VAR: str = "BABY_FUN_BOX_CACHE_DIR"
+
+# キャッシュディレクトリ名
+APP_CACHE_NAME: str = "baby-fun-box"
+
+
+def get_user_cache_dir() -> Path:
+    """
+    ユーザーのキャッシュディレクトリを取得する（作成はしない）
+
+    BABY_FUN_BOX_CACHE_DIR が設定されていればそれを使う。
+    それ以外は XDG_CACHE_HOME（未設定なら ~/.cache）、
+    macOS は ~/Library/Caches、Windows は %LOCALAPPDATA% の下を使う。
+    ディレクトリはキャッシュを書き出すときに作る（作れない場所でも起動は続けられるように）。
+
+    Returns:
+        キャッシュディレクトリのパス
+    """
+    override = os.environ.get(CACHE_DIR_ENV_VAR)
+    if override:
+        cache_dir = Path(override)
+    elif sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+        cache_dir = Path(base) / APP_CACHE_NAME
+    elif sys.platform == "darwin":
+        cache_dir = Path.home() / "Library" / "Caches" / APP_CACHE_NAME
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        cache_dir = Path(base) / APP_CACHE_NAME
+
+    return cache_dir
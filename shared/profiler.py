@@ -0,0 +1,245 @@
+"""
+フレームプロファイラ - ゲームループの各フェーズの処理時間を計測する
+
+イベント処理・更新・描画・画面転送の処理時間をリングバッファに記録し、
+p50/p95/p99 と予算超過フレーム数を集計する。
+環境変数 BABY_FUN_BOX_PROFILE=1 または Ctrl+Shift+P で有効になり、
+有効な間は画面右上に計測結果を表示する。
+無効な間は各メソッドが即座に戻るだけなので、ほぼオーバーヘッドはない。
+"""
+
+import os
+import time
+from collections import deque
+
+import pygame
+
+from shared.constants import FPS
+from shared.fonts import get_font
+
+# プロファイラを有効にする環境変数
+PROFILE_ENV_VAR: str = "BABY_FUN_BOX_PROFILE"
+
+# 集計に使う直近のフレーム数
+PROFILE_WINDOW: int = 240
+
+# 計測するフェーズ
+PROFILE_PHASES: tuple[str, ...] = ("events", "update", "draw", "present")
+
+# オーバーレイの表示を更新する間隔（秒）
+OVERLAY_REFRESH_INTERVAL: float = 0.5
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """ソート済みリストのパーセンタイル値（最近傍法）"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class FrameProfiler:
+    """ゲームループのフェーズ別処理時間を記録する"""
+
+    def __init__(self, window: int = PROFILE_WINDOW, budget_ms: float = 1000.0 / FPS) -> None:
+        """
+        Args:
+            window: 集計に使う直近のフレーム数
+            budget_ms: 1フレームの処理時間の予算（ミリ秒）
+        """
+        self.enabled = os.environ.get(PROFILE_ENV_VAR, "") not in ("", "0")
+        self.overlay_visible = True
+        self.budget_ms = budget_ms
+        self.samples: dict[str, deque[float]] = {
+            phase: deque(maxlen=window) for phase in (*PROFILE_PHASES, "frame")
+        }
+        self.frame_count = 0
+        self.frames_over_budget = 0
+
+        self._frame_start = 0.0
+        self._phase_start = 0.0
+        self._overlay_surface: pygame.Surface | None = None
+        self._overlay_updated = 0.0
+
+    def reset(self) -> None:
+        """記録をすべて消去する"""
+        for samples in self.samples.values():
+            samples.clear()
+        self.frame_count = 0
+        self.frames_over_budget = 0
+        self._overlay_surface = None
+        # フレームの途中（Ctrl+Shift+P）で有効にした場合に備え、計測の開始時刻をいまにそろえる
+        self._frame_start = self._phase_start = time.perf_counter()
+
+    def set_window(self, window: int) -> None:
+        """
+        集計に使うフレーム数を変更する（記録は消去される）
+
+        Args:
+            window: 集計に使う直近のフレーム数
+        """
+        self.samples = {phase: deque(maxlen=window) for phase in self.samples}
+        self.reset()
+
+    def handle_toggle(self, events: list[pygame.event.Event]) -> bool:
+        """
+        Ctrl+Shift+P で計測の有効・無効を切り替える
+
+        Args:
+            events: このフレームのイベント
+
+        Returns:
+            切り替えた場合 True（呼び出し側で画面全体を描き直す）
+        """
+        for event in events:
+            if (
+                event.type == pygame.KEYDOWN
+                and event.key == pygame.K_p
+                and event.mod & pygame.KMOD_CTRL
+                and event.mod & pygame.KMOD_SHIFT
+            ):
+                self.enabled = not self.enabled
+                self.reset()
+                return True
+        return False
+
+    # ========== 計測 ==========
+
+    def begin_frame(self) -> None:
+        """フレームの計測を開始する（フレーム待ちの後に呼ぶ）"""
+        if not self.enabled:
+            return
+        self._frame_start = self._phase_start = time.perf_counter()
+
+    def end_phase(self, phase: str) -> None:
+        """
+        フェーズの計測を終了し、次のフェーズの計測を開始する
+
+        Args:
+            phase: PROFILE_PHASES のいずれか
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.samples[phase].append((now - self._phase_start) * 1000.0)
+        self._phase_start = now
+
+    def skip_phase(self, phase: str) -> None:
+        """
+        このフレームで実行しなかったフェーズに 0ms を記録する
+
+        ダーティ矩形モードで描き直さないフレームでも、各フェーズのサンプルが
+        同じフレームの並びになるようにする。
+
+        Args:
+            phase: PROFILE_PHASES のいずれか
+        """
+        if not self.enabled:
+            return
+        self.samples[phase].append(0.0)
+
+    def end_frame(self) -> None:
+        """フレームの計測を終了する"""
+        if not self.enabled:
+            return
+        total_ms = (time.perf_counter() - self._frame_start) * 1000.0
+        self.samples["frame"].append(total_ms)
+        self.frame_count += 1
+        if total_ms > self.budget_ms:
+            self.frames_over_budget += 1
+
+    # ========== 集計 ==========
+
+    def get_stats(self) -> dict:
+        """
+        計測結果を取得する
+
+        Returns:
+            {
+                "phases": {フェーズ名: {"p50": ms, "p95": ms, "p99": ms}},
+                "frames": 計測したフレーム数,
+                "frames_over_budget": 予算を超えたフレーム数,
+                "budget_ms": 予算（ミリ秒）,
+            }
+        """
+        phases = {}
+        for phase, samples in self.samples.items():
+            values = sorted(samples)
+            phases[phase] = {
+                "p50": percentile(values, 0.50),
+                "p95": percentile(values, 0.95),
+                "p99": percentile(values, 0.99),
+            }
+        return {
+            "phases": phases,
+            "frames": self.frame_count,
+            "frames_over_budget": self.frames_over_budget,
+            "budget_ms": self.budget_ms,
+        }
+
+    # ========== オーバーレイ ==========
+
+    def overlay_rect(self, screen: pygame.Surface) -> pygame.Rect:
+        """オーバーレイの表示領域（ダーティ矩形の登録用）"""
+        width, height = 260, 20 * (len(self.samples) + 2) + 10
+        return pygame.Rect(screen.get_width() - width - 10, 10, width, height)
+
+    def draw_overlay(self, screen: pygame.Surface) -> None:
+        """
+        計測結果を画面右上に描画する
+
+        表示内容は OVERLAY_REFRESH_INTERVAL ごとに作り直し、
+        それ以外のフレームは前回の Surface を貼るだけにする。
+        """
+        if not self.enabled or not self.overlay_visible:
+            return
+
+        now = time.perf_counter()
+        if self._overlay_surface is None or now - self._overlay_updated >= OVERLAY_REFRESH_INTERVAL:
+            self._overlay_surface = self._render_overlay(self.overlay_rect(screen).size)
+            self._overlay_updated = now
+
+        screen.blit(self._overlay_surface, self.overlay_rect(screen))
+
+        # オーバーレイの描画時間は次のフェーズに含めない
+        self._phase_start = time.perf_counter()
+
+    def _render_overlay(self, size: tuple[int, int]) -> pygame.Surface:
+        """オーバーレイの Surface を作る"""
+        font = get_font(16)
+        stats = self.get_stats()
+
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 170))
+
+        lines = ["phase     p50    p95    p99 (ms)"]
+        for phase, values in stats["phases"].items():
+            lines.append(
+                f"{phase:<8}{values['p50']:6.1f} {values['p95']:6.1f} {values['p99']:6.1f}"
+            )
+        lines.append(
+            f"over {stats['budget_ms']:.1f}ms: {stats['frames_over_budget']}/{stats['frames']}"
+        )
+
+        for i, line in enumerate(lines):
+            text = font.render(line, True, (255, 255, 255))
+            surface.blit(text, (8, 6 + i * 20))
+
+        return surface
+
+
+# プロセス全体で共有するプロファイラ
+_frame_profiler: FrameProfiler | None = None
+
+
+def get_frame_profiler() -> FrameProfiler:
+    """
+    共有のフレームプロファイラを取得する
+
+    ランチャーと全ゲームで同じインスタンスを使う。
+    """
+    global _frame_profiler
+
+    if _frame_profiler is None:
+        _frame_profiler = FrameProfiler()
+    return _frame_profiler
@@ -0,0 +1,233 @@
+"""
+入力の記録と再生 - 実際の操作を再現して性能を計測する
+
+セッション中の pygame イベントとフレーム時刻を gzip 圧縮した JSON Lines に記録し、
+random のシードと一緒に保存する。再生時は同じシードを設定し、
+記録したイベントと経過時間をそのままゲームループに渡すため、
+風船の出現やモグラの出現位置を含めて同じフレーム列を再現できる。
+
+記録・再生は FrameRateGovernor.next_frame() で行うので、
+BaseGame.handle_events と Launcher.handle_events の両方に同じイベントが渡る。
+
+環境変数で有効にする:
+    BABY_FUN_BOX_RECORD=session.bfbrec python main.py   # 記録
+    BABY_FUN_BOX_REPLAY=session.bfbrec python main.py   # 再生
+"""
+
+import gzip
+import json
+import os
+import random
+from collections import deque
+from pathlib import Path
+
+import pygame
+
+# 記録先のファイルパスを指定する環境変数
+RECORD_ENV_VAR: str = "BABY_FUN_BOX_RECORD"
+
+# 再生するファイルパスを指定する環境変数
+REPLAY_ENV_VAR: str = "BABY_FUN_BOX_REPLAY"
+
+# 1 を指定すると記録時と同じ速さで再生する（指定しなければ待ち時間なしで再生）
+REPLAY_REALTIME_ENV_VAR: str = "BABY_FUN_BOX_REPLAY_REALTIME"
+
+# 記録ファイルの形式のバージョン
+REPLAY_FORMAT_VERSION: int = 1
+
+# 記録しないイベント（再生時に意味を持たないもの）
+_SKIPPED_EVENT_TYPES: frozenset[int] = frozenset(
+    {
+        pygame.ACTIVEEVENT,
+        pygame.VIDEOEXPOSE,
+        pygame.WINDOWEXPOSED,
+        pygame.AUDIODEVICEADDED,
+        pygame.AUDIODEVICEREMOVED,
+    }
+)
+
+
+def _encode_value(value):
+    """イベント属性を JSON に書ける値に変換する（書けない場合は None）"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (tuple, list)):
+        items = [_encode_value(v) for v in value]
+        return None if any(i is None for i in items) else items
+    return None
+
+
+def encode_event(event: pygame.event.Event) -> list:
+    """
+    イベントを [type, {属性}] の形に変換する
+
+    JSON に書けない属性（window など）は捨てる。
+    """
+    attrs = {}
+    for key, value in event.dict.items():
+        encoded = _encode_value(value)
+        if encoded is not None or value is None:
+            attrs[key] = encoded
+    return [event.type, attrs] if attrs else [event.type]
+
+
+def decode_event(data: list) -> pygame.event.Event:
+    """encode_event() の逆変換（リストはタプルに戻す）"""
+    attrs = data[1] if len(data) > 1 else {}
+    restored = {
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in attrs.items()
+    }
+    return pygame.event.Event(data[0], restored)
+
+
+class InputRecorder:
+    """フレームごとのイベントと時刻をファイルに記録する"""
+
+    def __init__(self, path: str | Path, seed: int | None = None) -> None:
+        """
+        記録を開始し、random のシードを設定する
+
+        Args:
+            path: 記録先のファイルパス
+            seed: random のシード（None の場合はランダムに決める）
+        """
+        self.path = Path(path)
+        self.seed = seed if seed is not None else random.SystemRandom().randrange(2**32)
+        self.frame_count = 0
+        self.elapsed_ms = 0
+
+        random.seed(self.seed)
+
+        self._file = gzip.open(self.path, "wt", encoding="utf-8")
+        header = {"version": REPLAY_FORMAT_VERSION, "seed": self.seed}
+        self._file.write(json.dumps(header) + "\n")
+
+    def record(self, dt_ms: int, events: list[pygame.event.Event]) -> None:
+        """
+        1フレーム分を記録する
+
+        Args:
+            dt_ms: 前フレームからの経過時間（ミリ秒）
+            events: このフレームのイベント
+        """
+        self.elapsed_ms += dt_ms
+        self.frame_count += 1
+
+        encoded = [encode_event(e) for e in events if e.type not in _SKIPPED_EVENT_TYPES]
+        # 1行 = [経過時間(ms), [イベント...]]。イベントのないフレームは時刻だけ
+        line = [self.elapsed_ms, encoded] if encoded else [self.elapsed_ms]
+        self._file.write(json.dumps(line, separators=(",", ":"), ensure_ascii=False) + "\n")
+
+    def close(self) -> None:
+        """ファイルを閉じる"""
+        self._file.close()
+
+
+class InputReplayer:
+    """記録したフレームを順に取り出す"""
+
+    def __init__(self, path: str | Path, realtime: bool = False) -> None:
+        """
+        記録ファイルを読み込み、記録時の random のシードを設定する
+
+        Args:
+            path: 記録ファイルのパス
+            realtime: 記録時と同じ速さで再生するか（False なら待ち時間なし）
+
+        Raises:
+            ValueError: 対応していない形式のファイルの場合
+        """
+        self.path = Path(path)
+        self.realtime = realtime
+
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline())
+            if header.get("version") != REPLAY_FORMAT_VERSION:
+                raise ValueError(f"未対応の記録形式です: {self.path}")
+            self._frames: deque[list] = deque(json.loads(line) for line in f if line.strip())
+
+        self.seed: int = header["seed"]
+        self.frame_count = len(self._frames)
+        self._last_ms = 0
+
+        random.seed(self.seed)
+
+    @property
+    def finished(self) -> bool:
+        """すべてのフレームを再生したか"""
+        return not self._frames
+
+    def next_frame(self) -> tuple[int, list[pygame.event.Event]] | None:
+        """
+        次のフレームを取り出す
+
+        Returns:
+            (前フレームからの経過時間（ミリ秒）, イベントのリスト)。
+            最後まで再生した場合は None
+        """
+        if not self._frames:
+            return None
+
+        frame = self._frames.popleft()
+        elapsed_ms = frame[0]
+        events = [decode_event(e) for e in frame[1]] if len(frame) > 1 else []
+
+        dt_ms = elapsed_ms - self._last_ms
+        self._last_ms = elapsed_ms
+        return dt_ms, events
+
+
+# プロセス全体で共有する記録・再生の状態
+_recorder: InputRecorder | None = None
+_replayer: InputReplayer | None = None
+
+
+def start_recording(path: str | Path, seed: int | None = None) -> InputRecorder:
+    """入力の記録を開始する"""
+    global _recorder
+
+    stop_session()
+    _recorder = InputRecorder(path, seed)
+    return _recorder
+
+
+def start_replay(path: str | Path, realtime: bool = False) -> InputReplayer:
+    """記録した入力の再生を開始する"""
+    global _replayer
+
+    stop_session()
+    _replayer = InputReplayer(path, realtime)
+    return _replayer
+
+
+def start_session_from_env() -> None:
+    """環境変数 BABY_FUN_BOX_RECORD / BABY_FUN_BOX_REPLAY に応じて記録・再生を開始する"""
+    replay_path = os.environ.get(REPLAY_ENV_VAR)
+    record_path = os.environ.get(RECORD_ENV_VAR)
+
+    if replay_path:
+        realtime = os.environ.get(REPLAY_REALTIME_ENV_VAR, "") not in ("", "0")
+        start_replay(replay_path, realtime)
+    elif record_path:
+        start_recording(record_path)
+
+
+def stop_session() -> None:
+    """記録・再生を終了する（記録中ならファイルを閉じる）"""
+    global _recorder, _replayer
+
+    if _recorder is not None:
+        _recorder.close()
+    _recorder = None
+    _replayer = None
+
+
+def get_recorder() -> InputRecorder | None:
+    """記録中の InputRecorder（記録していなければ None）"""
+    return _recorder
+
+
+def get_replayer() -> InputReplayer | None:
+    """再生中の InputReplayer（再生していなければ None）"""
+    return _replayer
@@ -0,0 +1,243 @@
+"""
+リソースキャッシュ - ゲームの重いリソースを事前に作って共有する
+
+効果音の合成や画像の読み込みなど、ゲームの起動時に行う重い処理の結果を
+プロセス全体で共有するキャッシュに保存する。
+ランチャーが待機している間に ResourcePrewarmer がバックグラウンドスレッドで
+各ゲームの prewarm() を呼び、ゲームは on_enter() などで同じキーから取り出す。
+バックグラウンドで作成中のキーを要求した場合は、完成するまで待ってから返す。
+load_resource_async() は、待たずに Future を返し、ワーカースレッドで作る。
+
+キャッシュはゲームのインスタンスをまたいで共有されるので、ゲームを起動し直しても
+効果音などを作り直さない。効果音と画像は推定サイズを合計し、上限を超えたら
+最も長く使われていないものから捨てる（LRU）。
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Hashable, TypeVar
+
+import pygame
+
+T = TypeVar("T")
+
+# 共有キャッシュに保持するリソースの合計サイズの上限（バイト）
+RESOURCE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+
+
+def resource_size(value: Any) -> int:
+    """
+    リソースのメモリ上のサイズを推定する（バイト）
+
+    効果音（Sound）と画像（Surface）以外は 0 として扱う。
+    """
+    if isinstance(value, pygame.mixer.Sound):
+        mixer_format = pygame.mixer.get_init()
+        if mixer_format is None:
+            return 0
+        frequency, size, channels = mixer_format
+        return round(value.get_length() * frequency) * (abs(size) // 8) * channels
+    if isinstance(value, pygame.Surface):
+        return value.get_pitch() * value.get_height()
+    return 0
+
+
+class ResourceCache:
+    """スレッドから安全に使えるリソースのキャッシュ（合計サイズの上限付き LRU）"""
+
+    def __init__(self, max_bytes: int | None = RESOURCE_CACHE_MAX_BYTES) -> None:
+        """
+        Args:
+            max_bytes: 保持するリソースの合計サイズの上限（None の場合は無制限）
+        """
+        self.max_bytes = max_bytes
+        self._items: OrderedDict[Hashable, Any] = OrderedDict()  # 古く使われた順
+        self._sizes: dict[Hashable, int] = {}
+        self._building: dict[Hashable, threading.Event] = {}
+        self._lock = threading.Lock()
+        self.bytes_used = 0
+        self.stats = {"hits": 0, "misses": 0, "waits": 0, "evictions": 0}
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._items
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """
+        キャッシュからリソースを取得する（なければ factory で作って保存する）
+
+        別のスレッドが同じキーを作成中の場合は、その完成を待つ。
+
+        Args:
+            key: リソースのキー
+            factory: リソースを作る関数
+
+        Returns:
+            キャッシュされたリソース
+        """
+        while True:
+            with self._lock:
+                if key in self._items:
+                    self.stats["hits"] += 1
+                    self._items.move_to_end(key)
+                    return self._items[key]
+
+                building = self._building.get(key)
+                if building is None:
+                    building = threading.Event()
+                    self._building[key] = building
+                    break
+                self.stats["waits"] += 1
+
+            # 他のスレッドが作成中（失敗した場合は自分で作り直す）
+            building.wait()
+
+        try:
+            value = factory()
+            size = resource_size(value)
+            with self._lock:
+                self._items[key] = value
+                self._sizes[key] = size
+                self.bytes_used += size
+                self.stats["misses"] += 1
+                self._evict(keep=key)
+            return value
+        finally:
+            with self._lock:
+                del self._building[key]
+            building.set()
+
+    def _evict(self, keep: Hashable) -> None:
+        """合計サイズが上限以下になるまで古いものから捨てる（ロック中に呼ぶ）"""
+        if self.max_bytes is None:
+            return
+        for key in list(self._items):
+            if self.bytes_used <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            del self._items[key]
+            self.bytes_used -= self._sizes.pop(key)
+            self.stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """キャッシュを空にする（作成中のものは残る）"""
+        with self._lock:
+            self._items.clear()
+            self._sizes.clear()
+            self.bytes_used = 0
+            self.stats = {"hits": 0, "misses": 0, "waits": 0, "evictions": 0}
+
+
+class ResourcePrewarmer:
+    """リソースの事前作成をバックグラウンドスレッドで実行する"""
+
+    def __init__(self) -> None:
+        # メインスレッドの描画を邪魔しないよう、ワーカーは1つだけにする
+        self._executor: ThreadPoolExecutor | None = None
+        self._futures: dict[str, Future] = {}
+        self.timings: dict[str, float] = {}  # タスク名 → 所要時間（ms）
+
+    @property
+    def started(self) -> bool:
+        """タスクを1つ以上登録したか"""
+        return bool(self._futures)
+
+    def submitted(self, name: str) -> bool:
+        """同じ名前のタスクを登録済みか"""
+        return name in self._futures
+
+    @property
+    def done(self) -> bool:
+        """登録したタスクがすべて終わったか"""
+        return all(future.done() for future in self._futures.values())
+
+    def submit(self, name: str, task: Callable[[], None]) -> None:
+        """
+        タスクをバックグラウンドで実行する（同じ名前のタスクは1回だけ）
+
+        タスク内の例外は無視する（必要なリソースはゲーム側で改めて作られる）。
+
+        Args:
+            name: タスク名（所要時間の記録に使う）
+            task: 実行する関数
+        """
+        if name in self._futures:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prewarm")
+        self._futures[name] = self._executor.submit(self._run, name, task)
+
+    def _run(self, name: str, task: Callable[[], None]) -> None:
+        """タスクを実行して所要時間を記録する"""
+        start = time.perf_counter()
+        try:
+            task()
+        except Exception:
+            pass
+        self.timings[name] = (time.perf_counter() - start) * 1000.0
+
+    def shutdown(self) -> None:
+        """未実行のタスクを取り消してスレッドを終了する"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+# プロセス全体で共有するキャッシュ
+_resource_cache: ResourceCache | None = None
+_resource_cache_lock = threading.Lock()
+
+
+def get_resource_cache() -> ResourceCache:
+    """
+    共有のリソースキャッシュを取得する
+
+    ゲームのインスタンスをまたいで同じキャッシュを使う。
+    """
+    global _resource_cache
+
+    # バックグラウンドスレッドから最初に呼ばれることもあるためロックする
+    with _resource_cache_lock:
+        if _resource_cache is None:
+            _resource_cache = ResourceCache()
+    return _resource_cache
+
+
+# リソースを非同期に作るワーカー（メインスレッドの描画を邪魔しないよう1つだけにする）
+_loader_executor: ThreadPoolExecutor | None = None
+_loader_executor_lock = threading.Lock()
+
+
+def load_resource_async(key: Hashable, factory: Callable[[], T]) -> Future[T]:
+    """
+    共有キャッシュからリソースを取得する Future を返す（なければワーカースレッドで作る）
+
+    キャッシュにあれば完了済みの Future を返す（スレッドを経由しない）。
+    ランチャーの事前作成と同じキーを要求した場合は、ワーカーがその完成を待つ。
+
+    Args:
+        key: リソースのキー
+        factory: リソースを作る関数（ワーカースレッドで呼ばれる）
+
+    Returns:
+        リソースを返す Future（factory の例外は result() で送出される）
+    """
+    global _loader_executor
+
+    cache = get_resource_cache()
+    if key in cache:
+        future: Future[T] = Future()
+        future.set_result(cache.get_or_create(key, factory))
+        return future
+
+    with _loader_executor_lock:
+        if _loader_executor is None:
+            _loader_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="loader")
+    return _loader_executor.submit(cache.get_or_create, key, factory)
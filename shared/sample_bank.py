@@ -0,0 +1,96 @@
+"""
+サンプルバンク - 1つの録音から全ての音階の音を作る
+
+楽器の音を音階ごとのファイルで用意すると、2〜3オクターブ分で数十個のファイルを
+同梱して読み込む（デコードする）ことになる。SampleBank は楽器ごとに1つの録音だけを
+読み込み、他の音階は synth.resample() で再生の速さを変えて作る。
+作った音は共有のリソースキャッシュ（サイズの上限付き LRU）に保存し、鳴らすときに
+必要な音だけを作る（prerender() で先に作っておくこともできる）。
+
+使い方:
+    bank = SampleBank.load(SOUNDS_DIR / "instrument.wav", root_freq=261.63)
+    sound = bank.get(392.00)  # ソの音（元の録音を 1.5 倍の速さで再生した音）
+"""
+
+from pathlib import Path
+from typing import Iterable
+
+import pygame
+
+from shared import synth
+from shared.resource_cache import get_resource_cache
+
+# 録音として読み込むファイルの拡張子（先に見つかったものを使う）
+SAMPLE_EXTENSIONS: tuple[str, ...] = (".ogg", ".wav", ".mp3")
+
+
+class SampleBank:
+    """1つの録音の再生の速さを変えて、任意の高さの音を作る"""
+
+    def __init__(self, name: str, source: pygame.mixer.Sound, root_freq: float) -> None:
+        """
+        Args:
+            name: バンクの名前（キャッシュのキーに使う。録音ごとに変える）
+            source: 元の録音
+            root_freq: 元の録音の音の高さ（Hz）
+        """
+        self.name = name
+        self.source = source
+        self.root_freq = root_freq
+
+    @classmethod
+    def load(cls, path: Path, root_freq: float, volume: float = 1.0) -> "SampleBank | None":
+        """
+        録音ファイルを読み込んでバンクを作る
+
+        Args:
+            path: 録音ファイルのパス（拡張子を省略すると SAMPLE_EXTENSIONS の順に探す）
+            root_freq: 録音の音の高さ（Hz）
+            volume: 音量（0.0〜1.0）
+
+        Returns:
+            バンク（ファイルがない・読み込めない場合は None）
+        """
+        candidates = [path] if path.suffix else [path.with_suffix(ext) for ext in SAMPLE_EXTENSIONS]
+        for candidate in candidates:
+            if not candidate.exists():
+                continue
+            try:
+                source = pygame.mixer.Sound(str(candidate))
+            except pygame.error:
+                continue
+            source.set_volume(volume)
+            return cls(str(candidate), source, root_freq)
+        return None
+
+    def _key(self, freq: float) -> tuple:
+        return ("sample_bank", self.name, round(freq, 3))
+
+    def get(self, freq: float) -> pygame.mixer.Sound:
+        """
+        指定した高さの音を取得する（作成済みなら共有キャッシュから）
+
+        Args:
+            freq: 音の高さ（Hz）
+        """
+        if abs(freq - self.root_freq) < 0.001:
+            return self.source
+        return get_resource_cache().get_or_create(
+            self._key(freq), lambda: synth.resample(self.source, freq / self.root_freq)
+        )
+
+    def prerender(self, freqs: Iterable[float]) -> None:
+        """指定した高さの音を先に作っておく"""
+        for freq in freqs:
+            self.get(freq)
+
+
+def equal_temperament(root_freq: float, semitones: Iterable[int]) -> list[float]:
+    """
+    平均律で root_freq から指定した半音数だけ離れた音の高さを求める
+
+    Args:
+        root_freq: 基準の音の高さ（Hz）
+        semitones: 基準からの半音数（12 で1オクターブ上）
+    """
+    return [root_freq * 2 ** (n / 12) for n in semitones]
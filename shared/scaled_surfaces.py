@@ -0,0 +1,151 @@
+"""
+拡大縮小した画像のキャッシュ - 同じ画像を毎フレーム拡大縮小しない
+
+カスタム画像（assets/images/）やアイコンを描画のたびに pygame.transform.scale() /
+smoothscale() すると、毎フレーム同じ計算と Surface の確保が起きる。
+ScaledSurfaceCache は (元の画像, 大きさ, 拡大縮小の方法) ごとに結果を保存して使い回す。
+保存した画像の合計サイズを数え、上限を超えたら最も長く使われていないものから捨てる（LRU）。
+
+元の画像は同一性（id）で区別する。元の画像が捨てられたら、その画像から作ったものも捨てる
+（弱参照で監視する）ので、元の画像を描き換える場合は invalidate() を呼ぶ。
+
+使い方:
+    scaled = scaled_surface(image, (150, 100))               # transform.scale
+    scaled = scaled_surface(image, (200, 160), smooth=True)  # transform.smoothscale
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+
+import pygame
+
+# 保存する拡大縮小した画像の合計サイズの上限（バイト）
+SCALED_SURFACE_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+
+# キャッシュのキー（元の画像の id, 大きさ, smoothscale か）
+_Key = tuple[int, tuple[int, int], bool]
+
+
+class ScaledSurfaceCache:
+    """拡大縮小した画像を保存する（合計サイズの上限付き LRU）"""
+
+    def __init__(self, max_bytes: int | None = SCALED_SURFACE_CACHE_MAX_BYTES) -> None:
+        """
+        Args:
+            max_bytes: 保存する画像の合計サイズの上限（None の場合は無制限）
+        """
+        self.max_bytes = max_bytes
+        # キー → (元の画像への弱参照, 拡大縮小した画像)。古く使われた順
+        self._items: OrderedDict[_Key, tuple[weakref.ref, pygame.Surface]] = OrderedDict()
+        self._lock = threading.Lock()
+        # 元の画像が捨てられた画像のキーと弱参照（ロックを取った処理の中で取り除く）
+        self._collected: list[tuple[_Key, weakref.ref]] = []
+        self.bytes_used = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._drain_collected()
+            return len(self._items)
+
+    def _remove(self, key: _Key) -> None:
+        """保存した画像を捨てる（ロックを取った状態で呼ぶ）"""
+        _, surface = self._items.pop(key)
+        self.bytes_used -= surface.get_pitch() * surface.get_height()
+
+    def _on_source_collected(self, key: _Key, ref: weakref.ref) -> None:
+        """
+        元の画像が捨てられたら、その画像から作ったものを捨てる予約をする
+
+        循環参照の回収（GC）は get() がロックを取っている間のメモリ確保でも起こるため、
+        ここではロックを取らずに記録だけして、次にロックを取ったときに取り除く。
+        """
+        self._collected.append((key, ref))
+
+    def _drain_collected(self) -> None:
+        """元の画像が捨てられたものを取り除く（ロックを取った状態で呼ぶ）"""
+        while self._collected:
+            key, ref = self._collected.pop()
+            item = self._items.get(key)
+            if item is not None and item[0] is ref:
+                self._remove(key)
+
+    def get(self, source: pygame.Surface, size: tuple[int, int], smooth: bool = False) -> pygame.Surface:
+        """
+        拡大縮小した画像を取得する（なければ作って保存する）
+
+        Args:
+            source: 元の画像
+            size: 大きさ（幅, 高さ）
+            smooth: True なら transform.smoothscale、False なら transform.scale
+
+        Returns:
+            拡大縮小した画像（元の画像と同じ大きさなら元の画像）
+        """
+        size = (max(0, int(size[0])), max(0, int(size[1])))
+        if size == source.get_size():
+            return source
+
+        key = (id(source), size, smooth)
+        with self._lock:
+            self._drain_collected()
+            item = self._items.get(key)
+            if item is not None and item[0]() is source:
+                self._items.move_to_end(key)
+                self.stats["hits"] += 1
+                return item[1]
+            if item is not None:
+                # 同じ id の別の画像（元の画像が捨てられた後に作られたもの）
+                self._remove(key)
+            self.stats["misses"] += 1
+
+        if smooth and source.get_bitsize() >= 24:
+            scaled = pygame.transform.smoothscale(source, size)
+        else:
+            scaled = pygame.transform.scale(source, size)
+
+        with self._lock:
+            if key in self._items:
+                self._remove(key)
+            ref = weakref.ref(source, lambda r, key=key: self._on_source_collected(key, r))
+            self._items[key] = (ref, scaled)
+            self.bytes_used += scaled.get_pitch() * scaled.get_height()
+            while self.max_bytes is not None and self.bytes_used > self.max_bytes and len(self._items) > 1:
+                self._remove(next(iter(self._items)))
+                self.stats["evictions"] += 1
+        return scaled
+
+    def invalidate(self, source: pygame.Surface) -> None:
+        """元の画像から作ったものをすべて捨てる（元の画像を描き換えたときに呼ぶ）"""
+        with self._lock:
+            self._drain_collected()
+            for key in [key for key, (ref, _) in self._items.items() if ref() is source]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """保存した画像をすべて捨てる"""
+        with self._lock:
+            self._items.clear()
+            self._collected.clear()
+            self.bytes_used = 0
+
+
+# プロセス全体で共有するキャッシュ
+_scaled_surface_cache: ScaledSurfaceCache | None = None
+_scaled_surface_cache_lock = threading.Lock()
+
+
+def get_scaled_surface_cache() -> ScaledSurfaceCache:
+    """共有の拡大縮小した画像のキャッシュを取得する"""
+    global _scaled_surface_cache
+
+    with _scaled_surface_cache_lock:
+        if _scaled_surface_cache is None:
+            _scaled_surface_cache = ScaledSurfaceCache()
+    return _scaled_surface_cache
+
+
+def scaled_surface(source: pygame.Surface, size: tuple[int, int], smooth: bool = False) -> pygame.Surface:
+    """共有のキャッシュから拡大縮小した画像を取得する（ScaledSurfaceCache.get() を参照）"""
+    return get_scaled_surface_cache().get(source, size, smooth)
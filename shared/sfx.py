@@ -0,0 +1,201 @@
+"""
+効果音ディスパッチャー - 効果音の再生回数とチャンネルを全ゲームで管理する
+
+幼児が画面を連打したりツールバーの上を指でなぞったりすると、1秒間に何十回も
+同じ効果音が重ねて再生され、ミキサーのチャンネルと CPU を使い切ってしまう。
+SfxDispatcher は効果音ごとのルール（SfxRule）に従って再生を間引く:
+    - 同じ効果音を同時に鳴らす数の上限
+    - 同じ効果音を鳴らし直すまでの最短間隔
+    - 優先度（UI > ゲーム > 環境音）。空きチャンネルがなければ、より低い優先度の音を止める
+    - UI の音には専用に予約したチャンネルを使う（ゲームの音で埋まっていても鳴る）
+間引いた再生は理由ごとに数え、stats で確認できる。
+
+使い方:
+    POP_SFX = SfxRule(max_concurrent=4, min_interval=0.04)
+    play_sfx(self.pop_sound, POP_SFX)
+"""
+
+import threading
+import time
+import weakref
+from collections import Counter
+from dataclasses import dataclass
+from enum import IntEnum
+
+import pygame
+
+from shared import audio
+
+# UI の効果音用に予約するチャンネル数
+SFX_UI_CHANNELS: int = 2
+
+
+class SfxPriority(IntEnum):
+    """効果音の優先度（大きいほど優先）"""
+
+    AMBIENT = 0  # 環境音（止められても困らない）
+    GAME = 1  # ゲームの効果音
+    UI = 2  # ボタンなどの操作音（必ず鳴らしたい）
+
+
+@dataclass(frozen=True)
+class SfxRule:
+    """効果音の再生ルール"""
+
+    max_concurrent: int = 4  # 同じ効果音を同時に鳴らす数の上限
+    min_interval: float = 0.03  # 同じ効果音を鳴らし直すまでの最短間隔（秒）
+    priority: SfxPriority = SfxPriority.GAME
+
+
+# ルールを指定しなかった場合のルール
+DEFAULT_SFX_RULE = SfxRule()
+
+
+@dataclass
+class _Voice:
+    """ディスパッチャーが鳴らしている音"""
+
+    channel: pygame.mixer.Channel
+    sound: pygame.mixer.Sound
+    priority: SfxPriority
+    started: float
+
+    @property
+    def is_playing(self) -> bool:
+        # チャンネルが他の Sound.play() に使われた場合も鳴り終わったとみなす
+        return self.channel.get_busy() and self.channel.get_sound() is self.sound
+
+
+class SfxDispatcher:
+    """効果音の再生をルールに従って間引く"""
+
+    def __init__(self, ui_channels: int = SFX_UI_CHANNELS) -> None:
+        """
+        Args:
+            ui_channels: UI の効果音用に予約するチャンネル数（最初の再生時に予約する）
+        """
+        self.ui_channel_count = ui_channels
+        self._ui_channels: list[pygame.mixer.Channel] | None = None
+        self._voices: list[_Voice] = []
+        # 効果音 → 最後に鳴らした時刻。ResourceCache から捨てられた効果音を残し続けないよう弱参照で持つ
+        self._last_played: weakref.WeakKeyDictionary[pygame.mixer.Sound, float] = weakref.WeakKeyDictionary()
+        self.stats = {
+            "played": 0,
+            "preempted": 0,  # 優先度の高い音のために止めた数
+            "dropped_interval": 0,  # 最短間隔より早いため鳴らさなかった数
+            "dropped_concurrent": 0,  # 同時に鳴らす数の上限のため鳴らさなかった数
+            "dropped_no_channel": 0,  # 空きチャンネルがないため鳴らさなかった数
+        }
+        self.dropped_by_priority: Counter[str] = Counter()
+
+    @property
+    def dropped(self) -> int:
+        """鳴らさなかった再生要求の合計"""
+        return (
+            self.stats["dropped_interval"]
+            + self.stats["dropped_concurrent"]
+            + self.stats["dropped_no_channel"]
+        )
+
+    def _drop(self, reason: str, rule: SfxRule) -> None:
+        self.stats[reason] += 1
+        self.dropped_by_priority[rule.priority.name] += 1
+
+    def _find_channel(self, priority: SfxPriority) -> pygame.mixer.Channel | None:
+        """優先度に応じて空きチャンネルを探す（なければ低い優先度の音を止める）"""
+        if priority == SfxPriority.UI:
+            if self._ui_channels is None:
+                self._ui_channels = [
+                    pygame.mixer.Channel(i) for i in audio.reserve_channels(self.ui_channel_count)
+                ]
+            for channel in self._ui_channels:
+                if not channel.get_busy():
+                    return channel
+
+        channel = pygame.mixer.find_channel()
+        if channel is not None:
+            return channel
+
+        # 低い優先度の音のうち、最も古いものを止める
+        candidates = [v for v in self._voices if v.priority < priority]
+        if not candidates:
+            return None
+        victim = min(candidates, key=lambda v: (v.priority, v.started))
+        self._voices.remove(victim)
+        victim.channel.stop()
+        self.stats["preempted"] += 1
+        return victim.channel
+
+    def play(
+        self, sound: pygame.mixer.Sound, rule: SfxRule = DEFAULT_SFX_RULE
+    ) -> pygame.mixer.Channel | None:
+        """
+        効果音を鳴らす（ルールに反する場合は鳴らさない）
+
+        Args:
+            sound: 鳴らす効果音
+            rule: 再生ルール
+
+        Returns:
+            鳴らしたチャンネル（鳴らさなかった場合は None）
+        """
+        if not pygame.mixer.get_init():
+            return None
+
+        now = time.monotonic()
+        last = self._last_played.get(sound)
+        if last is not None and now - last < rule.min_interval:
+            self._drop("dropped_interval", rule)
+            return None
+
+        self._voices = [v for v in self._voices if v.is_playing]
+        if sum(1 for v in self._voices if v.sound is sound) >= rule.max_concurrent:
+            self._drop("dropped_concurrent", rule)
+            return None
+
+        channel = self._find_channel(rule.priority)
+        if channel is None:
+            self._drop("dropped_no_channel", rule)
+            return None
+
+        channel.play(sound)
+        self._voices.append(_Voice(channel, sound, rule.priority, now))
+        self._last_played[sound] = now
+        self.stats["played"] += 1
+        return channel
+
+    def stop_all(self) -> None:
+        """ディスパッチャーが鳴らしている音をすべて止める（次の再生は最短間隔を待たない）"""
+        for voice in self._voices:
+            if voice.is_playing:
+                voice.channel.stop()
+        self._voices.clear()
+        self._last_played.clear()
+
+    def reset_stats(self) -> None:
+        """カウンターを 0 に戻す"""
+        for key in self.stats:
+            self.stats[key] = 0
+        self.dropped_by_priority.clear()
+
+
+# プロセス全体で共有するディスパッチャー
+_sfx_dispatcher: SfxDispatcher | None = None
+_sfx_dispatcher_lock = threading.Lock()
+
+
+def get_sfx_dispatcher() -> SfxDispatcher:
+    """共有の効果音ディスパッチャーを取得する"""
+    global _sfx_dispatcher
+
+    with _sfx_dispatcher_lock:
+        if _sfx_dispatcher is None:
+            _sfx_dispatcher = SfxDispatcher()
+    return _sfx_dispatcher
+
+
+def play_sfx(
+    sound: pygame.mixer.Sound, rule: SfxRule = DEFAULT_SFX_RULE
+) -> pygame.mixer.Channel | None:
+    """共有のディスパッチャーで効果音を鳴らす（SfxDispatcher.play() を参照）"""
+    return get_sfx_dispatcher().play(sound, rule)
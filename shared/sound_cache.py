@@ -0,0 +1,283 @@
+"""
+効果音キャッシュ - 合成した効果音の PCM をディスクに保存する
+
+効果音の生成関数に @disk_cached_sound を付けると、生成した Sound の PCM データを
+ユーザーのキャッシュディレクトリに保存し、次回からはファイルを
+メモリマップして pygame.mixer.Sound(buffer=...) で読み込む。
+
+キャッシュのキーは次の内容のハッシュ（内容が同じなら同じファイルを使う）:
+    - 生成関数の名前と引数
+    - 生成関数のコード（定数を含む）と SYNTH_VERSION
+    - 生成関数が読むモジュールの定数の値（調整用の定数を変えたら作り直す）
+    - ミキサーの形式（周波数・サンプルのビット数・チャンネル数）
+
+生成関数のコードが変わった場合は、古いコードで作ったファイルを削除する。
+"""
+
+import functools
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from pathlib import Path
+from types import CodeType, ModuleType
+from typing import Any, Callable
+
+import pygame
+
+from shared.paths import get_user_cache_dir
+from shared.synth import SYNTH_VERSION
+
+# キャッシュファイルを置くサブディレクトリ名
+SOUND_CACHE_DIR_NAME: str = "sounds"
+
+# キャッシュファイルの拡張子
+SOUND_CACHE_SUFFIX: str = ".pcm"
+
+# キャッシュファイルの形式のバージョン（変えると既存のキャッシュは使われない）
+SOUND_CACHE_VERSION: int = 1
+
+# モジュールに属性がないことを表す値
+_MISSING = object()
+
+# ファイル先頭のヘッダ（識別子 + Sound の音量）
+_HEADER = struct.Struct("<4sf")
+_MAGIC = b"BFBS"
+
+
+def _code_fingerprint(code: CodeType) -> bytes:
+    """
+    関数のコードの内容を表すバイト列（行番号やファイル名は含まない）
+
+    関数内のラムダなどのコードも再帰的に含める。
+    """
+    parts = [code.co_code, repr(code.co_names).encode()]
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            parts.append(_code_fingerprint(const))
+        else:
+            parts.append(repr(const).encode())
+    return b"\0".join(parts)
+
+
+def _code_names(code: CodeType) -> set[str]:
+    """関数（と関数内のラムダなど）のコードが参照する名前"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _constant_repr(value: Any) -> str | None:
+    """定数（数値・文字列と、それらのタプル・リスト・辞書）なら repr、そうでなければ None"""
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return repr(value)
+    if isinstance(value, (tuple, list, frozenset, set)):
+        items = [_constant_repr(item) for item in value]
+        if any(item is None for item in items):
+            return None
+        if isinstance(value, (frozenset, set)):
+            items.sort()
+        return f"{type(value).__name__}({', '.join(items)})"
+    if isinstance(value, dict):
+        items = [(_constant_repr(k), _constant_repr(v)) for k, v in value.items()]
+        if any(k is None or v is None for k, v in items):
+            return None
+        return "{" + ", ".join(f"{k}: {v}" for k, v in sorted(items)) + "}"
+    return None
+
+
+def _globals_fingerprint(generator: Callable) -> bytes:
+    """
+    生成関数が読むモジュールの定数の値を表すバイト列
+
+    生成関数のモジュールの定数（PARTICLE_GRAVITY など）と、参照しているモジュールの
+    定数（synth.XXX など）を含める。関数やクラスは含めない。
+    """
+    names = _code_names(generator.__code__)
+    module_globals = generator.__globals__
+    parts = []
+    for name in sorted(names):
+        if name not in module_globals:
+            continue
+        value = module_globals[name]
+        if isinstance(value, ModuleType):
+            for attr in sorted(names):
+                text = _constant_repr(getattr(value, attr, _MISSING))
+                if text is not None:
+                    parts.append(f"{name}.{attr}={text}")
+            continue
+        text = _constant_repr(value)
+        if text is not None:
+            parts.append(f"{name}={text}")
+    return "\0".join(parts).encode()
+
+
+class SoundDiskCache:
+    """合成した効果音の PCM をファイルに保存して読み込む"""
+
+    def __init__(self, directory: Path | None = None) -> None:
+        """
+        Args:
+            directory: 保存先（None の場合はユーザーのキャッシュディレクトリ）
+        """
+        self.directory = directory or get_user_cache_dir() / SOUND_CACHE_DIR_NAME
+        self.stats = {"hits": 0, "misses": 0, "errors": 0}
+        self._pruned: set[str] = set()  # 古いファイルを削除済みの生成関数
+        self._available: bool | None = None  # 保存先を作れたか（None なら未確認）
+        self._lock = threading.Lock()
+
+    def _ensure_directory(self) -> bool:
+        """保存先のディレクトリを作る（作れなければ False。結果を覚えて2回目からは試さない）"""
+        with self._lock:
+            if self._available is None:
+                try:
+                    self.directory.mkdir(parents=True, exist_ok=True)
+                    self._available = True
+                except OSError:
+                    self._available = False
+            return self._available
+
+    def _path_for(self, name: str, code_hash: str, key: str) -> Path:
+        return self.directory / f"{name}.{code_hash}.{key}{SOUND_CACHE_SUFFIX}"
+
+    def load(self, path: Path) -> pygame.mixer.Sound | None:
+        """キャッシュファイルをメモリマップして Sound を作る（なければ None）"""
+        try:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                magic, volume = _HEADER.unpack_from(mm)
+                if magic != _MAGIC:
+                    return None
+                # Sound はバッファの内容をコピーするので、すぐに閉じてよい
+                with memoryview(mm) as view:
+                    sound = pygame.mixer.Sound(buffer=view[_HEADER.size :])
+        except (OSError, ValueError, struct.error, pygame.error):
+            return None
+
+        sound.set_volume(volume)
+        return sound
+
+    def save(self, path: Path, sound: pygame.mixer.Sound) -> None:
+        """Sound の PCM をキャッシュファイルに書き出す（書けなくてもゲームは続ける）"""
+        tmp_name = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, sound.get_volume()))
+                f.write(sound.get_raw())
+            os.replace(tmp_name, path)
+            tmp_name = None
+        except OSError:
+            self.stats["errors"] += 1
+        finally:
+            if tmp_name is not None:
+                # 書き込みか置き換えに失敗した一時ファイルを残さない
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+    def prune(self, name: str, code_hash: str) -> None:
+        """生成関数の古いコードで作ったキャッシュファイルを削除する（プロセスごとに1回）"""
+        with self._lock:
+            if name in self._pruned:
+                return
+            self._pruned.add(name)
+
+        for path in self.directory.glob(f"{name}.*{SOUND_CACHE_SUFFIX}"):
+            if path.name.split(".")[-3] != code_hash:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def get_or_create(
+        self,
+        generator: Callable[..., pygame.mixer.Sound],
+        args: tuple,
+        kwargs: dict,
+        code_hash: str,
+    ) -> pygame.mixer.Sound:
+        """
+        キャッシュから Sound を読み込む（なければ生成して保存する）
+
+        Args:
+            generator: 効果音の生成関数
+            args: 生成関数の位置引数
+            kwargs: 生成関数のキーワード引数
+            code_hash: 生成関数のコードのハッシュ
+        """
+        mixer_format = pygame.mixer.get_init()
+        if mixer_format is None:
+            # ミキサー未初期化（Sound を作れないのでそのまま呼んでエラーを任せる）
+            return generator(*args, **kwargs)
+
+        if not self._ensure_directory():
+            # 保存先を作れない（読み取り専用など）場合はキャッシュなしで生成する
+            self.stats["errors"] += 1
+            return generator(*args, **kwargs)
+
+        name = generator.__qualname__
+        key_source = repr((SOUND_CACHE_VERSION, name, args, sorted(kwargs.items()), mixer_format))
+        key = hashlib.sha256(key_source.encode()).hexdigest()[:16]
+        path = self._path_for(name, code_hash, key)
+
+        sound = self.load(path)
+        if sound is not None:
+            self.stats["hits"] += 1
+            return sound
+
+        self.stats["misses"] += 1
+        self.prune(name, code_hash)
+        sound = generator(*args, **kwargs)
+        self.save(path, sound)
+        return sound
+
+
+# プロセス全体で共有するキャッシュ
+_sound_disk_cache: SoundDiskCache | None = None
+_sound_disk_cache_lock = threading.Lock()
+
+
+def get_sound_disk_cache() -> SoundDiskCache:
+    """共有の効果音キャッシュを取得する"""
+    global _sound_disk_cache
+
+    # バックグラウンドスレッド（prewarm）から最初に呼ばれることもあるためロックする
+    with _sound_disk_cache_lock:
+        if _sound_disk_cache is None:
+            _sound_disk_cache = SoundDiskCache()
+    return _sound_disk_cache
+
+
+def disk_cached_sound(
+    generator: Callable[..., pygame.mixer.Sound],
+) -> Callable[..., pygame.mixer.Sound]:
+    """
+    効果音の生成関数の結果をディスクにキャッシュするデコレータ
+
+    引数は repr() で区別できる値（数値・文字列など）にすること。
+    staticmethod と併用する場合は @staticmethod を外側に書く。
+
+        @staticmethod
+        @disk_cached_sound
+        def _create_pop_sound() -> pygame.mixer.Sound:
+            ...
+    """
+    code_fingerprint = _code_fingerprint(generator.__code__) + repr(SYNTH_VERSION).encode()
+    code_hash: str | None = None
+
+    @functools.wraps(generator)
+    def wrapper(*args, **kwargs) -> pygame.mixer.Sound:
+        nonlocal code_hash
+        if code_hash is None:
+            # モジュールの定数は関数より後で定義されることもあるため、最初に呼ばれたときに読む
+            fingerprint = code_fingerprint + b"\0" + _globals_fingerprint(generator)
+            code_hash = hashlib.sha256(fingerprint).hexdigest()[:12]
+        return get_sound_disk_cache().get_or_create(generator, args, kwargs, code_hash)
+
+    return wrapper
@@ -0,0 +1,153 @@
+"""
+スプライトアトラス - 色付きの半透明の円をあらかじめ描いておく
+
+パーティクルを描くたびに SRCALPHA の Surface を作って円を描くと、1フレームに
+パーティクルの数だけ Surface の確保と円の描画が起きる。CircleSpriteAtlas は
+半径（整数）と不透明度（CIRCLE_ALPHA_LEVELS 段階）で量子化した円を、色ごとに1回だけ
+描いて保存する。描画は保存した Surface を Surface.blits() でまとめて貼るだけになる。
+
+円はアンチエイリアスをかける（CIRCLE_SUPERSAMPLE 倍の大きさで描いて縮小する）。
+白い円の型（半径ごと）を作っておき、色と不透明度は型に掛け合わせて付ける。
+保存した円と型の合計サイズを数え、上限（CIRCLE_ATLAS_MAX_BYTES）を超えたら
+最も長く使われていないものから捨てる（LRU）。色や半径の種類が多くてもメモリは増え続けない。
+
+使い方:
+    atlas = get_circle_atlas()
+    sprite = atlas.sprite((255, 0, 0), radius=8, opacity=128)  # 見えない場合は None
+    screen.blits([(sprite, (x - 8, y - 8))], doreturn=False)
+"""
+
+import threading
+from collections import OrderedDict
+
+import pygame
+
+# 不透明度の段階数（0〜255 をこの段階に丸める）
+CIRCLE_ALPHA_LEVELS: int = 16
+
+# アンチエイリアス用に円を描く倍率
+CIRCLE_SUPERSAMPLE: int = 4
+
+# 保存する円と型の合計サイズの上限（バイト）
+CIRCLE_ATLAS_MAX_BYTES: int = 8 * 1024 * 1024
+
+
+class CircleSpriteAtlas:
+    """色・半径・不透明度ごとの円の Surface を保存する（合計サイズの上限付き LRU）"""
+
+    def __init__(
+        self, alpha_levels: int = CIRCLE_ALPHA_LEVELS, max_bytes: int | None = CIRCLE_ATLAS_MAX_BYTES
+    ) -> None:
+        """
+        Args:
+            alpha_levels: 不透明度の段階数
+            max_bytes: 保存する円と型の合計サイズの上限（None の場合は無制限）
+        """
+        self.alpha_levels = alpha_levels
+        self.max_bytes = max_bytes
+        self._masks: OrderedDict[int, pygame.Surface] = OrderedDict()  # 半径 → 白い円の型（古く使われた順）
+        self._sprites: OrderedDict[tuple[tuple[int, int, int], int, int], pygame.Surface] = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes_used = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sprites)
+
+    def quantize_alpha(self, opacity: int) -> int:
+        """不透明度（0〜255）を段階の番号（0〜alpha_levels - 1）に丸める"""
+        top = self.alpha_levels - 1
+        return min(top, max(0, round(opacity * top / 255)))
+
+    def _mask(self, radius: int) -> pygame.Surface:
+        """アンチエイリアスをかけた白い円の型を取得する（ロックを取った状態で呼ぶ）"""
+        mask = self._masks.get(radius)
+        if mask is not None:
+            self._masks.move_to_end(radius)
+            return mask
+
+        size = radius * 2
+        scale = CIRCLE_SUPERSAMPLE
+        large = pygame.Surface((size * scale, size * scale), pygame.SRCALPHA)
+        large.fill((255, 255, 255, 0))  # 縮小したときに縁が黒く混ざらないよう、透明部分も白にする
+        pygame.draw.circle(large, (255, 255, 255, 255), (radius * scale, radius * scale), radius * scale)
+        mask = self._masks[radius] = pygame.transform.smoothscale(large, (size, size))
+        self.bytes_used += mask.get_pitch() * mask.get_height()
+        return mask
+
+    def _evict(self) -> None:
+        """合計サイズが上限を超えていれば、古く使われた円から捨てる（ロックを取った状態で呼ぶ）"""
+        # 直前に使った円と型（最後の1つ）は残す。型は円を作るときにしか使わないので円より先に捨てる
+        for surfaces in (self._masks, self._sprites):
+            while self.max_bytes is not None and self.bytes_used > self.max_bytes and len(surfaces) > 1:
+                surface = surfaces.pop(next(iter(surfaces)))
+                self.bytes_used -= surface.get_pitch() * surface.get_height()
+                self.stats["evictions"] += 1
+
+    def sprite(self, color: tuple[int, int, int], radius: int, opacity: int = 255) -> pygame.Surface | None:
+        """
+        円の Surface を取得する（なければ作る）
+
+        Args:
+            color: 色
+            radius: 半径（Surface の大きさは radius * 2 の正方形）
+            opacity: 不透明度（0〜255。段階に丸める）
+
+        Returns:
+            円の Surface（半径が 0 以下か、丸めた不透明度が 0 の場合は None）
+        """
+        return self.sprite_at_level(color, radius, self.quantize_alpha(opacity))
+
+    def sprite_at_level(self, color: tuple[int, int, int], radius: int, level: int) -> pygame.Surface | None:
+        """
+        丸めた不透明度の番号で円の Surface を取得する（quantize_alpha() 済みの場合）
+
+        Args:
+            color: 色
+            radius: 半径
+            level: 不透明度の段階の番号（0〜alpha_levels - 1）
+        """
+        if radius <= 0 or level <= 0:
+            return None
+
+        key = (color, radius, level)
+        with self._lock:
+            sprite = self._sprites.get(key)
+            if sprite is not None:
+                self._sprites.move_to_end(key)
+                self.stats["hits"] += 1
+                return sprite
+
+            self.stats["misses"] += 1
+            sprite = self._mask(radius).copy()
+            alpha = round(level * 255 / (self.alpha_levels - 1))
+            sprite.fill((*color, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()  # 画面の形式に合わせて貼る時間を短くする
+            self._sprites[key] = sprite
+            self.bytes_used += sprite.get_pitch() * sprite.get_height()
+            self._evict()
+        return sprite
+
+    def clear(self) -> None:
+        """保存した円をすべて捨てる"""
+        with self._lock:
+            self._masks.clear()
+            self._sprites.clear()
+            self.bytes_used = 0
+
+
+# プロセス全体で共有するアトラス
+_circle_atlas: CircleSpriteAtlas | None = None
+_circle_atlas_lock = threading.Lock()
+
+
+def get_circle_atlas() -> CircleSpriteAtlas:
+    """共有の円のアトラスを取得する"""
+    global _circle_atlas
+
+    with _circle_atlas_lock:
+        if _circle_atlas is None:
+            _circle_atlas = CircleSpriteAtlas()
+    return _circle_atlas
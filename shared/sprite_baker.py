@@ -0,0 +1,157 @@
+"""
+焼き付けたスプライト - pygame.draw で描くキャラクターを1回だけ描いて貼る
+
+画像ファイルがないときのキャラクター（動物・乗り物・風船など）は、毎フレーム数十回の
+pygame.draw で描いている。SpriteBaker は描画関数を1回だけ SRCALPHA の Surface に描いて
+（焼き付けて）保存し、以降は保存した Surface を貼るだけにする。
+キーには大きさ・色・姿勢（車輪の角度など）のように、絵を変えるものをすべて入れる。
+保存した Surface の合計サイズを数え、上限を超えたら最も長く使われていないものから捨てる（LRU）。
+
+描画関数は draw(surface, x, y) の形で、(x, y) を基準点として描く。焼き付けるときは
+extent の大きさの Surface の中央を基準点にして描き、描かれた範囲だけを切り出して保存する。
+
+使い方:
+    baker = get_sprite_baker()
+    render = lambda surface, x, y: self._draw_dog(surface, x, y, size)
+    baker.draw(screen, ("animal_touch", "dog", size), (cx, cy), render, (size * 2, size * 2))
+    baker.bake(key, render, extent)  # 起動時に焼き付けておく場合
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable
+
+import pygame
+
+# 保存する焼き付けたスプライトの合計サイズの上限（バイト）
+BAKED_SPRITE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+
+# 描画関数（描く先, 基準点の x, 基準点の y）
+SpriteRenderer = Callable[[pygame.Surface, int, int], None]
+
+
+@dataclass(frozen=True)
+class BakedSprite:
+    """焼き付けたスプライト"""
+
+    surface: pygame.Surface
+    offset: tuple[int, int]  # 基準点から Surface の左上までのずれ
+
+
+class SpriteBaker:
+    """描画関数を焼き付けたスプライトを保存する（合計サイズの上限付き LRU）"""
+
+    def __init__(self, max_bytes: int | None = BAKED_SPRITE_CACHE_MAX_BYTES) -> None:
+        """
+        Args:
+            max_bytes: 保存するスプライトの合計サイズの上限（None の場合は無制限）
+        """
+        self.max_bytes = max_bytes
+        self.enabled = True  # False なら焼き付けずに毎回描画関数で描く（ベンチマーク用）
+        self._sprites: OrderedDict[Hashable, BakedSprite] = OrderedDict()  # 古く使われた順
+        self._lock = threading.Lock()
+        self.bytes_used = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sprites)
+
+    def _remove(self, key: Hashable) -> None:
+        """保存したスプライトを捨てる（ロックを取った状態で呼ぶ）"""
+        surface = self._sprites.pop(key).surface
+        self.bytes_used -= surface.get_pitch() * surface.get_height()
+
+    def _render(self, render: SpriteRenderer, extent: tuple[int, int]) -> BakedSprite:
+        """描画関数を透明な Surface に描き、描かれた範囲だけを切り出す"""
+        width, height = max(1, int(extent[0])), max(1, int(extent[1]))
+        anchor_x, anchor_y = width // 2, height // 2
+        canvas = pygame.Surface((width, height), pygame.SRCALPHA)
+        render(canvas, anchor_x, anchor_y)
+
+        bounds = canvas.get_bounding_rect()
+        surface = canvas.subsurface(bounds).copy()
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()  # 画面の形式に合わせて貼る時間を短くする
+        # pygame.draw の絵は透明か不透明の画素がほとんどなので、連続した画素をまとめて貼る（RLE）
+        surface.set_alpha(255, pygame.RLEACCEL)
+        return BakedSprite(surface, (bounds.x - anchor_x, bounds.y - anchor_y))
+
+    def get(self, key: Hashable, render: SpriteRenderer, extent: tuple[int, int]) -> BakedSprite:
+        """
+        焼き付けたスプライトを取得する（なければ焼き付けて保存する）
+
+        Args:
+            key: スプライトのキー（大きさ・色・姿勢など、絵を変えるものをすべて含める）
+            render: 描画関数（基準点を中心に描く）
+            extent: 焼き付ける Surface の大きさ（幅, 高さ）。基準点は中央。はみ出した部分は捨てる
+        """
+        with self._lock:
+            sprite = self._sprites.get(key)
+            if sprite is not None:
+                self._sprites.move_to_end(key)
+                self.stats["hits"] += 1
+                return sprite
+            self.stats["misses"] += 1
+
+        sprite = self._render(render, extent)
+
+        with self._lock:
+            if key in self._sprites:
+                self._remove(key)
+            self._sprites[key] = sprite
+            self.bytes_used += sprite.surface.get_pitch() * sprite.surface.get_height()
+            while self.max_bytes is not None and self.bytes_used > self.max_bytes and len(self._sprites) > 1:
+                self._remove(next(iter(self._sprites)))
+                self.stats["evictions"] += 1
+        return sprite
+
+    def bake(self, key: Hashable, render: SpriteRenderer, extent: tuple[int, int]) -> None:
+        """先に焼き付けておく（起動時など。引数は get() と同じ）"""
+        self.get(key, render, extent)
+
+    def draw(
+        self,
+        screen: pygame.Surface,
+        key: Hashable,
+        pos: tuple[float, float],
+        render: SpriteRenderer,
+        extent: tuple[int, int],
+    ) -> None:
+        """
+        焼き付けたスプライトを貼る（なければ焼き付ける）
+
+        Args:
+            screen: 描画先
+            key: スプライトのキー
+            pos: 基準点の位置
+            render: 描画関数
+            extent: 焼き付ける Surface の大きさ
+        """
+        if not self.enabled:
+            render(screen, pos[0], pos[1])
+            return
+        sprite = self.get(key, render, extent)
+        screen.blit(sprite.surface, (int(pos[0]) + sprite.offset[0], int(pos[1]) + sprite.offset[1]))
+
+    def clear(self) -> None:
+        """保存したスプライトをすべて捨てる"""
+        with self._lock:
+            self._sprites.clear()
+            self.bytes_used = 0
+
+
+# プロセス全体で共有するベイカー
+_sprite_baker: SpriteBaker | None = None
+_sprite_baker_lock = threading.Lock()
+
+
+def get_sprite_baker() -> SpriteBaker:
+    """共有のスプライトのベイカーを取得する"""
+    global _sprite_baker
+
+    with _sprite_baker_lock:
+        if _sprite_baker is None:
+            _sprite_baker = SpriteBaker()
+    return _sprite_baker
@@ -0,0 +1,141 @@
+"""
+ストリーミング再生 - 短い音のブロックを生成しながら専用チャンネルで鳴らし続ける
+
+あらかじめ長い Sound を作って1回鳴らすと、鳴らし始めた後に音の高さや大きさを変えられない。
+StreamingVoice は音源（render）に短いブロックを生成させ、専用に予約したチャンネルへ
+Channel.queue() で次々に並べる。ブロックの生成はバックグラウンドスレッドで
+STREAM_LOOKAHEAD_BLOCKS 個先まで行い、毎フレームの pump() は生成済みのブロックを
+並べるだけなので、フレームループを止めない。音源のパラメータの変更は数ブロック後に反映される。
+
+使い方:
+    voice = StreamingVoice()           # on_enter() でミキサーの初期化後に作る
+    voice.start(engine.render)         # render(duration) は duration 秒分の Sound を返す
+    voice.pump()                       # update() で毎回呼ぶ
+    voice.stop()
+    voice.release()                    # on_exit() で予約を解除
+"""
+
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+import pygame
+
+from shared import audio, synth
+
+# 1ブロックの長さ（秒）。短いほど変化に素早く追従するが、フレームが遅れると途切れやすい
+STREAM_BLOCK_SECONDS: float = 0.05
+
+# 先に生成しておくブロック数（チャンネルに並べたものを除く）
+STREAM_LOOKAHEAD_BLOCKS: int = 2
+
+# 止めるときのフェードアウト時間（ミリ秒）
+STREAM_FADE_MS: int = 150
+
+
+class StreamingVoice:
+    """音源が生成するブロックを専用チャンネルに並べて鳴らし続ける"""
+
+    def __init__(self, block_seconds: float = STREAM_BLOCK_SECONDS) -> None:
+        """
+        Args:
+            block_seconds: 1ブロックの長さ（秒）
+
+        使うチャンネルは audio.reserve_channels() で1つ予約する。
+        """
+        self.block_seconds = block_seconds
+        self._indices = audio.reserve_channels(1)
+        self.channel = pygame.mixer.Channel(self._indices[0])
+        self._render: Callable[[float], pygame.mixer.Sound] | None = None
+        self._pending: deque[Future] = deque()  # 生成中・生成済みのブロック（古い順）
+        self._playing = False  # 最初のブロックを鳴らし始めたか
+        # 生成は1ブロックずつ順番に行う（音源は前のブロックの続きを生成する）
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stream")
+        # フェードアウト後に並べたブロックが鳴らないよう、差し替える無音
+        self._silence = synth.to_sound(synth.timeline(0.005) * 0, amplitude=0)
+        self.stats = {
+            "blocks": 0,  # 生成したブロック数
+            "underruns": 0,  # 次のブロックが間に合わず音が途切れた回数
+            "max_render_ms": 0.0,  # 1ブロックの生成にかかった最大時間
+        }
+
+    @property
+    def is_active(self) -> bool:
+        """鳴らし続けているか"""
+        return self._render is not None
+
+    def _render_block(self, render: Callable[[float], pygame.mixer.Sound]) -> pygame.mixer.Sound:
+        """バックグラウンドスレッドで1ブロック生成する"""
+        start = time.perf_counter()
+        block = render(self.block_seconds)
+        render_ms = (time.perf_counter() - start) * 1000.0
+        self.stats["blocks"] += 1
+        self.stats["max_render_ms"] = max(self.stats["max_render_ms"], render_ms)
+        return block
+
+    def _fill(self) -> None:
+        """先に生成しておくブロックを補充する"""
+        while len(self._pending) < STREAM_LOOKAHEAD_BLOCKS:
+            self._pending.append(self._executor.submit(self._render_block, self._render))
+
+    def _take_block(self) -> pygame.mixer.Sound | None:
+        """生成済みのブロックを取り出す（まだなければ None）"""
+        if not self._pending or not self._pending[0].done():
+            return None
+        return self._pending.popleft().result()
+
+    def start(self, render: Callable[[float], pygame.mixer.Sound]) -> None:
+        """
+        音源を鳴らし始める（鳴らしている音源があれば切り替える）
+
+        最初のブロックが生成できた後の pump() で鳴り始める。
+
+        Args:
+            render: 指定した秒数分のブロックを Sound として返す関数
+        """
+        self.stop(fade_ms=0)
+        self._render = render
+        self._fill()
+
+    def pump(self) -> None:
+        """生成済みのブロックをチャンネルに並べる（update() で毎回呼ぶ）"""
+        if self._render is None:
+            return
+
+        if not self.channel.get_busy():
+            block = self._take_block()
+            if block is not None:
+                if self._playing:
+                    # 並べたブロックを鳴らし終えてしまった（生成が間に合わなかった）
+                    self.stats["underruns"] += 1
+                self.channel.play(block)
+                self._playing = True
+
+        if self._playing and self.channel.get_queue() is None:
+            block = self._take_block()
+            if block is not None:
+                self.channel.queue(block)
+
+        self._fill()
+
+    def stop(self, fade_ms: int = STREAM_FADE_MS) -> None:
+        """鳴らすのをやめる（並べたブロックはフェードアウトさせる）"""
+        self._render = None
+        self._playing = False
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+
+        if fade_ms > 0:
+            # フェードアウトが終わると並べたブロックが鳴ってしまうので、無音に差し替えておく
+            self.channel.queue(self._silence)
+            self.channel.fadeout(fade_ms)
+        else:
+            self.channel.stop()
+
+    def release(self) -> None:
+        """音を止めてチャンネルの予約を解除する"""
+        self.stop(fade_ms=0)
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        audio.release_channels(self._indices)
@@ -0,0 +1,536 @@
+"""
+シンセサイザー - 効果音の波形をまとめて生成する
+
+オシレーター・エンベロープ・和音・スイープ・FM を組み合わせて効果音を作る。
+1サンプルずつ math.sin を呼ぶ代わりに、時間軸全体を1つのバッファとして計算する。
+NumPy があれば NumPy の配列で、なければ純 Python のバッファで同じ計算を行う。
+サンプリングレート・サンプル形式・チャンネル数はミキサーの設定（pygame.mixer.get_init()）に
+合わせて生成するので、再生時の変換は行われない。
+
+使い方:
+    t = timeline(0.15)
+    wave = chord([523, 659, 784], t) * linear_envelope([(0.0, 1.0), (0.15, 0.0)], t)
+    sound = to_sound(wave, amplitude=15000, volume=0.35)
+"""
+
+import array
+import math
+import random
+from typing import Iterable, Sequence, Union
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # NumPy がない環境では純 Python で計算する
+    np = None
+
+# ミキサーが初期化されていない場合のサンプリングレート（Hz）
+SAMPLE_RATE: int = 22050
+
+# ミキサーが初期化されていない場合の形式（周波数, サンプルのビット数, チャンネル数）
+DEFAULT_MIXER_FORMAT: tuple[int, int, int] = (SAMPLE_RATE, -16, 1)
+
+# ミキサーのサンプルのビット数（負は符号付き、±32 は float）→ array の型コード
+SAMPLE_TYPECODES: dict[int, str] = {8: "B", -8: "b", 16: "H", -16: "h", 32: "f", -32: "f"}
+
+# 16bit 音声の最大振幅
+MAX_AMPLITUDE: int = 32767
+
+# 波形の計算方法のバージョン（計算結果が変わる変更をしたら上げる。効果音キャッシュのキーに使う）
+SYNTH_VERSION: int = 1
+
+# NumPy を使うか（use_numpy() で切り替える）
+_use_numpy: bool = np is not None
+
+
+class PyBuffer:
+    """NumPy がない場合のバッファ（要素ごとの四則演算だけを持つ）"""
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: Iterable[float]) -> None:
+        self.values = list(values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def _apply(self, other, op) -> "PyBuffer":
+        if isinstance(other, PyBuffer):
+            return PyBuffer(op(a, b) for a, b in zip(self.values, other.values))
+        return PyBuffer(op(a, other) for a in self.values)
+
+    def __add__(self, other) -> "PyBuffer":
+        return self._apply(other, lambda a, b: a + b)
+
+    def __radd__(self, other) -> "PyBuffer":
+        return self._apply(other, lambda a, b: b + a)
+
+    def __sub__(self, other) -> "PyBuffer":
+        return self._apply(other, lambda a, b: a - b)
+
+    def __rsub__(self, other) -> "PyBuffer":
+        return self._apply(other, lambda a, b: b - a)
+
+    def __mul__(self, other) -> "PyBuffer":
+        return self._apply(other, lambda a, b: a * b)
+
+    def __rmul__(self, other) -> "PyBuffer":
+        return self._apply(other, lambda a, b: b * a)
+
+    def __truediv__(self, other) -> "PyBuffer":
+        return self._apply(other, lambda a, b: a / b)
+
+    def __mod__(self, other) -> "PyBuffer":
+        return self._apply(other, lambda a, b: a % b)
+
+    def __pow__(self, other) -> "PyBuffer":
+        return self._apply(other, lambda a, b: a**b)
+
+    def __neg__(self) -> "PyBuffer":
+        return PyBuffer(-a for a in self.values)
+
+
+# 波形バッファ（NumPy の配列または PyBuffer）
+Buffer = Union["np.ndarray", PyBuffer]
+
+
+def use_numpy(enabled: bool) -> bool:
+    """
+    NumPy を使うかどうかを切り替える（ベンチマーク用）
+
+    Args:
+        enabled: True なら NumPy を使う（NumPy がない場合は無視される）
+
+    Returns:
+        切り替える前の設定
+    """
+    global _use_numpy
+
+    previous = _use_numpy
+    _use_numpy = enabled and np is not None
+    return previous
+
+
+def is_numpy_enabled() -> bool:
+    """NumPy で計算しているか"""
+    return _use_numpy
+
+
+def get_mixer_format() -> tuple[int, int, int]:
+    """
+    生成する音の形式を取得する
+
+    Returns:
+        (サンプリングレート, サンプルのビット数, チャンネル数)。
+        ミキサーが初期化されていなければ DEFAULT_MIXER_FORMAT
+    """
+    return pygame.mixer.get_init() or DEFAULT_MIXER_FORMAT
+
+
+# ========== 基本演算 ==========
+
+
+def _sin(x: Buffer) -> Buffer:
+    if isinstance(x, PyBuffer):
+        return PyBuffer(math.sin(v) for v in x.values)
+    return np.sin(x)
+
+
+def _exp(x: Buffer) -> Buffer:
+    if isinstance(x, PyBuffer):
+        return PyBuffer(math.exp(v) for v in x.values)
+    return np.exp(x)
+
+
+def _zeros_like(t: Buffer) -> Buffer:
+    if isinstance(t, PyBuffer):
+        return PyBuffer([0.0] * len(t))
+    return np.zeros_like(t)
+
+
+# ========== 時間軸 ==========
+
+
+def timeline(duration: float, sample_rate: int | None = None) -> Buffer:
+    """
+    各サンプルの時刻（秒）のバッファを作る
+
+    Args:
+        duration: 長さ（秒）
+        sample_rate: サンプリングレート（None の場合はミキサーのサンプリングレート）
+
+    Returns:
+        [0, 1/sample_rate, 2/sample_rate, ...] のバッファ
+    """
+    if sample_rate is None:
+        sample_rate = get_mixer_format()[0]
+    samples = int(sample_rate * duration)
+    if _use_numpy:
+        return np.arange(samples, dtype=np.float64) / sample_rate
+    return PyBuffer(i / sample_rate for i in range(samples))
+
+
+# ========== オシレーター ==========
+
+
+def tone(
+    freq: float | Buffer,
+    t: Buffer,
+    harmonics: Sequence[tuple[float, float]] = ((1.0, 1.0),),
+) -> Buffer:
+    """
+    サイン波（倍音付き）を生成する
+
+    Args:
+        freq: 周波数（Hz）。スイープなどで時間とともに変わる場合はバッファ
+        t: 時間軸
+        harmonics: (周波数の倍率, 音量) のリスト
+
+    Returns:
+        sum(音量 * sin(2π * freq * 倍率 * t))
+    """
+    return partials(2 * math.pi * freq * t, harmonics)
+
+
+def partials(
+    phase: Buffer, harmonics: Sequence[tuple[float, float]] = ((1.0, 1.0),)
+) -> Buffer:
+    """
+    位相から倍音付きのサイン波を生成する（glide() の位相と組み合わせる）
+
+    Args:
+        phase: 位相（ラジアン）のバッファ
+        harmonics: (周波数の倍率, 音量) のリスト
+
+    Returns:
+        sum(音量 * sin(位相 * 倍率))
+    """
+    wave = None
+    for multiple, level in harmonics:
+        partial = _sin(phase * multiple) if multiple != 1.0 else _sin(phase)
+        partial = partial * level if level != 1.0 else partial
+        wave = partial if wave is None else wave + partial
+    return wave if wave is not None else _zeros_like(phase)
+
+
+def chord(freqs: Sequence[float], t: Buffer) -> Buffer:
+    """
+    和音を生成する（各音の平均）
+
+    Args:
+        freqs: 構成音の周波数（Hz）
+        t: 時間軸
+    """
+    wave = _zeros_like(t)
+    for freq in freqs:
+        wave = wave + _sin(2 * math.pi * freq * t) / len(freqs)
+    return wave
+
+
+def fm(carrier: float, modulator: float, index: float, t: Buffer) -> Buffer:
+    """
+    FM 音源（位相変調）で波形を生成する
+
+    Args:
+        carrier: キャリアの周波数（Hz）
+        modulator: モジュレーターの周波数（Hz）
+        index: 変調指数（大きいほど倍音が増える）
+        t: 時間軸
+
+    Returns:
+        sin(2π * carrier * t + index * sin(2π * modulator * t))
+    """
+    return _sin(2 * math.pi * carrier * t + index * _sin(2 * math.pi * modulator * t))
+
+
+def noise(amount: float, t: Buffer, rng: random.Random | None = None) -> Buffer:
+    """
+    一様乱数のノイズ（-amount〜amount）を生成する
+
+    ゲームの random の系列を変えないよう、専用の乱数生成器を使う。
+    """
+    rng = rng or random.Random()
+    if isinstance(t, PyBuffer):
+        return PyBuffer(rng.uniform(-amount, amount) for _ in range(len(t)))
+    generator = np.random.default_rng(rng.getrandbits(32))
+    return generator.uniform(-amount, amount, len(t))
+
+
+# ========== 周波数の変化 ==========
+
+
+def sweep(start_freq: float, end_freq: float, duration: float, t: Buffer) -> Buffer:
+    """
+    周波数を直線的に変化させる（tone() の freq に渡す）
+
+    Args:
+        start_freq: 開始時の周波数（Hz）
+        end_freq: duration 秒後の周波数（Hz）
+        duration: 変化にかける時間（秒）
+        t: 時間軸
+    """
+    return start_freq + (end_freq - start_freq) * t / duration
+
+
+def glide(
+    start_freq: float, end_freq: float, duration: float, t: Buffer | float, phase: float = 0.0
+) -> Buffer | float:
+    """
+    周波数を start_freq から end_freq へ直線的に変えたときの位相（ラジアン）
+
+    tone() の 2π * freq * t と違い、周波数を変えても波形が途切れない。
+    t に時刻（float）を渡すとその時刻の位相を返すので、ブロックの終わりの位相を
+    次のブロックの phase に渡せば、ブロックをつなげても波形が続く。
+
+    Args:
+        start_freq: 開始時の周波数（Hz）
+        end_freq: duration 秒後の周波数（Hz）
+        duration: 周波数を変える時間（秒）
+        t: 時間軸（またはある時刻）
+        phase: t = 0 の位相
+    """
+    slope = (end_freq - start_freq) / (2 * duration)
+    return phase + 2 * math.pi * (start_freq * t + slope * t * t)
+
+
+def vibrato(freq: float, rate: float, depth: float, t: Buffer) -> Buffer:
+    """
+    周波数を周期的に揺らす（tone() の freq に渡す）
+
+    Args:
+        freq: 中心の周波数（Hz）
+        rate: 揺れの速さ（Hz）
+        depth: 揺れの幅（freq に対する割合）
+        t: 時間軸
+    """
+    return freq * (1 + depth * _sin(2 * math.pi * rate * t))
+
+
+def steps(freqs: Sequence[float], step_duration: float, t: Buffer) -> Buffer:
+    """
+    周波数を一定時間ごとに切り替える（アルペジオ用）
+
+    最後の周波数に達した後はその周波数を保つ。
+
+    Args:
+        freqs: 順に鳴らす周波数（Hz）
+        step_duration: 1音の長さ（秒）
+        t: 時間軸
+    """
+    last = len(freqs) - 1
+    if isinstance(t, PyBuffer):
+        return PyBuffer(freqs[min(int(v / step_duration), last)] for v in t.values)
+    indices = np.minimum((t / step_duration).astype(np.int64), last)
+    return np.asarray(freqs, dtype=np.float64)[indices]
+
+
+def alternate(freq1: float, freq2: float, rate: float, t: Buffer) -> Buffer:
+    """
+    2つの周波数を交互に切り替える（サイレン用）
+
+    Args:
+        freq1: 前半の周波数（Hz）
+        freq2: 後半の周波数（Hz）
+        rate: 1秒あたりの切り替えの周期数
+        t: 時間軸
+    """
+    cycle = (t * rate) % 1.0
+    if isinstance(t, PyBuffer):
+        return PyBuffer(freq1 if c < 0.5 else freq2 for c in cycle.values)
+    return np.where(cycle < 0.5, freq1, freq2)
+
+
+# ========== エンベロープ ==========
+
+
+def linear_envelope(points: Sequence[tuple[float, float]], t: Buffer) -> Buffer:
+    """
+    折れ線のエンベロープを生成する
+
+    Args:
+        points: (時刻（秒）, 音量) のリスト（時刻の昇順）。範囲外は端の値を保つ
+        t: 時間軸
+    """
+    times = [p[0] for p in points]
+    levels = [p[1] for p in points]
+    if not isinstance(t, PyBuffer):
+        return np.interp(t, times, levels)
+
+    def interp(v: float) -> float:
+        if v <= times[0]:
+            return levels[0]
+        for i in range(1, len(times)):
+            if v < times[i]:
+                ratio = (v - times[i - 1]) / (times[i] - times[i - 1])
+                return levels[i - 1] + (levels[i] - levels[i - 1]) * ratio
+        return levels[-1]
+
+    return PyBuffer(interp(v) for v in t.values)
+
+
+def exp_decay(rate: float, t: Buffer) -> Buffer:
+    """指数関数的に減衰するエンベロープ exp(-rate * t)"""
+    return _exp(t * -rate)
+
+
+def power_decay(exponent: float, duration: float, t: Buffer) -> Buffer:
+    """
+    1 - (t / duration) ** exponent で減衰するエンベロープ（0 未満にはならない）
+
+    exponent が 1 より小さいと最初に速く、大きいと最後に速く減衰する。
+    """
+    curve = 1.0 - (t / duration) ** exponent
+    if isinstance(curve, PyBuffer):
+        return PyBuffer(max(0.0, v) for v in curve.values)
+    return np.maximum(curve, 0.0)
+
+
+def tremolo(rate: float, depth: float, t: Buffer) -> Buffer:
+    """音量を周期的に揺らす係数 1 + depth * sin(2π * rate * t)"""
+    return 1 + depth * _sin(2 * math.pi * rate * t)
+
+
+# ========== 出力 ==========
+
+
+def _convert_sample(value: float, size: int) -> float | int:
+    """16bit の範囲のサンプル値をミキサーのサンプル形式に変換する"""
+    if abs(size) == 32:
+        return value / (MAX_AMPLITUDE + 1)
+    value = int(value)
+    if size == -16:
+        return value
+    if size == 16:
+        return value + MAX_AMPLITUDE + 1
+    if size == -8:
+        return value >> 8
+    return (value >> 8) + 128
+
+
+def _pan_gains(pan: float | Buffer) -> tuple[float | Buffer, float | Buffer]:
+    """パン（-1.0: 左 〜 1.0: 右）から左右の音量の係数を求める（中央で 1.0 になる等パワー）"""
+    angle = (pan + 1) * (math.pi / 4)
+    if isinstance(angle, float | int):
+        return math.cos(angle) * math.sqrt(2), math.sin(angle) * math.sqrt(2)
+    return _sin(angle + math.pi / 2) * math.sqrt(2), _sin(angle) * math.sqrt(2)
+
+
+def _convert_channel(scaled: Buffer, size: int) -> Union[array.array, "np.ndarray"]:
+    """16bit 換算の波形を1チャンネル分のサンプル列に変換する（範囲外は切り詰める）"""
+    typecode = SAMPLE_TYPECODES[size]
+    if isinstance(scaled, PyBuffer):
+        return array.array(
+            typecode,
+            (
+                _convert_sample(max(-MAX_AMPLITUDE, min(MAX_AMPLITUDE, v)), size)
+                for v in scaled.values
+            ),
+        )
+
+    clipped = np.clip(scaled, -MAX_AMPLITUDE, MAX_AMPLITUDE)
+    if abs(size) == 32:
+        return (clipped / (MAX_AMPLITUDE + 1)).astype(np.float32)
+    samples = clipped.astype(np.int16)
+    if abs(size) == 8:
+        samples = samples >> 8
+    if size > 0:
+        samples = samples.astype(np.int32) + (128 if size == 8 else MAX_AMPLITUDE + 1)
+    return samples.astype(np.dtype(typecode))
+
+
+def to_samples(
+    wave: Buffer,
+    amplitude: float,
+    mixer_format: tuple[int, int, int] | None = None,
+    pan: float | Buffer | None = None,
+) -> Union[array.array, "np.ndarray"]:
+    """
+    波形をミキサーの形式の PCM サンプルに変換する
+
+    Args:
+        wave: -1.0〜1.0 程度の波形（timeline() の時間軸で作ったもの）
+        amplitude: 16bit 換算の振幅（最大 MAX_AMPLITUDE。8bit や float の形式では同じ音量になるよう換算する）
+        mixer_format: (サンプリングレート, ビット数, チャンネル数)（None の場合はミキサーの形式）
+        pan: 左右の位置（-1.0: 左 〜 1.0: 右）。時間とともに動かす場合はバッファ。
+             ステレオ以外のミキサーでは無視する
+
+    Returns:
+        サンプル列（範囲外は切り詰める）。pan を指定しなければ、2チャンネル以上では同じ音を各チャンネルに並べる
+    """
+    _, size, channels = mixer_format or get_mixer_format()
+
+    if pan is not None and channels == 2:
+        left_gain, right_gain = _pan_gains(pan)
+        left = _convert_channel(wave * (left_gain * amplitude), size)
+        right = _convert_channel(wave * (right_gain * amplitude), size)
+        if isinstance(left, array.array):
+            return array.array(left.typecode, (v for pair in zip(left, right) for v in pair))
+        return np.column_stack((left, right)).ravel()
+
+    samples = _convert_channel(wave * amplitude, size)
+    if channels > 1:
+        if isinstance(samples, array.array):
+            return array.array(samples.typecode, (v for v in samples for _ in range(channels)))
+        return np.repeat(samples, channels)
+    return samples
+
+
+def resample(sound: pygame.mixer.Sound, ratio: float) -> pygame.mixer.Sound:
+    """
+    Sound を ratio 倍の速さで再生した音を作る（音の高さは ratio 倍、長さは 1/ratio 倍）
+
+    サンプルの間は直線で補間する。ミキサーの形式のまま計算するので、
+    符号なしの形式もそのまま補間でき、変換は行われない。音量（Sound.get_volume()）も引き継ぐ。
+
+    Args:
+        sound: 元の音（ミキサーの形式で読み込んだもの）
+        ratio: 再生の速さの倍率（2.0 なら1オクターブ上）
+    """
+    _, size, channels = get_mixer_format()
+    typecode = SAMPLE_TYPECODES[size]
+    is_float = abs(size) == 32
+    raw = sound.get_raw()
+
+    frames = len(raw) // (abs(size) // 8) // channels
+    count = max(0, math.ceil((frames - 1) / ratio))  # 最後のサンプルを超えない数
+
+    if _use_numpy:
+        source = np.frombuffer(raw, dtype=np.dtype(typecode)).reshape(-1, channels)
+        positions = np.arange(count) * ratio
+        index = positions.astype(np.int64)
+        fraction = (positions - index)[:, None]
+        left = source[index].astype(np.float64)
+        right = source[index + 1].astype(np.float64)
+        values = left + (right - left) * fraction
+        samples = (values if is_float else np.rint(values)).astype(np.dtype(typecode)).ravel()
+    else:
+        source = array.array(typecode, raw)
+        samples = array.array(typecode)
+        for n in range(count):
+            position = n * ratio
+            index = int(position)
+            fraction = position - index
+            for c in range(channels):
+                left = source[index * channels + c]
+                right = source[(index + 1) * channels + c]
+                value = left + (right - left) * fraction
+                samples.append(value if is_float else round(value))
+
+    resampled = pygame.mixer.Sound(buffer=samples)
+    resampled.set_volume(sound.get_volume())
+    return resampled
+
+
+def to_sound(wave: Buffer, amplitude: float, volume: float = 1.0) -> pygame.mixer.Sound:
+    """
+    波形から pygame の Sound を作る（ミキサーの形式のまま読み込まれる）
+
+    Args:
+        wave: -1.0〜1.0 程度の波形
+        amplitude: 16bit 換算の振幅（最大 MAX_AMPLITUDE）
+        volume: Sound の音量（0.0〜1.0）
+    """
+    sound = pygame.mixer.Sound(buffer=to_samples(wave, amplitude))
+    sound.set_volume(volume)
+    return sound
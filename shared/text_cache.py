@@ -0,0 +1,98 @@
+"""
+テキスト描画キャッシュ - レンダリング済み文字列の再利用
+
+日本語フォントのアンチエイリアス描画（Font.render）は重い処理のため、
+毎フレーム同じ文字列を描画するラベル類は一度だけレンダリングして使い回す。
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+# キャッシュの上限（バイト数、ピクセルデータの合計）
+TEXT_CACHE_MAX_BYTES: int = 8 * 1024 * 1024
+
+# (Font, テキスト, 色, アンチエイリアス) -> Surface
+_text_cache: OrderedDict[
+    tuple[pygame.font.Font, str, tuple[int, ...], bool], pygame.Surface
+] = OrderedDict()
+_text_cache_bytes: int = 0
+
+# キャッシュの統計情報
+_text_cache_stats: dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    """Surface のピクセルデータのバイト数"""
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def render_text(
+    font: pygame.font.Font,
+    text: str,
+    color: tuple[int, ...],
+    antialias: bool = True,
+) -> pygame.Surface:
+    """
+    テキストをレンダリングする（キャッシュ付き）
+
+    同じ (フォント, テキスト, 色, アンチエイリアス) の組み合わせでは
+    前回レンダリングした Surface をそのまま返す。
+    返された Surface は共有されるため、描き込みなどの変更をしないこと。
+
+    Args:
+        font: 描画に使うフォント（get_font() で取得したもの）
+        text: 描画する文字列
+        color: 文字色
+        antialias: アンチエイリアスを有効にするか
+
+    Returns:
+        レンダリング済みの Surface
+    """
+    global _text_cache_bytes
+
+    key = (font, text, tuple(color), antialias)
+
+    surface = _text_cache.get(key)
+    if surface is not None:
+        _text_cache.move_to_end(key)
+        _text_cache_stats["hits"] += 1
+        return surface
+
+    _text_cache_stats["misses"] += 1
+    surface = font.render(text, antialias, color)
+    size = _surface_bytes(surface)
+
+    # 上限を超える巨大なテキストはキャッシュしない
+    if size > TEXT_CACHE_MAX_BYTES:
+        return surface
+
+    _text_cache[key] = surface
+    _text_cache_bytes += size
+
+    while _text_cache_bytes > TEXT_CACHE_MAX_BYTES:
+        _, evicted = _text_cache.popitem(last=False)
+        _text_cache_bytes -= _surface_bytes(evicted)
+        _text_cache_stats["evictions"] += 1
+
+    return surface
+
+
+def get_text_cache_stats() -> dict[str, int]:
+    """
+    テキストキャッシュの統計情報を取得する
+
+    Returns:
+        hits / misses / evictions / size / bytes を含む辞書
+    """
+    return {**_text_cache_stats, "size": len(_text_cache), "bytes": _text_cache_bytes}
+
+
+def clear_text_cache() -> None:
+    """テキストキャッシュと統計情報をクリアする"""
+    global _text_cache_bytes
+
+    _text_cache.clear()
+    _text_cache_bytes = 0
+    for key in _text_cache_stats:
+        _text_cache_stats[key] = 0
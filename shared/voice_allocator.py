@@ -0,0 +1,132 @@
+"""
+ボイス管理 - 楽器の音に専用のチャンネルを割り当てる
+
+Sound.play() は空いているチャンネルを自動で探すため、鍵盤を連打して
+チャンネルが足りなくなると、音が鳴らなかったり予測できない音が止まったりする。
+VoiceAllocator は専用に予約したチャンネルの中で音を管理する:
+    - 同じキー（鍵盤）をもう一度鳴らしたときは、そのキーのチャンネルで鳴らし直す
+    - 空きがなければ最も古い音を短くフェードアウトさせて、その間に新しい音を鳴らす
+    - フェードアウト用のチャンネルを余分に確保し、新しい音はすぐに鳴らす
+"""
+
+from collections import OrderedDict, deque
+from typing import Hashable
+
+import pygame
+
+from shared import audio
+
+# 既定のチャンネル数（同時に鳴らせる音の数 + フェードアウト用のチャンネル数）
+DEFAULT_VOICE_CHANNELS: int = 8
+
+# フェードアウト用に空けておくチャンネル数
+VOICE_RELEASE_CHANNELS: int = 2
+
+# 古い音を止めるときのフェードアウト時間（ミリ秒。短すぎるとプツッと鳴る）
+VOICE_STEAL_FADE_MS: int = 25
+
+
+class VoiceAllocator:
+    """予約したチャンネルの中で音を割り当てる"""
+
+    def __init__(
+        self,
+        num_channels: int = DEFAULT_VOICE_CHANNELS,
+        fade_ms: int = VOICE_STEAL_FADE_MS,
+        release_channels: int = VOICE_RELEASE_CHANNELS,
+    ) -> None:
+        """
+        Args:
+            num_channels: 使うチャンネル数（release_channels より多くする）
+            fade_ms: 古い音を止めるときのフェードアウト時間（ミリ秒）
+            release_channels: そのうちフェードアウト用に空けておくチャンネル数
+
+        使うチャンネルは audio.reserve_channels() で予約し、
+        他の Sound.play() に使われないようにする。
+        """
+        if num_channels <= release_channels:
+            raise ValueError("num_channels は release_channels より多くしてください")
+
+        self.fade_ms = fade_ms
+        self.max_voices = num_channels - release_channels
+
+        self._indices = audio.reserve_channels(num_channels)
+        self.channels = [pygame.mixer.Channel(i) for i in self._indices]
+        for channel in self.channels:
+            channel.stop()  # 予約する前に鳴っていた音（前のゲームの音など）は管理できないので止める
+        self._active: OrderedDict[Hashable, pygame.mixer.Channel] = OrderedDict()  # 古い順
+        self._releasing: deque[pygame.mixer.Channel] = deque()  # フェードアウト中（古い順）
+        self.stats = {"played": 0, "retriggered": 0, "stolen": 0, "dropped": 0}
+
+    def _reap(self) -> None:
+        """鳴り終わった音を管理から外す"""
+        for key, channel in list(self._active.items()):
+            if not channel.get_busy():
+                del self._active[key]
+        self._releasing = deque(c for c in self._releasing if c.get_busy())
+
+    def _find_free_channel(self) -> pygame.mixer.Channel | None:
+        """鳴っていないチャンネルを探す"""
+        for channel in self.channels:
+            if not channel.get_busy():
+                return channel
+        return None
+
+    def play(self, key: Hashable, sound: pygame.mixer.Sound) -> pygame.mixer.Channel:
+        """
+        キーに対応する音を鳴らす
+
+        Args:
+            key: 音を区別するキー（鍵盤の番号など）
+            sound: 鳴らす音
+
+        Returns:
+            音を鳴らしたチャンネル
+        """
+        self._reap()
+
+        # 同じキーが鳴っていれば、そのチャンネルで最初から鳴らし直す
+        channel = self._active.pop(key, None)
+        if channel is not None:
+            self.stats["played"] += 1
+            self.stats["retriggered"] += 1
+            channel.play(sound)
+            self._active[key] = channel
+            return channel
+
+        # 同時に鳴らせる数を超えるなら、最も古い音をフェードアウトさせる
+        if len(self._active) >= self.max_voices:
+            _, oldest = self._active.popitem(last=False)
+            oldest.fadeout(self.fade_ms)
+            self._releasing.append(oldest)
+            self.stats["stolen"] += 1
+
+        channel = self._find_free_channel()
+        if channel is None:
+            # フェードアウト用のチャンネルも埋まっている（連打が速い）ので、最も古いものを止める。
+            # 管理していない音でチャンネルが埋まっている場合は、鳴っている最も古い音か最初のチャンネルを使う
+            if self._releasing:
+                channel = self._releasing.popleft()
+            elif self._active:
+                _, channel = self._active.popitem(last=False)
+            else:
+                channel = self.channels[0]
+            channel.stop()
+            self.stats["dropped"] += 1
+
+        channel.play(sound)
+        self._active[key] = channel
+        self.stats["played"] += 1
+        return channel
+
+    def stop_all(self) -> None:
+        """すべての音を止める"""
+        for channel in self.channels:
+            channel.stop()
+        self._active.clear()
+        self._releasing.clear()
+
+    def release(self) -> None:
+        """音を止めてチャンネルの予約を解除する"""
+        self.stop_all()
+        audio.release_channels(self._indices)